@@ -0,0 +1,4 @@
+from aoc_2023.cli import main
+
+if __name__ == "__main__":
+    raise SystemExit(main())
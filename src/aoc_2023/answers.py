@@ -0,0 +1,68 @@
+import json
+import sqlite3
+from contextlib import closing
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
+
+from aoc_2023.cache import default_cache_dir
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS answers (
+    day INTEGER NOT NULL,
+    part TEXT NOT NULL,
+    input_hash TEXT NOT NULL,
+    solver_hash TEXT NOT NULL,
+    answer TEXT NOT NULL,
+    created TEXT NOT NULL,
+    PRIMARY KEY (day, part, input_hash, solver_hash)
+)
+"""
+
+
+@dataclass
+class AnswerStore:
+    """
+    Answers from earlier runs, in SQLite, keyed by the day, the part, and hashes of the
+    input and of the day's module, and the modules it imports. Editing the day's code,
+    or a shared module like `grid.py`, changes the hash, so its old answers are never
+    returned again.
+
+    Answers are stored as JSON, so ints come back as ints, and big ones don't overflow
+    SQLite's 64 bit integers.
+    """
+
+    path: Path = field(default_factory=lambda: default_cache_dir() / "answers.sqlite")
+
+    def _connect(self) -> sqlite3.Connection:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.path, timeout=30)
+        conn.execute(SCHEMA)
+        return conn
+
+    def get(self, day: int, input_hash: str, solver_hash: str) -> dict[str, int | str]:
+        "Every part's stored answer for this input and code, if there are any"
+        with closing(self._connect()) as conn:
+            rows = conn.execute(
+                "SELECT part, answer FROM answers"
+                " WHERE day = ? AND input_hash = ? AND solver_hash = ?",
+                (day, input_hash, solver_hash),
+            ).fetchall()
+        return {part: json.loads(answer) for part, answer in sorted(rows)}
+
+    def put(
+        self,
+        day: int,
+        input_hash: str,
+        solver_hash: str,
+        answers: dict[str, int | str],
+    ) -> None:
+        created = datetime.now(UTC).isoformat(timespec="seconds")
+        with closing(self._connect()) as conn, conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO answers VALUES (?, ?, ?, ?, ?, ?)",
+                [
+                    (day, part, input_hash, solver_hash, json.dumps(answer), created)
+                    for part, answer in answers.items()
+                ],
+            )
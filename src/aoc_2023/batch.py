@@ -0,0 +1,137 @@
+"""
+Solve days on many input files at once, e.g. everyone's inputs for the calendar, and
+write each file's answers and timings to a table.
+"""
+
+import csv
+import glob
+import itertools
+import multiprocessing
+import os
+import statistics
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from aoc_2023.cache import ParseCache
+from aoc_2023.loader import MappedInput
+from aoc_2023.registry import PARTS, discover_days, load
+from aoc_2023.runner import run_stages
+from aoc_2023.utils import format_ns
+
+STAGES = ("parse", *PARTS)
+COLUMNS = ("day", "input", *PARTS, *(f"{stage}_ns" for stage in STAGES), "error")
+
+
+def find_inputs(pattern: str, day: int) -> list[Path]:
+    """
+    `pattern` is a directory of input files, or a glob, either of which can have the
+    day in it, e.g. "inputs/day{day:02}" or "inputs/{day}/*.txt"
+    """
+    spec = pattern.format(day=day)
+    if Path(spec).is_dir():
+        return sorted(Path(spec).glob("*.txt"))
+    return sorted(Path(p) for p in glob.glob(spec))
+
+
+def solve_file(day: int, path: Path, cache: ParseCache | None = None) -> dict:
+    """
+    One row of the table. The day is only imported the first time a worker solves it,
+    so its imports, compiled regexes, etc. are shared by every input it's given. With a
+    `cache`, inputs parsed by an earlier batch aren't parsed again. The input is
+    memory mapped, so a day that reads bytes never has a copy of it in memory.
+    """
+    row: dict = dict.fromkeys(COLUMNS) | {"day": day, "input": str(path), "error": ""}
+    try:
+        with MappedInput(path) as mapped:
+            result = run_stages(day, load(day), mapped.data, cache=cache)
+    except Exception as e:
+        # One bad input shouldn't lose everyone else's answers
+        row["error"] = f"{type(e).__name__}: {e}"
+        return row
+
+    for part, answer in result.answers.items():
+        # Kept as text, since some answers aren't numbers
+        row[part] = str(answer)
+    for stage in STAGES:
+        row[f"{stage}_ns"] = result.timings.get(stage)
+    return row
+
+
+def solve_batch(
+    tasks: list[tuple[int, Path]],
+    jobs: int | None = None,
+    cache: ParseCache | None = None,
+) -> list[dict]:
+    """
+    Solve every (day, path) across a process pool. The tasks are handed out in chunks
+    of the same day, so that each worker imports as few days as it can.
+    """
+    if not tasks:
+        return []
+    tasks = sorted(tasks)
+    jobs = min(jobs or os.cpu_count() or 1, len(tasks))
+    chunksize = max(1, len(tasks) // (jobs * 4))
+    days, paths = zip(*tasks, strict=True)
+
+    # Spawned for the same reason as `runner.run_all()`
+    ctx = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=jobs, mp_context=ctx) as pool:
+        caches = itertools.repeat(cache)
+        return list(pool.map(solve_file, days, paths, caches, chunksize=chunksize))
+
+
+def write_table(rows: list[dict], path: Path) -> None:
+    "As parquet if `path` ends with .parquet, otherwise as CSV"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if path.suffix == ".parquet":
+        import polars as pl
+
+        table = {col: [row.get(col) for row in rows] for col in COLUMNS}
+        pl.DataFrame(table).write_parquet(path)
+        return
+
+    with path.open("w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=COLUMNS)
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def format_summary(rows: list[dict]) -> str:
+    lines = [f"{'Day':<5}{'Inputs':>8}{'Failed':>8}{'Median':>10}{'Slowest':>10}"]
+    for day in sorted({row["day"] for row in rows}):
+        day_rows = [row for row in rows if row["day"] == day]
+        totals = [
+            sum(row[f"{stage}_ns"] or 0 for stage in STAGES)
+            for row in day_rows
+            if not row["error"]
+        ]
+        failed = len(day_rows) - len(totals)
+        median = format_ns(statistics.median(totals)) if totals else "-"
+        slowest = format_ns(max(totals)) if totals else "-"
+        lines.append(f"{day:<5}{len(day_rows):>8}{failed:>8}{median:>10}{slowest:>10}")
+    return "\n".join(lines)
+
+
+def main(
+    pattern: str,
+    days: list[int],
+    jobs: int | None = None,
+    output: Path | None = None,
+    cache: ParseCache | None = None,
+) -> int:
+    days = sorted(set(days)) or discover_days()
+    if len(days) > 1 and "{day" not in pattern:
+        print("With more than one day, the inputs need a {day} in them")
+        return 2
+
+    tasks = [(day, path) for day in days for path in find_inputs(pattern, day)]
+    if not tasks:
+        print(f"No input files match {pattern}")
+        return 1
+
+    rows = solve_batch(tasks, jobs, cache)
+    print(format_summary(rows))
+    if output is not None:
+        write_table(rows, output)
+        print(f"\nWrote {len(rows)} rows to {output}")
+    return 1 if any(row["error"] for row in rows) else 0
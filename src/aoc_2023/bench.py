@@ -0,0 +1,283 @@
+import json
+import multiprocessing
+import platform
+import statistics
+import sys
+from concurrent.futures import Executor, ProcessPoolExecutor
+from contextlib import nullcontext
+from dataclasses import asdict, dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
+
+from aoc_2023 import shm
+from aoc_2023.cache import ParseCache
+from aoc_2023.registry import PARTS, discover_days, get_day, input_path, load
+from aoc_2023.runner import as_answer, run_stages
+from aoc_2023.utils import format_bytes, format_ns, record_spans, span
+
+
+@dataclass(frozen=True)
+class Stats:
+    "Summary of the timings, in nanoseconds, of repeated runs of a single stage"
+
+    runs: int
+    min: int
+    median: float
+    p95: float
+    mean: float
+    stddev: float
+
+    @staticmethod
+    def from_samples(samples: list[int]) -> "Stats":
+        if len(samples) == 1:
+            only = samples[0]
+            return Stats(runs=1, min=only, median=only, p95=only, mean=only, stddev=0.0)
+
+        return Stats(
+            runs=len(samples),
+            min=min(samples),
+            median=statistics.median(samples),
+            p95=statistics.quantiles(samples, n=20, method="inclusive")[18],
+            mean=statistics.fmean(samples),
+            stddev=statistics.stdev(samples),
+        )
+
+
+@dataclass
+class DayBenchmark:
+    day: int
+    answers: dict[str, int | str] = field(default_factory=dict)
+    stages: dict[str, Stats] = field(default_factory=dict)
+    peak_memory: dict[str, int] = field(default_factory=dict)
+    rss_delta: dict[str, int] = field(default_factory=dict)
+    counters: dict[str, int] = field(default_factory=dict)
+    input_bytes: int = 0
+
+
+def benchmark_day(
+    day: int,
+    repeats: int = 10,
+    warmup: int = 1,
+    path: Path | None = None,
+    measure_memory: bool = True,
+    count_work: bool = True,
+    cache: ParseCache | None = None,
+    pool: Executor | None = None,
+    jobs: int = 1,
+) -> DayBenchmark:
+    """
+    Run every stage of a day `warmup + repeats` times, and keep the timings of the last
+    `repeats` runs. Then, if `measure_memory` or `count_work`, one more run to find the
+    peak memory of each stage, or count its work, since either would throw the timings
+    off.
+
+    Each run starts again from the raw text, because some parts modify their parsed
+    input in place (day 4's cards, for example). Spans inside a stage are summarised
+    along with the stages, keyed like "part1/build_graph". With a `cache`, the warmup
+    runs fill it, so the timed runs measure loading the parsed input from disk.
+
+    With a `pool` of `jobs` processes, only the parse is timed here. The parts' runs are
+    split between the workers, which all use one parse of the input in shared memory.
+    Faster, but noisier, since the workers compete for the cores' caches.
+    """
+    module = load(day)
+    raw_input = (path or input_path(day)).read_text()
+
+    samples: dict[str, list[int]] = {}
+    result = None
+    parts = PARTS if pool is None else ()
+    for idx in range(warmup + repeats):
+        result = run_stages(day, module, raw_input, parts=parts, cache=cache)
+        if idx < warmup:
+            continue
+        for stage, ns in (result.timings | result.spans).items():
+            samples.setdefault(stage, []).append(ns)
+
+    assert result is not None, "Need at least one run"
+    # A day with nothing to run yet has nothing to share
+    if pool is not None and "parse" in get_day(day).stages:
+        parse = cache.parser(module, "parse_input") if cache else module.parse_input
+        with shm.share((raw_input, parse(raw_input))) as ref:
+            for part in PARTS:
+                if hasattr(module, f"solve_{part}"):
+                    answer, part_samples = _time_part_on(
+                        pool, jobs, day, part, ref, warmup, repeats
+                    )
+                    result.answers[part] = answer
+                    samples.update(part_samples)
+
+    bench = DayBenchmark(
+        day=day,
+        answers=result.answers,
+        stages={stage: Stats.from_samples(s) for stage, s in samples.items()},
+        rss_delta=result.rss_delta,
+        input_bytes=result.input_bytes,
+    )
+    if measure_memory or count_work:
+        measured = run_stages(
+            day,
+            module,
+            raw_input,
+            measure_memory=measure_memory,
+            count_work=count_work,
+        )
+        bench.peak_memory = measured.peak_memory
+        bench.counters = measured.counters
+    return bench
+
+
+def _time_part(
+    day: int, part: str, ref: shm.SharedRef, warmup: int, runs: int
+) -> tuple[int | str, dict[str, list[int]]]:
+    """
+    Run in a worker. Time `runs` runs of one part, each on a fresh load of the shared
+    `(raw_input, parsed)`, and return its answer and the samples of it and its spans.
+    """
+    module = load(day)
+    solver = getattr(module, f"solve_{part}")
+    reparse = part == "part2" and hasattr(module, "parse_input_part2")
+
+    samples: dict[str, list[int]] = {}
+    answer = None
+    for idx in range(warmup + runs):
+        raw_input, parsed = shm.load(ref)
+        with record_spans() as spans, span(part):
+            if reparse:
+                answer = solver(module.parse_input_part2(raw_input))
+            else:
+                answer = solver(parsed)
+        del parsed
+        if idx < warmup:
+            continue
+        for stage, ns in spans.timings.items():
+            samples.setdefault(stage, []).append(ns)
+
+    shm.detach(ref)
+    return as_answer(answer), samples
+
+
+def _time_part_on(
+    pool: Executor,
+    jobs: int,
+    day: int,
+    part: str,
+    ref: shm.SharedRef,
+    warmup: int,
+    repeats: int,
+) -> tuple[int | str, dict[str, list[int]]]:
+    "Split a part's `repeats` runs between `jobs` workers, each doing its own warmup"
+    share, extra = divmod(repeats, jobs)
+    runs = [share + (i < extra) for i in range(min(jobs, repeats))]
+    futures = [pool.submit(_time_part, day, part, ref, warmup, n) for n in runs]
+
+    samples: dict[str, list[int]] = {}
+    answer: int | str = ""
+    for future in futures:
+        answer, worker_samples = future.result()
+        for stage, ns in worker_samples.items():
+            samples.setdefault(stage, []).extend(ns)
+    return answer, samples
+
+
+def stage_key(day: int, stage: str) -> str:
+    return f"day{day:02}.{stage}"
+
+
+def to_json(benchmarks: list[DayBenchmark], repeats: int, warmup: int) -> dict:
+    """
+    Flatten into `{"stages": {"day05.part2": {...stats}}, ...}`, so results from
+    different runs can be lined up by key.
+    """
+    return {
+        "meta": {
+            "created": datetime.now(UTC).isoformat(timespec="seconds"),
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "repeats": repeats,
+            "warmup": warmup,
+        },
+        "answers": {
+            stage_key(b.day, part): answer
+            for b in benchmarks
+            for part, answer in b.answers.items()
+        },
+        "stages": {
+            stage_key(b.day, stage): asdict(stats)
+            for b in benchmarks
+            for stage, stats in b.stages.items()
+        },
+        "memory": {
+            stage_key(b.day, stage): peak
+            for b in benchmarks
+            for stage, peak in b.peak_memory.items()
+        },
+        "rss": {
+            stage_key(b.day, stage): delta
+            for b in benchmarks
+            for stage, delta in b.rss_delta.items()
+        },
+        # Counts of work done, which unlike the timings only change with the code
+        "counters": {
+            stage_key(b.day, name): n
+            for b in benchmarks
+            for name, n in b.counters.items()
+        },
+        "input_bytes": {f"day{b.day:02}": b.input_bytes for b in benchmarks},
+    }
+
+
+def format_table(benchmarks: list[DayBenchmark]) -> str:
+    # As wide as the longest stage's name, plus a gap before the numbers
+    keys = [stage_key(b.day, stage) for b in benchmarks for stage in b.stages]
+    width = 2 + max(map(len, ["Stage", *keys]))
+    header = (
+        f"{'Stage':<{width}}{'Min':>12}{'Median':>12}{'p95':>12}{'Std dev':>12}"
+        f"{'Peak mem':>12}{'RSS delta':>12}{'Runs':>6}"
+    )
+    lines = [header]
+    for b in benchmarks:
+        for stage, s in b.stages.items():
+            peak = b.peak_memory.get(stage)
+            rss = b.rss_delta.get(stage)
+            lines.append(
+                f"{stage_key(b.day, stage):<{width}}"
+                f"{format_ns(s.min, 2):>12}"
+                f"{format_ns(s.median, 2):>12}"
+                f"{format_ns(s.p95, 2):>12}"
+                f"{format_ns(s.stddev, 2):>12}"
+                f"{format_bytes(peak) if peak is not None else '-':>12}"
+                f"{format_bytes(rss) if rss is not None else '-':>12}"
+                f"{s.runs:>6}"
+            )
+    return "\n".join(lines)
+
+
+def main(
+    days: list[int],
+    repeats: int = 10,
+    warmup: int = 1,
+    output: Path | None = None,
+    cache: ParseCache | None = None,
+    jobs: int = 1,
+) -> int:
+    days = sorted(set(days)) or discover_days()
+    # Spawned for the same reason as `runner.run_all()`
+    ctx = multiprocessing.get_context("spawn")
+    pool_cm = (
+        ProcessPoolExecutor(max_workers=jobs, mp_context=ctx)
+        if jobs > 1
+        else nullcontext()
+    )
+    with pool_cm as pool:
+        benchmarks = [
+            benchmark_day(
+                day, repeats=repeats, warmup=warmup, cache=cache, pool=pool, jobs=jobs
+            )
+            for day in days
+        ]
+
+    print(format_table(benchmarks))
+    if output is not None:
+        output.write_text(json.dumps(to_json(benchmarks, repeats, warmup), indent=2))
+        print(f"\nWrote {output}")
+    return 0
@@ -0,0 +1,308 @@
+import ast
+import functools
+import graphlib
+import hashlib
+import importlib
+import os
+import pickle
+import sys
+import time
+from collections.abc import Buffer, Callable
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import ModuleType
+
+
+def default_cache_dir() -> Path:
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "aoc_2023"
+
+
+def file_hash(path: Path) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+@functools.lru_cache(maxsize=256)
+def _imports(path: Path, mtime_ns: int) -> frozenset[Path]:
+    """
+    The files of the `aoc_2023` modules `path` imports, anywhere in it, including
+    imports inside functions, but not in its `if __name__ == "__main__":` block, which
+    only runs it. Cached till the file changes.
+    """
+    # The package the file is in, which `aoc_2023.x.y` is found relative to
+    package_dir = next(p for p in path.parents if p.name == "aoc_2023")
+    body = [
+        stmt
+        for stmt in ast.parse(path.read_bytes()).body
+        if not (isinstance(stmt, ast.If) and "__main__" in ast.unparse(stmt.test))
+    ]
+    names: set[str] = set()
+    for node in (n for stmt in body for n in ast.walk(stmt)):
+        match node:
+            case ast.Import():
+                names.update(alias.name for alias in node.names)
+            case ast.ImportFrom(module=str(module), level=0):
+                names.add(module)
+                # `from aoc_2023 import grid` imports a module too
+                names.update(f"{module}.{alias.name}" for alias in node.names)
+
+    paths = set()
+    for name in names:
+        package, *parts = name.split(".")
+        if package != "aoc_2023":
+            continue
+        base = package_dir.joinpath(*parts)
+        for candidate in (base.with_suffix(".py"), base / "__init__.py"):
+            if parts and candidate.is_file():
+                paths.add(candidate)
+    return frozenset(paths)
+
+
+def direct_imports(path: Path) -> frozenset[Path]:
+    "The files of the `aoc_2023` modules `path` itself imports"
+    return _imports(path, path.stat().st_mtime_ns)
+
+
+def imported_files(path: Path) -> set[Path]:
+    "The files of every `aoc_2023` module `path` imports, however indirectly"
+    todo, seen = [path], set()
+    while todo:
+        current = todo.pop()
+        for imported in direct_imports(current):
+            if imported not in seen:
+                seen.add(imported)
+                todo.append(imported)
+    return seen
+
+
+def _files_hash(paths: set[Path]) -> str:
+    h = hashlib.sha256()
+    for p in sorted(paths):
+        h.update(p.name.encode())
+        h.update(b"\0")
+        h.update(p.read_bytes())
+    return h.hexdigest()
+
+
+def tree_hash(path: Path) -> str:
+    """
+    A hash of `path`, and every `aoc_2023` module it imports, however indirectly, so
+    that editing a shared module like `grid.py` changes the hash of every day using it
+    """
+    return _files_hash(imported_files(path) | {path})
+
+
+def imports_hash(path: Path) -> str:
+    "Like `tree_hash()`, but of the modules `path` imports alone, not `path` itself"
+    return _files_hash(imported_files(path) - {path})
+
+
+def _module_name(path: Path) -> str:
+    "`aoc_2023/grid.py` is `aoc_2023.grid`"
+    package_dir = next(p for p in path.parents if p.name == "aoc_2023")
+    parts = path.relative_to(package_dir.parent).with_suffix("").parts
+    return ".".join(parts[:-1] if parts[-1] == "__init__" else parts)
+
+
+def reload_imports(path: Path, edited: set[Path]) -> None:
+    """
+    Reload the `edited` modules `path` imports, and the ones importing those, each
+    after the modules it imports, so that `from aoc_2023.grid import Grid` gets the
+    new `Grid`. Then `path`'s own module can be reloaded to use them.
+    """
+    graph = {p: direct_imports(p) for p in imported_files(path) - {path}}
+    stale: set[Path] = set()
+    for p in graphlib.TopologicalSorter(graph).static_order():
+        if p in edited or stale & graph.get(p, set()):
+            stale.add(p)
+            module = sys.modules.get(_module_name(p))
+            if module is not None:
+                importlib.reload(module)
+
+
+def source_hash(module: ModuleType) -> str:
+    """
+    Changes whenever anything in the module's file does, parsers included, or in any
+    `aoc_2023` module it imports
+    """
+    return tree_hash(Path(module.__file__ or ""))
+
+
+# The suffix of each format an entry can be stored in
+KINDS = (".npy", ".arrow", ".parquet", ".pkl")
+
+
+def _kind(obj) -> str:
+    "Which file format to store `obj` as, without importing numpy or polars to check"
+    match type(obj).__module__, type(obj).__name__:
+        case "numpy", "ndarray" if obj.dtype != object:
+            return ".npy"
+        case module, "DataFrame" if module.startswith("polars"):
+            return ".arrow"
+        case module, "LazyFrame" if module.startswith("polars"):
+            return ".parquet"
+    return ".pkl"
+
+
+def _save(obj, path: Path, kind: str) -> None:
+    match kind:
+        case ".npy":
+            import numpy as np
+
+            with path.open("wb") as f:
+                np.save(f, obj, allow_pickle=False)
+        case ".arrow":
+            obj.write_ipc(path)
+        case ".parquet":
+            obj.sink_parquet(path)
+        case _:
+            with path.open("wb") as f:
+                pickle.dump(obj, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def _load(path: Path):
+    match path.suffix:
+        case ".npy":
+            import numpy as np
+
+            return np.load(path, allow_pickle=False)
+        case ".arrow":
+            import polars as pl
+
+            return pl.read_ipc(path, memory_map=False)
+        case ".parquet":
+            import polars as pl
+
+            # Nothing's read till it's collected, but check the file's footer now
+            scan = pl.scan_parquet(path)
+            try:
+                scan.collect_schema()
+            except pl.exceptions.ComputeError as e:
+                raise ValueError(f"Unreadable parquet file {path}") from e
+            return scan
+        case _:
+            with path.open("rb") as f:
+                return pickle.load(f)
+
+
+@dataclass
+class ParseCache:
+    """
+    Parsed inputs on disk, keyed by a hash of the raw input, the parser's name, and the
+    source of the module it's in and the modules that imports (see `tree_hash()`), so
+    editing a day, or a shared module it uses, never serves a stale parse.
+
+    Entries are only ever added. Whenever the cache grows past `max_bytes`, the least
+    recently used entries are deleted until it fits again, which also gets rid of
+    entries nothing can hit any more. Entries used in the last `min_age` seconds are
+    never deleted, even if that leaves the cache over `max_bytes` for a while.
+
+    A parser that returns a polars `LazyFrame` has it written as parquet, and gets back
+    a `pl.scan_parquet()` of the file, so a solver's filters and column selections are
+    pushed down into reading it. Such a scan only reads the file when it's collected,
+    which `min_age` gives it time to be, even with other processes, e.g. `batch`'s
+    workers, adding to the same cache meanwhile.
+    """
+
+    directory: Path = field(default_factory=lambda: default_cache_dir() / "parsed")
+    max_bytes: int = 256 * 1024**2
+    min_age: float = 600.0
+    hits: int = 0
+    misses: int = 0
+
+    def key(self, module: ModuleType, parser: str, raw_input: str | Buffer) -> str:
+        h = hashlib.sha256()
+        for part in (source_hash(module), parser, raw_input):
+            # The input may be bytes already, e.g. a `loader.MappedInput`'s
+            h.update(part.encode() if isinstance(part, str) else part)
+            h.update(b"\0")
+        day = module.__name__.rpartition(".")[2]
+        return f"{day}.{parser}.{h.hexdigest()[:24]}"
+
+    def parse(self, module: ModuleType, parser: str, raw_input: str | Buffer):
+        "Call `module.<parser>(raw_input)`, or load what it returned last time"
+        key = self.key(module, parser, raw_input)
+        # Not a glob, which would find another process's half written ".tmp" too
+        for kind in KINDS:
+            path = self.directory / f"{key}{kind}"
+            try:
+                parsed = _load(path)
+            except FileNotFoundError:
+                continue
+            except (
+                OSError,
+                ValueError,
+                EOFError,
+                AttributeError,
+                ImportError,
+                pickle.UnpicklingError,
+            ):
+                # Half deleted, or written by an incompatible version of a library
+                path.unlink(missing_ok=True)
+                continue
+            path.touch()
+            self.hits += 1
+            return parsed
+
+        self.misses += 1
+        parsed = getattr(module, parser)(raw_input)
+        path = self.store(key, parsed)
+        if path is not None and path.suffix == ".parquet":
+            # Scanned, like a hit, rather than running the parser's query again
+            return _load(path)
+        return parsed
+
+    def parser(self, module: ModuleType, name: str) -> Callable:
+        "`module.<name>`, but going through the cache"
+        return lambda raw_input: self.parse(module, name, raw_input)
+
+    def store(self, key: str, parsed) -> Path | None:
+        """
+        Write to a temporary file first and rename it into place, so that another
+        process never reads a half written entry. Anything that can't be pickled just
+        isn't cached, and gives None.
+        """
+        self.directory.mkdir(parents=True, exist_ok=True)
+        kind = _kind(parsed)
+        path = self.directory / f"{key}{kind}"
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        try:
+            _save(parsed, tmp, kind)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            tmp.unlink(missing_ok=True)
+            return None
+        tmp.replace(path)
+        self.evict()
+        return path
+
+    def _stats(self) -> list[tuple[Path, os.stat_result]]:
+        "Oldest first, skipping any another process deletes while they're listed"
+        stats = []
+        for path in self.directory.glob("*"):
+            if path.suffix == ".tmp":
+                continue
+            try:
+                stats.append((path, path.stat()))
+            except FileNotFoundError:
+                continue
+        return sorted(stats, key=lambda entry: entry[1].st_mtime)
+
+    def entries(self) -> list[Path]:
+        "Oldest first, by when they were last used"
+        return [path for path, _ in self._stats()]
+
+    def evict(self) -> None:
+        "Never evicts the newest entry, even if it's over `max_bytes` on its own"
+        stats = self._stats()
+        total = sum(stat.st_size for _, stat in stats)
+        recent = time.time() - self.min_age
+        for path, stat in stats[:-1]:
+            # Oldest first, so every entry after this one is in use too
+            if total <= self.max_bytes or stat.st_mtime > recent:
+                break
+            total -= stat.st_size
+            path.unlink(missing_ok=True)
+
+    def clear(self) -> None:
+        for path in self.entries():
+            path.unlink(missing_ok=True)
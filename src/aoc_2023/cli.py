@@ -0,0 +1,416 @@
+import argparse
+import re
+from pathlib import Path
+
+from aoc_2023 import (
+    answers,
+    batch,
+    bench,
+    cache,
+    compare,
+    daemon,
+    differential,
+    generators,
+    importtime,
+    profiling,
+    registry,
+    report,
+    runner,
+    watch,
+)
+
+
+def day_number(s: str) -> int:
+    day = int(s)
+    if day not in registry.discover_days():
+        raise argparse.ArgumentTypeError(f"No solution for day {s}")
+    return day
+
+
+def generated_day(s: str) -> int:
+    day = int(s)
+    if day not in generators.discover_generators():
+        raise argparse.ArgumentTypeError(f"No input generator for day {s}")
+    return day
+
+
+STAGE_KEY = re.compile(r"day\d\d\.(parse|part1|part2)")
+
+
+def positive_int(s: str) -> int:
+    n = int(s)
+    if n < 1:
+        raise argparse.ArgumentTypeError(f"Must be at least 1, got {s}")
+    return n
+
+
+def stage_budget(s: str) -> tuple[str, float]:
+    "Like 'day05.part2=30'"
+    key, sep, seconds = s.partition("=")
+    if not sep or not STAGE_KEY.fullmatch(key):
+        raise argparse.ArgumentTypeError(f"Expected e.g. day05.part2=30, got {s}")
+    return key, float(seconds)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m aoc_2023", description="Advent of Code 2023"
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="Solve days, and print a table of timings")
+    run.add_argument(
+        "days", nargs="*", type=day_number, help="Days to run. Defaults to all"
+    )
+    run.add_argument(
+        "-j", "--jobs", type=int, help="Worker processes. Defaults to the CPU count"
+    )
+    run.add_argument(
+        "-m",
+        "--memory",
+        action="store_true",
+        help="Also run each day with tracemalloc, and print each stage's memory",
+    )
+    run.add_argument(
+        "--counters",
+        action="store_true",
+        help="Also run each day counting its work, and print the counts per input byte",
+    )
+    run.add_argument(
+        "-t",
+        "--timeout",
+        type=float,
+        help="Run each day in its own process, killed if a stage takes this many seconds",
+    )
+    run.add_argument(
+        "--budget",
+        type=stage_budget,
+        action="append",
+        default=[],
+        help="A different timeout for one stage, e.g. day05.part2=30. Can be repeated",
+    )
+    run.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Run every day, even if its answers are stored from an earlier run",
+    )
+    run.add_argument(
+        "--parse-cache",
+        action="store_true",
+        help="Reuse parsed inputs saved on disk by earlier runs",
+    )
+    run.add_argument(
+        "--profile",
+        choices=("parse", "part1", "part2"),
+        help="Profile this stage of each day, rather than timing every stage",
+    )
+    run.add_argument(
+        "--profile-dir",
+        type=Path,
+        default=Path("profiles"),
+        help="Where to write the profiles. Defaults to ./profiles",
+    )
+
+    bench_cmd = commands.add_parser(
+        "bench", help="Time repeated runs of each stage, and summarise them"
+    )
+    bench_cmd.add_argument(
+        "days", nargs="*", type=day_number, help="Days to run. Defaults to all"
+    )
+    bench_cmd.add_argument(
+        "-n", "--repeat", type=positive_int, default=10, help="Timed runs of each day"
+    )
+    bench_cmd.add_argument(
+        "-w", "--warmup", type=int, default=1, help="Untimed runs before timing"
+    )
+    bench_cmd.add_argument(
+        "-o", "--output", type=Path, help="Also write the results to this JSON file"
+    )
+    bench_cmd.add_argument(
+        "--parse-cache",
+        action="store_true",
+        help="Time loading the parsed inputs from disk, rather than parsing",
+    )
+    bench_cmd.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="Split the parts' runs between this many processes, sharing each parse",
+    )
+
+    compare_cmd = commands.add_parser(
+        "compare",
+        help="Re-run the benchmarks, and fail if anything is worse than a baseline",
+    )
+    compare_cmd.add_argument(
+        "baseline", type=Path, help="JSON file written by `bench --output`"
+    )
+    compare_cmd.add_argument(
+        "days",
+        nargs="*",
+        type=day_number,
+        help="Days to run. Defaults to the baseline's",
+    )
+    compare_cmd.add_argument(
+        "-t",
+        "--threshold",
+        type=float,
+        default=0.2,
+        help="Fraction slower a stage can get before it counts as a regression",
+    )
+    compare_cmd.add_argument(
+        "--memory-threshold",
+        type=float,
+        default=0.2,
+        help="Fraction more peak memory a stage can use before it counts",
+    )
+    compare_cmd.add_argument(
+        "-n", "--repeat", type=positive_int, default=10, help="Timed runs of each day"
+    )
+    compare_cmd.add_argument(
+        "-w", "--warmup", type=int, default=1, help="Untimed runs before timing"
+    )
+    compare_cmd.add_argument(
+        "-o", "--output", type=Path, help="Also write the new results to this file"
+    )
+
+    generate_cmd = commands.add_parser(
+        "generate", help="Write a synthetic input of a given size for a day"
+    )
+    generate_cmd.add_argument("day", type=generated_day, help="Day to generate for")
+    generate_cmd.add_argument(
+        "size", type=int, help="Size of the input. See the day's `generate.py`"
+    )
+    generate_cmd.add_argument(
+        "-s", "--seed", type=int, default=0, help="Seed for the random choices"
+    )
+    generate_cmd.add_argument(
+        "-o", "--output", type=Path, help="Write to this file rather than stdout"
+    )
+
+    report_cmd = commands.add_parser(
+        "report",
+        help="Time each day on generated inputs of growing size, and fit how it scales",
+    )
+    report_cmd.add_argument(
+        "days",
+        nargs="*",
+        type=generated_day,
+        help="Days to run. Defaults to all that have a generator",
+    )
+    report_cmd.add_argument(
+        "-s", "--seed", type=int, default=0, help="Seed for the generated inputs"
+    )
+    report_cmd.add_argument(
+        "-n",
+        "--repeat",
+        type=positive_int,
+        default=3,
+        help="Runs at each size, keeps the best",
+    )
+    report_cmd.add_argument(
+        "-o", "--output", type=Path, help="Directory to write a log-log plot per day"
+    )
+
+    batch_cmd = commands.add_parser(
+        "batch",
+        help="Solve days on many input files across worker processes, e.g. everyone's",
+    )
+    batch_cmd.add_argument(
+        "inputs",
+        help="Directory of .txt inputs, or a glob. Can have the day in it, like "
+        "inputs/day{day:02}",
+    )
+    batch_cmd.add_argument(
+        "days", nargs="*", type=day_number, help="Days to run. Defaults to all"
+    )
+    batch_cmd.add_argument(
+        "-j", "--jobs", type=int, help="Worker processes. Defaults to the CPU count"
+    )
+    batch_cmd.add_argument(
+        "-o",
+        "--output",
+        type=Path,
+        help="Write each input's answers and timings here, as .csv or .parquet",
+    )
+    batch_cmd.add_argument(
+        "--parse-cache",
+        action="store_true",
+        help="Reuse parsed inputs saved on disk by earlier runs",
+    )
+
+    difftest_cmd = commands.add_parser(
+        "difftest",
+        help="Check faster solvers against their reference versions on generated inputs",
+    )
+    difftest_cmd.add_argument(
+        "days",
+        nargs="*",
+        type=day_number,
+        help="Days to check. Defaults to all with a reference solver",
+    )
+    difftest_cmd.add_argument(
+        "-n", "--trials", type=int, default=20, help="Inputs to try for each part"
+    )
+    difftest_cmd.add_argument(
+        "--seed", type=int, default=0, help="Seed of the first input generated"
+    )
+    difftest_cmd.add_argument(
+        "-o", "--output", type=Path, help="Write the input of any mismatch here"
+    )
+
+    watch_cmd = commands.add_parser(
+        "watch",
+        help="Re-run the stages of each day whose code or input changes, as you edit",
+    )
+    watch_cmd.add_argument(
+        "days", nargs="*", type=day_number, help="Days to watch. Defaults to all"
+    )
+    watch_cmd.add_argument(
+        "-i",
+        "--interval",
+        type=float,
+        default=0.5,
+        help="Seconds between checking the files for changes",
+    )
+
+    serve_cmd = commands.add_parser(
+        "serve",
+        help="Keep every day imported, and solve them for `solve` over a Unix socket",
+    )
+    serve_cmd.add_argument(
+        "--socket", type=Path, help="Socket to listen on. Defaults to a per-user one"
+    )
+
+    solve_cmd = commands.add_parser("solve", help="Have the `serve` daemon solve a day")
+    solve_cmd.add_argument("day", type=day_number, help="Day to solve")
+    solve_cmd.add_argument(
+        "-p",
+        "--part",
+        action="append",
+        choices=("part1", "part2"),
+        help="Part to solve. Can be given twice. Defaults to both",
+    )
+    solve_cmd.add_argument(
+        "-i", "--input", type=Path, help="Input file. Defaults to the day's input.txt"
+    )
+    solve_cmd.add_argument("--socket", type=Path, help="Socket the daemon listens on")
+
+    importtime_cmd = commands.add_parser(
+        "importtime",
+        help="Time importing each day in a fresh interpreter, and what makes it slow",
+    )
+    importtime_cmd.add_argument(
+        "days", nargs="*", type=day_number, help="Days to import. Defaults to all"
+    )
+    importtime_cmd.add_argument(
+        "-n",
+        "--repeat",
+        type=positive_int,
+        default=3,
+        help="Imports of each day, keeps the best",
+    )
+    importtime_cmd.add_argument(
+        "--budget",
+        type=float,
+        help="Milliseconds any one day can take to import, before failing",
+    )
+
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    match args.command:
+        case "run" if args.profile:
+            if not args.days:
+                parser.error("--profile needs the days to profile")
+            # Before profiling any, rather than failing part way through
+            missing = [
+                d for d in args.days if args.profile not in registry.get_day(d).stages
+            ]
+            if missing:
+                days = ", ".join(f"day{d:02}" for d in missing)
+                parser.error(f"No {args.profile} stage to profile in {days}")
+            return profiling.main(args.days, args.profile, args.profile_dir)
+        case "run":
+            if args.budget and args.timeout is None:
+                parser.error("--budget needs a --timeout for the other stages")
+            if args.timeout is not None:
+                # The workers run each day just once, and only time it
+                for flag, given in (
+                    ("--counters", args.counters),
+                    ("--memory", args.memory),
+                    ("--parse-cache", args.parse_cache),
+                ):
+                    if given:
+                        parser.error(f"{flag} can't be used with --timeout")
+            return runner.main(
+                args.days,
+                jobs=args.jobs,
+                measure_memory=args.memory,
+                cache=cache.ParseCache() if args.parse_cache else None,
+                # Measuring means actually running the days
+                answers=None
+                if args.no_cache or args.memory or args.counters
+                else answers.AnswerStore(),
+                timeout=args.timeout,
+                budgets=dict(args.budget),
+                count_work=args.counters,
+            )
+        case "bench":
+            return bench.main(
+                args.days,
+                repeats=args.repeat,
+                warmup=args.warmup,
+                output=args.output,
+                cache=cache.ParseCache() if args.parse_cache else None,
+                jobs=args.jobs,
+            )
+        case "compare":
+            return compare.main(
+                args.baseline,
+                args.days,
+                repeats=args.repeat,
+                warmup=args.warmup,
+                threshold=args.threshold,
+                memory_threshold=args.memory_threshold,
+                output=args.output,
+            )
+        case "generate":
+            return generators.main(
+                args.day, args.size, seed=args.seed, output=args.output
+            )
+        case "batch":
+            return batch.main(
+                args.inputs,
+                args.days,
+                jobs=args.jobs,
+                output=args.output,
+                cache=cache.ParseCache() if args.parse_cache else None,
+            )
+        case "difftest":
+            return differential.main(
+                args.days, trials=args.trials, seed=args.seed, output=args.output
+            )
+        case "watch":
+            return watch.main(args.days, interval=args.interval)
+        case "serve":
+            return daemon.serve(args.socket)
+        case "solve":
+            return daemon.solve(
+                args.day, args.part or [], path=args.input, socket_path=args.socket
+            )
+        case "importtime":
+            return importtime.main(
+                args.days, repeats=args.repeat, budget_ms=args.budget
+            )
+        case "report":
+            return report.main(
+                args.days, seed=args.seed, repeats=args.repeat, output=args.output
+            )
+
+    raise AssertionError(f"Unhandled command {args.command}")
@@ -0,0 +1,164 @@
+import json
+from dataclasses import dataclass
+from pathlib import Path
+
+from aoc_2023.bench import benchmark_day, to_json
+from aoc_2023.utils import format_bytes, format_ns
+
+
+@dataclass(frozen=True)
+class Change:
+    "`baseline` is None for something new, `current` for something that's gone missing"
+
+    key: str
+    metric: str
+    baseline: float | None
+    current: float | None
+    regressed: bool
+
+    @property
+    def ratio(self) -> float:
+        if self.baseline is None or self.current is None or not self.baseline:
+            return float("inf")
+        return self.current / self.baseline
+
+
+def compare(
+    baseline: dict,
+    current: dict,
+    threshold: float = 0.2,
+    memory_threshold: float = 0.2,
+    noise_floor_ns: int = 50_000,
+    memory_floor: int = 64 * 1024,
+) -> list[Change]:
+    """
+    Line up two sets of benchmark results (as written by `bench.to_json()`) by stage,
+    and flag anything that got worse by more than `threshold` (0.2 means 20% slower).
+
+    Timings are compared on the median. A stage only counts as regressed if it also got
+    worse by more than the floor, otherwise stages that take a few microseconds would
+    fail the comparison on noise alone. Changed answers always count as regressions.
+
+    So does a stage, peak, or answer in the baseline that's missing now, e.g. because
+    the stage crashed, or was skipped. One that's new isn't, but is listed.
+    """
+    changes: list[Change] = []
+
+    def missing_or_new(key: str, metric: str, before, after) -> bool:
+        "Adds a change for anything only one of them has"
+        if before is not None and after is not None:
+            return False
+        changes.append(Change(key, metric, before, after, regressed=after is None))
+        return True
+
+    old_stages, new_stages = baseline["stages"], current["stages"]
+    for key in sorted(old_stages.keys() | new_stages.keys()):
+        old, new = old_stages.get(key), new_stages.get(key)
+        before = None if old is None else old["median"]
+        after = None if new is None else new["median"]
+        if missing_or_new(key, "time", before, after):
+            continue
+        regressed = after > before * (1 + threshold) and after - before > noise_floor_ns
+        changes.append(Change(key, "time", before, after, regressed))
+
+    old_memory, new_memory = baseline.get("memory", {}), current.get("memory", {})
+    for key in sorted(old_memory.keys() | new_memory.keys()):
+        before, peak = old_memory.get(key), new_memory.get(key)
+        if missing_or_new(key, "memory", before, peak):
+            continue
+        regressed = (
+            peak > before * (1 + memory_threshold) and peak - before > memory_floor
+        )
+        changes.append(Change(key, "memory", before, peak, regressed))
+
+    old_answers, new_answers = baseline["answers"], current["answers"]
+    for key in sorted(old_answers.keys() | new_answers.keys()):
+        before, answer = old_answers.get(key), new_answers.get(key)
+        if not missing_or_new(key, "answer", before, answer) and before != answer:
+            changes.append(Change(key, "answer", before, answer, regressed=True))
+
+    return changes
+
+
+def _fmt(metric: str, value: float | None) -> str:
+    if value is None:
+        return "-"
+    match metric:
+        case "time":
+            return format_ns(value, 2)
+        case "memory":
+            return format_bytes(int(value))
+    return str(value)
+
+
+def format_diff(changes: list[Change]) -> str:
+    header = f"{'Stage':<30}{'Metric':<8}{'Baseline':>16}{'Current':>16}{'Change':>9}"
+    lines = [header]
+    for c in changes:
+        if c.current is None:
+            change = "missing"
+        elif c.baseline is None:
+            change = "new"
+        else:
+            change = f"{c.ratio - 1:+.0%}" if c.metric != "answer" else "!"
+        flag = "  REGRESSED" if c.regressed else ""
+        lines.append(
+            f"{c.key:<30}{c.metric:<8}"
+            f"{_fmt(c.metric, c.baseline):>16}{_fmt(c.metric, c.current):>16}"
+            f"{change:>9}{flag}"
+        )
+    return "\n".join(lines)
+
+
+def days_in(results: dict) -> list[int]:
+    "Which days a set of results covers, from keys like 'day05.part2'"
+    return sorted({int(key[3:5]) for key in results["stages"]})
+
+
+def only_days(results: dict, days: list[int]) -> dict:
+    "The results of just those days, so the others don't count as missing"
+    wanted = {f"day{day:02}" for day in days}
+    return {
+        section: {
+            key: v for key, v in results.get(section, {}).items() if key[:5] in wanted
+        }
+        for section in ("stages", "memory", "answers")
+    }
+
+
+def main(
+    baseline_path: Path,
+    days: list[int],
+    repeats: int = 10,
+    warmup: int = 1,
+    threshold: float = 0.2,
+    memory_threshold: float = 0.2,
+    output: Path | None = None,
+) -> int:
+    """
+    Re-run the benchmarks for the days in the baseline (or just `days`), and print how
+    they compare. Returns 1 if anything regressed, so it can gate CI.
+    """
+    baseline = json.loads(baseline_path.read_text())
+    days = sorted(set(days)) or days_in(baseline)
+
+    benchmarks = [benchmark_day(day, repeats=repeats, warmup=warmup) for day in days]
+    current = to_json(benchmarks, repeats, warmup)
+    if output is not None:
+        output.write_text(json.dumps(current, indent=2))
+
+    changes = compare(
+        only_days(baseline, days),
+        current,
+        threshold=threshold,
+        memory_threshold=memory_threshold,
+    )
+    print(format_diff(changes))
+
+    regressions = [c for c in changes if c.regressed]
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) against {baseline_path}")
+        return 1
+
+    print(f"\nNo regressions against {baseline_path}")
+    return 0
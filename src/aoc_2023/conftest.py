@@ -0,0 +1,38 @@
+import os
+import sys
+
+import pytest
+
+import aoc_2023
+from aoc_2023 import registry
+
+
+def edit(path, text):
+    "Write `path`, as saved well after it was, so nothing checking mtimes misses it"
+    mtime = path.stat().st_mtime_ns + 10**10 if path.exists() else 0
+    path.write_text(text)
+    os.utime(path, ns=(mtime, mtime))
+
+
+@pytest.fixture
+def day99(tmp_path, monkeypatch):
+    "A day 99 whose parser uses a shared module, through another, in a package of its own"
+    package_dir = tmp_path / "aoc_2023"
+    (package_dir / "day99").mkdir(parents=True)
+    (package_dir / "day99" / "__init__.py").touch()
+    edit(
+        package_dir / "day99" / "day99.py",
+        "from aoc_2023.shared99 import SCALE\n\n"
+        "def parse_input(raw_input):\n"
+        "    return [SCALE * int(n) for n in raw_input.split()]\n\n"
+        "def solve_part1(xs):\n"
+        "    return sum(xs)\n",
+    )
+    edit(package_dir / "day99" / "input.txt", "1 2 3")
+    edit(package_dir / "shared99.py", "from aoc_2023.scale99 import SCALE\n")
+    edit(package_dir / "scale99.py", "SCALE = 1\n")
+    monkeypatch.setattr(registry, "PACKAGE_DIR", package_dir)
+    monkeypatch.setattr(aoc_2023, "__path__", [str(package_dir), *aoc_2023.__path__])
+    yield package_dir
+    for name in ("day99", "day99.day99", "shared99", "scale99"):
+        sys.modules.pop(f"aoc_2023.{name}", None)
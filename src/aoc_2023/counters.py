@@ -0,0 +1,43 @@
+"""
+Counts of the work a solver does, e.g. steps walked or nodes expanded, so that how much
+work a day does for its input can be compared from run to run, or machine to machine,
+where timings would be noise.
+
+Like `utils.span()`, `count()` does nothing unless inside `record_counters()`, so
+solvers can leave their counts in. In a hot loop, even calling `count()` would cost too
+much, so keep the count in a local and call it once at the end, or check `enabled`
+first, which is one attribute lookup:
+
+```
+if counters.enabled:
+    counters.count("probes", n_probes)
+```
+"""
+
+from collections import Counter
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+# Whether anything's being recorded. Only `record_counters()` changes it
+enabled = False
+
+# Where `count()` adds to, if anywhere
+_active: Counter[str] | None = None
+
+
+def count(name: str, n: int = 1) -> None:
+    if _active is not None:
+        _active[name] += n
+
+
+@contextmanager
+def record_counters() -> Iterator[Counter[str]]:
+    "Add up every `count()` inside this block, by name"
+    global _active, enabled
+    previous, _active = _active, Counter()
+    enabled = True
+    try:
+        yield _active
+    finally:
+        _active = previous
+        enabled = previous is not None
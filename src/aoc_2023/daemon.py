@@ -0,0 +1,176 @@
+import importlib
+import json
+import os
+import socket
+import socketserver
+import stat
+import sys
+import tempfile
+import threading
+from pathlib import Path
+from types import ModuleType
+
+from aoc_2023.cache import imported_files, reload_imports
+from aoc_2023.registry import PARTS, discover_days, input_path, load, solver_path
+from aoc_2023.runner import run_stages
+from aoc_2023.utils import format_ns
+
+# Imported when the daemon starts, since the days only import them once they need them
+WARM_IMPORTS = ("numpy", "polars", "scipy.sparse")
+
+
+def default_socket_path() -> Path:
+    """
+    In `$XDG_RUNTIME_DIR`, which only the user can get into. Without one, in a directory
+    of the temp directory that only the user can, so that no one else can connect to
+    the daemon, or put a socket of their own where the client looks for it.
+    """
+    if runtime_dir := os.environ.get("XDG_RUNTIME_DIR"):
+        return Path(runtime_dir) / f"aoc_2023-{os.getuid()}.sock"
+
+    directory = Path(tempfile.gettempdir()) / f"aoc_2023-{os.getuid()}"
+    directory.mkdir(mode=0o700, exist_ok=True)
+    # It may have been there already, made by someone else
+    info = directory.lstat()
+    if (
+        not stat.S_ISDIR(info.st_mode)
+        or info.st_uid != os.getuid()
+        or stat.S_IMODE(info.st_mode) & 0o077
+    ):
+        raise PermissionError(f"{directory} must be a directory only you can use")
+    return directory / "daemon.sock"
+
+
+class SolverDaemon(socketserver.UnixStreamServer):
+    """
+    Keeps every day imported, along with numpy, polars, etc., and solves days on request.
+
+    Requests and responses are one JSON object per line. A request looks like
+    `{"day": 5, "parts": ["part1"], "path": "..."}`, where `parts` defaults to both,
+    and either `path` or `input` (the raw text) can be given instead of the day's own
+    `input.txt`. `{"command": "ping"}` and `{"command": "shutdown"}` are also
+    understood.
+
+    Requests are handled one at a time, since timing spans are recorded globally. If a
+    day's module, or an `aoc_2023` module it imports like `grid.py`, has changed on
+    disk since it was imported, they're reloaded first.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        # The mtime of each file of each day's modules, when it was last loaded
+        self.loaded: dict[int, dict[Path, int]] = {}
+        for name in WARM_IMPORTS:
+            importlib.import_module(name)
+        for day in discover_days():
+            self.module(day)
+
+        if path.exists():
+            path.unlink()
+        super().__init__(str(path), _Handler)
+
+    def server_close(self) -> None:
+        super().server_close()
+        self.path.unlink(missing_ok=True)
+
+    def module(self, day: int) -> ModuleType:
+        "The day's module, reloaded with whatever it imports that changed since"
+        solver = solver_path(day)
+        mtimes = {p: p.stat().st_mtime_ns for p in imported_files(solver) | {solver}}
+        module = load(day)
+        before = self.loaded.get(day)
+        if before is not None and before != mtimes:
+            edited = {p for p, mtime in mtimes.items() if before.get(p) != mtime}
+            reload_imports(solver, edited)
+            module = importlib.reload(module)
+        self.loaded[day] = mtimes
+        return module
+
+    def respond(self, request: dict) -> dict:
+        match request.get("command", "solve"):
+            case "ping":
+                return {"ok": True, "pid": os.getpid()}
+            case "shutdown":
+                # Can't call shutdown() from the thread that's serving
+                threading.Thread(target=self.shutdown).start()
+                return {"ok": True}
+            case "solve":
+                return self.solve(request)
+        return {"ok": False, "error": f"Unknown command {request['command']}"}
+
+    def solve(self, request: dict) -> dict:
+        day = int(request["day"])
+        if day not in self.loaded:
+            return {"ok": False, "error": f"No solution for day {day}"}
+
+        if "input" in request:
+            raw_input = request["input"]
+        else:
+            raw_input = Path(request.get("path") or input_path(day)).read_text()
+
+        parts = tuple(request.get("parts") or PARTS)
+        result = run_stages(day, self.module(day), raw_input, parts=parts)
+        return {
+            "ok": True,
+            "day": day,
+            "answers": result.answers,
+            "timings": result.timings,
+            "spans": result.spans,
+        }
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    server: SolverDaemon
+
+    def handle(self) -> None:
+        for line in self.rfile:
+            try:
+                response = self.server.respond(json.loads(line))
+            except Exception as e:
+                # Whatever went wrong solving the day, the daemon carries on
+                response = {"ok": False, "error": f"{type(e).__name__}: {e}"}
+            self.wfile.write(json.dumps(response).encode() + b"\n")
+
+
+def request(message: dict, socket_path: Path | None = None) -> dict:
+    "Send one request to a running daemon, and wait for its response"
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(str(socket_path or default_socket_path()))
+        with sock.makefile("rwb") as f:
+            f.write(json.dumps(message).encode() + b"\n")
+            f.flush()
+            return json.loads(f.readline())
+
+
+def serve(socket_path: Path | None = None) -> int:
+    path = socket_path or default_socket_path()
+    with SolverDaemon(path) as daemon:
+        print(f"Listening on {path}")
+        try:
+            daemon.serve_forever()
+        except KeyboardInterrupt:
+            pass
+    return 0
+
+
+def solve(
+    day: int,
+    parts: list[str],
+    path: Path | None = None,
+    socket_path: Path | None = None,
+) -> int:
+    message: dict = {"day": day, "parts": parts}
+    if path is not None:
+        # The daemon may not be running in the same directory
+        message["path"] = str(path.resolve())
+    response = request(message, socket_path)
+    if not response["ok"]:
+        print(response["error"], file=sys.stderr)
+        return 1
+
+    for part, answer in response["answers"].items():
+        print(f"Part {part[-1]}: {answer}")
+    print()
+    for stage, ns in response["timings"].items():
+        print(f"{stage} took {format_ns(ns)}")
+    return 0
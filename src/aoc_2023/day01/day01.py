@@ -1,8 +1,3 @@
-from pathlib import Path
-
-from aoc_2023.utils import format_ns
-
-
 def parse_part1(raw_input: str) -> list[int]:
     """
     On each line, the calibration value can be found by combining the first digit and
@@ -77,31 +72,23 @@ def part2(line: str) -> int:
     )
 
 
-if __name__ == "__main__":
-    from time import perf_counter_ns
+def parse_input(raw_input: str) -> list[int]:
+    return parse_part1(raw_input)
 
-    # === Parse ========================================================================
-    parse_start = perf_counter_ns()
 
-    input_path = Path(__file__).parent / "input.txt"
-    raw_input = input_path.read_text()
+def parse_input_part2(raw_input: str) -> list[str]:
+    return raw_input.splitlines()
 
-    input = parse_part1(raw_input)
-    parse_time = format_ns(perf_counter_ns() - parse_start)
 
-    # === Part 1 =======================================================================
-    p1_start = perf_counter_ns()
-    p1 = part1(input)
-    p1_time = format_ns(perf_counter_ns() - p1_start)
-    print(f"Part 1: {p1}")
+def solve_part1(calibrations: list[int]) -> int:
+    return part1(calibrations)
 
-    # === Part 2 =======================================================================
-    p2_start = perf_counter_ns()
-    p2 = sum(part2(line) for line in raw_input.splitlines())
-    p2_time = format_ns(perf_counter_ns() - p2_start)
-    print(f"Part 2: {p2}")
 
-    # === Printing =====================================================================
-    print(f"\n\nSetup took {parse_time}")
-    print(f"Part 1 took {p1_time}")
-    print(f"Part 2 took {p2_time}")
+def solve_part2(lines: list[str]) -> int:
+    return sum(part2(line) for line in lines)
+
+
+if __name__ == "__main__":
+    from aoc_2023.runner import print_day
+
+    print_day(1)
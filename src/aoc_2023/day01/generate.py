@@ -0,0 +1,33 @@
+import random
+import string
+
+WORDS = ("one", "two", "three", "four", "five", "six", "seven", "eight", "nine")
+
+SIZES = (1_000, 2_000, 4_000, 8_000, 16_000)
+
+
+def generate(n: int, seed: int = 0) -> str:
+    """
+    `n` lines of calibration document. Each line mixes letters, digits and spelled out
+    digits, and always has at least one real digit so part 1 has something to find.
+    """
+    rng = random.Random(seed)
+    lines: list[str] = []
+    for _ in range(n):
+        pieces = [rng.choice(string.digits[1:])]
+        for _ in range(rng.randint(1, 6)):
+            match rng.randrange(3):
+                case 0:
+                    pieces.append(rng.choice(string.digits[1:]))
+                case 1:
+                    pieces.append(rng.choice(WORDS))
+                case _:
+                    pieces.append(
+                        "".join(
+                            rng.choices(string.ascii_lowercase, k=rng.randint(1, 4))
+                        )
+                    )
+        rng.shuffle(pieces)
+        lines.append("".join(pieces))
+
+    return "\n".join(lines)
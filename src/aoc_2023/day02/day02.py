@@ -1,8 +1,8 @@
 import re
 from dataclasses import dataclass
-from pathlib import Path
 
-from aoc_2023.utils import format_ns
+# A count and the first letter of its color, e.g. "3 b" from "3 blue"
+CUBES = re.compile(r"(\d+) ([b|r|g])")
 
 
 @dataclass
@@ -52,11 +52,8 @@ def parse_game(game: str) -> list[RGB]:
     # Split into draws
     draws = game.split(";")
 
-    # To search for
-    pattern = re.compile(r"(\d+) ([b|r|g])")
-
     # Break it into easy to digest chunks
-    pairings = [pattern.findall(d) for d in draws]
+    pairings = [CUBES.findall(d) for d in draws]
 
     return [parse_RGB(parts) for parts in pairings]
 
@@ -100,31 +97,19 @@ def smallest_RGB(game: list[RGB]) -> RGB:
     return r
 
 
-if __name__ == "__main__":
-    from time import perf_counter_ns
+def parse_input(raw_input: str) -> list[list[RGB]]:
+    return [parse_game(game) for game in raw_input.splitlines()]
 
-    # === Parse ========================================================================
-    parse_start = perf_counter_ns()
 
-    input_path = Path(__file__).parent / "input.txt"
-    raw_input = input_path.read_text()
-    games = [parse_game(game) for game in raw_input.splitlines()]
+def solve_part1(games: list[list[RGB]]) -> int:
+    return part1(games)
 
-    parse_time = format_ns(perf_counter_ns() - parse_start)
 
-    # === Part 1 =======================================================================
-    p1_start = perf_counter_ns()
-    p1 = part1(games)
-    p1_time = format_ns(perf_counter_ns() - p1_start)
-    print(f"Part 1: {p1}")
+def solve_part2(games: list[list[RGB]]) -> int:
+    return sum(smallest_RGB(game).power() for game in games)
 
-    # === Part 2 =======================================================================
-    p2_start = perf_counter_ns()
-    p2 = sum(smallest_RGB(game).power() for game in games)
-    p2_time = format_ns(perf_counter_ns() - p2_start)
-    print(f"Part 2: {p2}")
 
-    # === Printing =====================================================================
-    print(f"\n\nSetup took {parse_time}")
-    print(f"Part 1 took {p1_time}")
-    print(f"Part 2 took {p2_time}")
+if __name__ == "__main__":
+    from aoc_2023.runner import print_day
+
+    print_day(2)
@@ -0,0 +1,17 @@
+import random
+
+SIZES = (100, 1_000, 10_000, 100_000)
+
+
+def generate(n: int, seed: int = 0) -> str:
+    "`n` games, each with a handful of draws of up to 20 cubes of each colour"
+    rng = random.Random(seed)
+    lines: list[str] = []
+    for game in range(1, n + 1):
+        draws: list[str] = []
+        for _ in range(rng.randint(1, 6)):
+            colours = rng.sample(["red", "green", "blue"], k=rng.randint(1, 3))
+            draws.append(", ".join(f"{rng.randint(1, 20)} {c}" for c in colours))
+        lines.append(f"Game {game}: " + "; ".join(draws))
+
+    return "\n".join(lines)
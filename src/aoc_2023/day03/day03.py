@@ -2,9 +2,9 @@ import re
 from dataclasses import dataclass
 from enum import Enum
 from math import prod
-from pathlib import Path
 
-from aoc_2023.utils import format_ns
+# A symbol, or a whole number
+TOKEN = re.compile(r"([#|$|%|&|*|+|\-|/|=|@]|\d+)")
 
 
 class Type(Enum):
@@ -38,10 +38,9 @@ def parse(raw_input: str) -> list[Item]:
     For each match, create an `Item` object
     """
     items: list[Item] = []
-    pat = re.compile(r"([#|$|%|&|*|+|\-|/|=|@]|\d+)")
 
     for row, line in enumerate(raw_input.splitlines()):
-        for m in pat.finditer(line):
+        for m in TOKEN.finditer(line):
             t = Type.Number if m.group().isdigit() else Type.Part
             inds = tuple((row, col) for col in range(m.start(), m.end()))
             items.append(Item(value=m.group(), typ=t, inds=inds))
@@ -93,28 +92,21 @@ def solve(items: list[Item], keep_parts: set[str]) -> tuple[int, int]:
     return total, gear_ratio
 
 
+def parse_input(raw_input: str) -> list[Item]:
+    return parse(raw_input)
+
+
+def solve_part1(items: list[Item]) -> int:
+    all_part_symbols = set(item.value for item in items if item.typ == Type.Part)
+    return solve(items, keep_parts=all_part_symbols)[0]
+
+
+def solve_part2(items: list[Item]) -> int:
+    all_part_symbols = set(item.value for item in items if item.typ == Type.Part)
+    return solve(items, keep_parts=all_part_symbols)[1]
+
+
 if __name__ == "__main__":
-    from time import perf_counter_ns
-
-    # === Parse ========================================================================
-    parse_start = perf_counter_ns()
-
-    input_path = Path(__file__).parent / "input.txt"
-    raw_input = input_path.read_text()
-    input = parse(raw_input)
-
-    parse_time = format_ns(perf_counter_ns() - parse_start)
-
-    # === Both Parts ===================================================================
-    p1_start = perf_counter_ns()
-    all_part_symbols: set[str] = set(
-        item.value for item in input if item.typ == Type.Part
-    )
-    p1, p2 = solve(input, keep_parts=all_part_symbols)
-    solve_time = format_ns(perf_counter_ns() - p1_start)
-    print(f"Part 1: {p1}")
-    print(f"Part 1: {p2}")
-
-    # === Printing =====================================================================
-    print(f"\n\nSetup took {parse_time}")
-    print(f"Solving both took {solve_time}")
+    from aoc_2023.runner import print_day
+
+    print_day(3)
@@ -0,0 +1,27 @@
+import random
+
+SYMBOLS = "#$%&*+-/=@"
+
+SIZES = (140, 280, 560, 1_120, 2_240)
+
+
+def generate(n: int, seed: int = 0, width: int = 140) -> str:
+    """
+    A schematic `n` rows tall. Numbers are always followed by a '.', so two numbers
+    never run together into one.
+    """
+    rng = random.Random(seed)
+    lines: list[str] = []
+    for _ in range(n):
+        row: list[str] = []
+        while len(row) < width:
+            r = rng.random()
+            if r < 0.12:
+                row.extend(str(rng.randint(1, 999)) + ".")
+            elif r < 0.16:
+                row.append(rng.choice(SYMBOLS))
+            else:
+                row.append(".")
+        lines.append("".join(row[:width]))
+
+    return "\n".join(lines)
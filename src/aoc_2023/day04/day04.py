@@ -1,8 +1,9 @@
 import re
 from dataclasses import dataclass
-from pathlib import Path
 
-from aoc_2023.utils import format_ns
+from aoc_2023.ints import ints, ints_per_line
+
+WHITESPACE = re.compile(r"\s+")
 
 
 @dataclass
@@ -20,8 +21,8 @@ def parse_card(line: str) -> Cards:
     pieces = line.split(":")[-1]
     have, want = pieces.split("|", maxsplit=1)
     return Cards(
-        have=set(int(n) for n in re.split(r"\s+", have.strip())),
-        want=set(int(n) for n in re.split(r"\s+", want.strip())),
+        have=set(int(n) for n in WHITESPACE.split(have.strip())),
+        want=set(int(n) for n in WHITESPACE.split(want.strip())),
         n_copies=1,
     )
 
@@ -46,31 +47,29 @@ def part2(cards: list[Cards]) -> int:
     return sum(c.n_copies for c in cs)
 
 
-if __name__ == "__main__":
-    from time import perf_counter_ns
+def parse_input(raw_input: str) -> list[Cards]:
+    """
+    Every card has as many numbers, so read them all at once, and split them where the
+    first card has its '|'. The first number on each line is the card's own.
+    """
+    first_line = raw_input.partition("\n")[0]
+    n_have = len(ints(first_line.partition("|")[0])) - 1
+    table = ints_per_line(raw_input.strip()).as_2d()
+    return [
+        Cards(have=set(row[1 : n_have + 1]), want=set(row[n_have + 1 :]), n_copies=1)
+        for row in table.tolist()
+    ]
+
 
-    # === Parse ========================================================================
-    parse_start = perf_counter_ns()
+def solve_part1(cards: list[Cards]) -> int:
+    return sum(c.points_won() for c in cards)
 
-    input_path = Path(__file__).parent / "input.txt"
-    raw_input = input_path.read_text()
-    cards = [parse_card(line) for line in raw_input.splitlines()]
 
-    parse_time = format_ns(perf_counter_ns() - parse_start)
+def solve_part2(cards: list[Cards]) -> int:
+    return part2(cards)
 
-    # === Part 1 =======================================================================
-    p1_start = perf_counter_ns()
-    p1 = sum(c.points_won() for c in cards)
-    p1_time = format_ns(perf_counter_ns() - p1_start)
-    print(f"Part 1: {p1}")
 
-    # === Part 2 =======================================================================
-    p2_start = perf_counter_ns()
-    p2 = part2(cards)
-    p2_time = format_ns(perf_counter_ns() - p2_start)
-    print(f"Part 2: {p2}")
+if __name__ == "__main__":
+    from aoc_2023.runner import print_day
 
-    # === Printing =====================================================================
-    print(f"\n\nSetup took {parse_time}")
-    print(f"Part 1 took {p1_time}")
-    print(f"Part 2 took {p2_time}")
+    print_day(4)
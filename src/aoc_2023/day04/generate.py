@@ -0,0 +1,30 @@
+import random
+
+SIZES = (1_000, 2_000, 4_000, 8_000, 16_000)
+
+
+def generate(n: int, seed: int = 0) -> str:
+    """
+    `n` scratchcards of 10 winning numbers and 25 numbers you have.
+
+    Card i never has more matches than there are cards after it, since part 2 would
+    run off the end of the table. Most cards have no more than a couple of matches, or
+    the number of copies grows exponentially with `n`.
+    """
+    rng = random.Random(seed)
+    width = len(str(n))
+    lines: list[str] = []
+    for idx in range(n):
+        n_matches = min(int(rng.expovariate(1.0)), 10, n - 1 - idx)
+        numbers = rng.sample(range(1, 100), k=35 - n_matches)
+        winning = numbers[:10]
+        have = winning[:n_matches] + numbers[10:]
+        rng.shuffle(have)
+        lines.append(
+            f"Card {idx + 1:>{width}}: "
+            + " ".join(f"{x:>2}" for x in winning)
+            + " | "
+            + " ".join(f"{x:>2}" for x in have)
+        )
+
+    return "\n".join(lines)
@@ -1,22 +1,22 @@
 import re
 from collections.abc import Callable
 from dataclasses import dataclass
-from pathlib import Path
 
 from more_itertools import chunked
-from tqdm import tqdm
 
-from aoc_2023.utils import format_ns
+from aoc_2023 import counters
+from aoc_2023.ints import ints
+from aoc_2023.progress import Progress
+
+MAP_HEADER = re.compile(r"(\w+)-to-(\w+) map:$")
 
 
 def p1_seed_parser(seed_line: str) -> list[int]:
-    str_seeds = seed_line.split(":", maxsplit=1)[-1].strip().split()
-    return [int(s) for s in str_seeds]
+    return ints(seed_line).tolist()
 
 
 def p2_seed_parser(seed_line: str) -> list[range]:
-    str_seeds = seed_line.split(":", maxsplit=1)[-1].strip().split()
-    nums = [int(s) for s in str_seeds]
+    nums = ints(seed_line).tolist()
     return [range(x, x + y) for x, y in chunked(nums, 2)]
 
 
@@ -66,7 +66,16 @@ def parse(raw_input: str, seed_mapper: Callable = p1_seed_parser):
     seed_line = parts[0]
     seeds = seed_mapper(seed_line)
 
-    return seeds, [parse_mapping(m) for m in parts[1:]]
+    # Read every mapping's numbers at once, then give each mapping its own lines
+    nums = ints(raw_input[len(seed_line) :]).reshape(-1, 3).tolist()
+    maps: list[Mapping] = []
+    first = 0
+    for m in parts[1:]:
+        n_lines = m.strip().count("\n")
+        maps.append(parse_mapping(m, nums[first : first + n_lines]))
+        first += n_lines
+
+    return seeds, maps
 
 
 @dataclass
@@ -78,23 +87,30 @@ class Mapping:
     def get(self, x: int) -> int:
         for s, d in self.mapping.items():
             if x in s:
+                if counters.enabled:
+                    counters.count("range_probes", list(self.mapping).index(s) + 1)
                 offset: int = x - s[0]
                 return d[0] + offset
+        if counters.enabled:
+            counters.count("range_probes", len(self.mapping))
         return x
 
 
-def parse_mapping(s: str) -> Mapping:
+def parse_mapping(s: str, nums: list[list[int]] | None = None) -> Mapping:
     """
     A mapping looks like this in text form:
     temperature-to-humidity map:
     0 69 1
     1 0 69
+
+    `nums` are the numbers on the lines after the first, if they're already parsed
     """
     lines = s.splitlines()
-    m = re.findall(r"(\w+)-to-(\w+) map:$", lines[0])
+    m = MAP_HEADER.findall(lines[0])
     source = m[0][0]
     dest = m[0][1]
-    nums = [[int(s) for s in line.split()] for line in lines[1:]]
+    if nums is None:
+        nums = ints(s.partition("\n")[2]).reshape(-1, 3).tolist()
     mappings = {range(n[1], n[1] + n[2]): range(n[0], n[0] + n[2]) for n in nums}
     return Mapping(source=source, dest=dest, mapping=mappings)
 
@@ -109,45 +125,85 @@ def get_seed_location(seed: int, mappings: list[Mapping]) -> int:
     return x
 
 
+def map_ranges(ranges: list[range], mapping: Mapping) -> list[range]:
+    """
+    Everywhere the numbers in `ranges` go through `mapping`, as ranges. Each range is
+    cut where it overlaps the mapping's source ranges, taken in the order `Mapping.get`
+    tries them, and each piece is moved as a whole. Whatever no source range covers is
+    left where it is.
+    """
+    moved: list[range] = []
+    for r in ranges:
+        pending = [r]
+        for s, d in mapping.mapping.items():
+            rest: list[range] = []
+            for p in pending:
+                lo, hi = max(p.start, s.start), min(p.stop, s.stop)
+                if lo >= hi:
+                    rest.append(p)
+                    continue
+                moved.append(range(d.start + lo - s.start, d.start + hi - s.start))
+                if p.start < lo:
+                    rest.append(range(p.start, lo))
+                if hi < p.stop:
+                    rest.append(range(hi, p.stop))
+            pending = rest
+        moved.extend(pending)
+    return moved
+
+
+def lowest_location(seeds: list[range], maps: list[Mapping]) -> int:
+    """
+    The same as `part2()`, but moving whole ranges of seeds through the maps at once,
+    so the work grows with the number of ranges, not seeds
+    """
+    ranges = [r for r in seeds if r]
+    for m in maps:
+        ranges = map_ranges(ranges, m)
+    return min(r.start for r in ranges)
+
+
 def part2(seeds: list[range], maps: list[Mapping]) -> int:
-    smallest = 1_000_000_000
+    "One seed at a time. Kept as the reference for `lowest_location()`"
+    smallest = None
     total_iterations = sum(len(s) for s in seeds)
-    with tqdm(total=total_iterations) as pbar:
+    with Progress(total=total_iterations, desc="day05 seeds") as progress:
         for r in seeds:
-            for seed in r:
-                x = get_seed_location(seed, maps)
-                smallest = min(smallest, x)
-                pbar.update()
-
+            # Counted a chunk at a time, so nothing's added up per seed
+            for chunk in progress.chunks(r):
+                for seed in chunk:
+                    x = get_seed_location(seed, maps)
+                    smallest = x if smallest is None else min(smallest, x)
+
+    if smallest is None:
+        raise ValueError("There are no seeds")
     return smallest
 
 
+def parse_input(raw_input: str) -> tuple[list[int], list[Mapping]]:
+    return parse(raw_input)
+
+
+def parse_input_part2(raw_input: str) -> tuple[list[range], list[Mapping]]:
+    return parse(raw_input, seed_mapper=p2_seed_parser)
+
+
+def solve_part1(parsed: tuple[list[int], list[Mapping]]) -> int:
+    seeds, maps = parsed
+    return min(get_seed_location(seed, maps) for seed in seeds)
+
+
+def solve_part2(parsed: tuple[list[range], list[Mapping]]) -> int:
+    seeds, maps = parsed
+    return lowest_location(seeds, maps)
+
+
+def reference_part2(parsed: tuple[list[range], list[Mapping]]) -> int:
+    seeds, maps = parsed
+    return part2(seeds, maps)
+
+
 if __name__ == "__main__":
-    from time import perf_counter_ns
-
-    # === Parse ========================================================================
-    parse_start = perf_counter_ns()
-
-    input_path = Path(__file__).parent / "input.txt"
-    raw_input = input_path.read_text()
-    seeds1, maps = parse(raw_input)
-    seeds2, maps = parse(raw_input, seed_mapper=p2_seed_parser)
-
-    parse_time = format_ns(perf_counter_ns() - parse_start)
-
-    # === Part 1 =======================================================================
-    p1_start = perf_counter_ns()
-    p1 = min(get_seed_location(seed, maps) for seed in seeds1)
-    p1_time = format_ns(perf_counter_ns() - p1_start)
-    print(f"Part 1: {p1}")
-
-    # === Part 2 =======================================================================
-    p2_start = perf_counter_ns()
-    p2 = part2(seeds2, maps)
-    p2_time = format_ns(perf_counter_ns() - p2_start)
-    print(f"Part 2: {p2}")
-
-    # === Printing =====================================================================
-    print(f"\n\nSetup took {parse_time}")
-    print(f"Part 1 took {p1_time}")
-    print(f"Part 2 took {p2_time}")
+    from aoc_2023.runner import print_day
+
+    print_day(5)
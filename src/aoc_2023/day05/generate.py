@@ -0,0 +1,46 @@
+import itertools
+import random
+
+CATEGORIES = (
+    "seed",
+    "soil",
+    "fertilizer",
+    "water",
+    "light",
+    "temperature",
+    "humidity",
+    "location",
+)
+SPACE = 4_000_000_000
+
+SIZES = (10_000, 20_000, 40_000, 80_000, 160_000)
+
+
+def _split(rng: random.Random, total: int, k: int) -> list[int]:
+    "Split `total` into `k` random, positive parts"
+    cuts = sorted(rng.sample(range(1, total), k - 1))
+    return [b - a for a, b in zip([0, *cuts], [*cuts, total])]
+
+
+def generate(n: int, seed: int = 0) -> str:
+    """
+    An almanac whose part 2 seed ranges cover `n` seeds in total, split over up to five
+    ranges, and seven maps of 3 to 10 non-overlapping ranges each.
+    """
+    rng = random.Random(seed)
+
+    n_ranges = min(5, n)
+    lengths = _split(rng, n, n_ranges) if n_ranges > 1 else [n]
+    seeds = [x for length in lengths for x in (rng.randrange(SPACE - length), length)]
+    sections = ["seeds: " + " ".join(str(s) for s in seeds)]
+
+    for source, dest in itertools.pairwise(CATEGORIES):
+        k = rng.randint(3, 10)
+        bounds = sorted(rng.sample(range(SPACE), 2 * k))
+        lines = [f"{source}-to-{dest} map:"]
+        for start, stop in zip(bounds[::2], bounds[1::2]):
+            length = stop - start
+            lines.append(f"{rng.randrange(SPACE - length)} {start} {length}")
+        sections.append("\n".join(lines))
+
+    return "\n\n".join(sections)
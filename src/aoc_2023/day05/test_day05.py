@@ -5,6 +5,8 @@ import pytest
 from aoc_2023.day05.day05 import (
     Mapping,
     get_seed_location,
+    lowest_location,
+    map_ranges,
     p2_seed_parser,
     parse,
     parse_mapping,
@@ -124,3 +126,16 @@ def test_part2(example_text):
     got = min(get_seed_location(seed, maps) for r in seeds for seed in r)
     want = 46
     assert want == got
+    assert want == lowest_location(seeds, maps)
+
+
+def test_map_ranges():
+    m = Mapping(
+        source="soil",
+        dest="fertilizer",
+        mapping={range(15, 52): range(0, 37), range(52, 54): range(37, 39)},
+    )
+    # Cut where the source ranges start and stop, and the ends left where they are
+    got = map_ranges([range(10, 60)], m)
+    assert [range(0, 37), range(37, 39), range(10, 15), range(54, 60)] == got
+    assert sorted(m.get(x) for x in range(10, 60)) == sorted(x for r in got for x in r)
@@ -1,7 +1,6 @@
 from math import ceil, floor, prod, sqrt
-from pathlib import Path
 
-from aoc_2023.utils import format_ns
+from aoc_2023.ints import ints_per_line
 
 
 def parse_p1(raw_input: str) -> tuple[list[int], list[int]]:
@@ -11,13 +10,7 @@ def parse_p1(raw_input: str) -> tuple[list[int], list[int]]:
     Time:        51     69     98     78
     Distance:   377   1171   1224   1505
     """
-    time, dist = raw_input.strip().split("\n", maxsplit=1)
-    _, stimes = time.split(":", maxsplit=1)
-    _, sdists = dist.split(":", maxsplit=1)
-
-    times = [int(x) for x in stimes.strip().split()]
-    dists = [int(x) for x in sdists.strip().split()]
-
+    times, dists = ints_per_line(raw_input.strip()).as_2d().tolist()
     return times, dists
 
 
@@ -55,32 +48,25 @@ def ways_to_win(time: int, record_distance: int) -> int:
     return lt - gt + 1
 
 
+def parse_input(raw_input: str) -> tuple[list[int], list[int]]:
+    return parse_p1(raw_input)
+
+
+def parse_input_part2(raw_input: str) -> tuple[int, int]:
+    return parse_p2(raw_input)
+
+
+def solve_part1(races: tuple[list[int], list[int]]) -> int:
+    times, dists = races
+    return prod(ways_to_win(t, d) for t, d in zip(times, dists))
+
+
+def solve_part2(race: tuple[int, int]) -> int:
+    time, dist = race
+    return ways_to_win(time, dist)
+
+
 if __name__ == "__main__":
-    from time import perf_counter_ns
-
-    # === Parse ========================================================================
-    parse_start = perf_counter_ns()
-
-    input_path = Path(__file__).parent / "input.txt"
-    raw_input = input_path.read_text()
-
-    parse_time = format_ns(perf_counter_ns() - parse_start)
-
-    # === Part 1 =======================================================================
-    p1_start = perf_counter_ns()
-    times, dists = parse_p1(raw_input)
-    p1 = prod(ways_to_win(t, d) for t, d in zip(times, dists))
-    p1_time = format_ns(perf_counter_ns() - p1_start)
-    print(f"Part 1: {p1}")
-
-    # === Part 2 =======================================================================
-    p2_start = perf_counter_ns()
-    time, dist = parse_p2(raw_input)
-    p2 = ways_to_win(time, dist)
-    p2_time = format_ns(perf_counter_ns() - p2_start)
-    print(f"Part 2: {p2}")
-
-    # === Printing =====================================================================
-    print(f"\n\nSetup took {parse_time}")
-    print(f"Part 1 took {p1_time}")
-    print(f"Part 2 took {p2_time}")
+    from aoc_2023.runner import print_day
+
+    print_day(6)
@@ -0,0 +1,28 @@
+import random
+
+SIZES = (4, 8, 16, 32, 64)
+
+
+def generate(n: int, seed: int = 0) -> str:
+    """
+    `n` races, each with a two digit time, and a record that can always be beaten.
+
+    Records are kept to two digits as well, so that the concatenated record of part 2
+    is still beatable in the concatenated time. Part 2 squares that time as a float,
+    which overflows somewhere past 75 races.
+    """
+    rng = random.Random(seed)
+    times: list[int] = []
+    dists: list[int] = []
+    for _ in range(n):
+        time = rng.randint(10, 99)
+        best = (time // 2) * (time - time // 2)
+        times.append(time)
+        dists.append(rng.randint(1, min(99, best - 1)))
+
+    return (
+        "Time:     "
+        + "".join(f"{t:>6}" for t in times)
+        + "\nDistance: "
+        + "".join(f"{d:>6}" for d in dists)
+    )
@@ -1,11 +1,10 @@
 from collections import Counter
 from collections.abc import Callable
 from enum import IntEnum
-from pathlib import Path
+from typing import TYPE_CHECKING
 
-import polars as pl
-
-from aoc_2023.utils import format_ns
+if TYPE_CHECKING:
+    import polars as pl
 
 
 class Card(IntEnum):
@@ -110,7 +109,9 @@ def joker_which_type(hand) -> str:
     return which_type(counts, count=False)
 
 
-def type_score() -> pl.Expr:
+def type_score() -> "pl.Expr":
+    import polars as pl
+
     return (
         pl.when(pl.col.type.eq("five_of_kind"))
         .then(7)
@@ -129,7 +130,7 @@ def type_score() -> pl.Expr:
     )
 
 
-def rank_hands(hands: pl.DataFrame, rank_fn: Callable) -> int:
+def rank_hands(hands: "pl.DataFrame | pl.LazyFrame", rank_fn: Callable) -> int:
     """
     Sorts the cards, from least to best.
 
@@ -142,8 +143,11 @@ def rank_hands(hands: pl.DataFrame, rank_fn: Callable) -> int:
     If they differ, the hand with the higher second card wins; otherwise, continue with
     the third card in each hand, then the fourth, then the fifth.
     """
+    import polars as pl
+
     return (
-        hands.with_columns(
+        hands.lazy()
+        .with_columns(
             type=pl.col.hand.map_elements(function=rank_fn, return_dtype=pl.String)
         )
         .with_columns(type_score=type_score())
@@ -160,42 +164,43 @@ def rank_hands(hands: pl.DataFrame, rank_fn: Callable) -> int:
         .with_row_index(name="rank")
         .with_columns(pl.col.rank + 1)
         .select(winning=(pl.col.rank * pl.col.bid).sum())
+        .collect()
         .item()
     )
 
 
+def parse_hands(raw_input: str, w_joker: bool = False) -> "pl.LazyFrame":
+    """
+    Lazy, so that a `cache.ParseCache` keeps it as parquet, and later runs scan that
+    instead of parsing
+    """
+    import polars as pl
+
+    parsed = [parse_line(line, w_joker=w_joker) for line in raw_input.splitlines()]
+    return (
+        pl.DataFrame(dict(hand=[h[0] for h in parsed], bid=[h[1] for h in parsed]))
+        .with_columns(hand=pl.col.hand.list.to_array(5))
+        .lazy()
+    )
+
+
+def parse_input(raw_input: str) -> "pl.LazyFrame":
+    return parse_hands(raw_input)
+
+
+def parse_input_part2(raw_input: str) -> "pl.LazyFrame":
+    return parse_hands(raw_input, w_joker=True)
+
+
+def solve_part1(hands: "pl.LazyFrame") -> int:
+    return rank_hands(hands, rank_fn=which_type)
+
+
+def solve_part2(hands: "pl.LazyFrame") -> int:
+    return rank_hands(hands, rank_fn=joker_which_type)
+
+
 if __name__ == "__main__":
-    from time import perf_counter_ns
-
-    # === Parse ========================================================================
-    parse_start = perf_counter_ns()
-
-    input_path = Path(__file__).parent / "input.txt"
-    raw_input = input_path.read_text()
-    parsed = [parse_line(line) for line in raw_input.splitlines()]
-    hands = pl.DataFrame(
-        dict(hand=[h[0] for h in parsed], bid=[h[1] for h in parsed])
-    ).with_columns(hand=pl.col.hand.list.to_array(5))
-
-    parse_time = format_ns(perf_counter_ns() - parse_start)
-
-    # === Part 1 =======================================================================
-    p1_start = perf_counter_ns()
-    p1 = rank_hands(hands, rank_fn=which_type)
-    p1_time = format_ns(perf_counter_ns() - p1_start)
-    print(f"Part 1: {p1}")
-
-    # === Part 2 =======================================================================
-    p2_start = perf_counter_ns()
-    parsed = [parse_line(line, w_joker=True) for line in raw_input.splitlines()]
-    hands = pl.DataFrame(
-        dict(hand=[h[0] for h in parsed], bid=[h[1] for h in parsed])
-    ).with_columns(hand=pl.col.hand.list.to_array(5))
-    p2 = rank_hands(hands, rank_fn=joker_which_type)
-    p2_time = format_ns(perf_counter_ns() - p2_start)
-    print(f"Part 2: {p2}")
-
-    # === Printing =====================================================================
-    print(f"\n\nSetup took {parse_time}")
-    print(f"Part 1 took {p1_time}")
-    print(f"Part 2 took {p2_time}")
+    from aoc_2023.runner import print_day
+
+    print_day(7)
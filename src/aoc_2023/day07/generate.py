@@ -0,0 +1,24 @@
+import random
+
+CARDS = "23456789TJQKA"
+
+SIZES = (1_000, 2_000, 4_000, 8_000, 16_000)
+
+
+def generate(n: int, seed: int = 0) -> str:
+    """
+    `n` distinct hands with bids. Hands are never repeated, since two identical hands
+    would tie, and then the answer depends on how the sort breaks ties.
+    """
+    if n > len(CARDS) ** 5:
+        raise ValueError(f"Only {len(CARDS) ** 5} distinct hands are possible")
+
+    rng = random.Random(seed)
+    hands: set[str] = set()
+    while len(hands) < n:
+        hands.add("".join(rng.choices(CARDS, k=5)))
+
+    # Sets of strings iterate in a different order every run, so sort before shuffling
+    ordered = sorted(hands)
+    rng.shuffle(ordered)
+    return "\n".join(f"{hand} {rng.randint(1, 1000)}" for hand in ordered)
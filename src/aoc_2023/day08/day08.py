@@ -1,9 +1,10 @@
 import itertools
 import math
 import re
-from pathlib import Path
 
-from aoc_2023.utils import format_ns
+from aoc_2023.counters import count
+
+NODE = re.compile(r"(\w\w\w) = \((\w\w\w), (\w\w\w)\)")
 
 
 def parse(raw_input: str) -> tuple[list[int], dict[str, tuple[str, str]]]:
@@ -26,9 +27,7 @@ def parse(raw_input: str) -> tuple[list[int], dict[str, tuple[str, str]]]:
 
     dirs = [int(d) for d in sdirs.replace("L", "0").replace("R", "1")]
 
-    pat = re.compile(r"(\w\w\w) = \((\w\w\w), (\w\w\w)\)")
-
-    maps = {m[1]: (m[2], m[3]) for m in pat.finditer(smaps)}
+    maps = {m[1]: (m[2], m[3]) for m in NODE.finditer(smaps)}
 
     return dirs, maps
 
@@ -60,6 +59,7 @@ def part1(dirs: list[int], maps: dict[str, tuple[str, str]]) -> int:
         steps += 1
         curr: str = maps[curr][d]
         if curr == "ZZZ":
+            count("steps", steps)
             return steps
 
         if steps == 100_000:
@@ -79,6 +79,7 @@ def n_steps(dirs: list[int], maps: dict[str, tuple[str, str]], start_node: str)
         steps += 1
         curr: str = maps[curr][d]
         if curr.endswith("Z"):
+            count("steps", steps)
             return steps
 
         if steps == 100_000:
@@ -92,30 +93,19 @@ def part2(dirs: list[int], maps: dict[str, tuple[str, str]]) -> int:
     return math.lcm(*[n_steps(dirs, maps, sn) for sn in ends_with_a])
 
 
+def parse_input(raw_input: str) -> tuple[list[int], dict[str, tuple[str, str]]]:
+    return parse(raw_input)
+
+
+def solve_part1(parsed: tuple[list[int], dict[str, tuple[str, str]]]) -> int:
+    return part1(*parsed)
+
+
+def solve_part2(parsed: tuple[list[int], dict[str, tuple[str, str]]]) -> int:
+    return part2(*parsed)
+
+
 if __name__ == "__main__":
-    from time import perf_counter_ns
-
-    # === Parse ========================================================================
-    parse_start = perf_counter_ns()
-
-    input_path = Path(__file__).parent / "input.txt"
-    raw_input = input_path.read_text()
-    dirs, maps = parse(raw_input)
-    parse_time = format_ns(perf_counter_ns() - parse_start)
-
-    # === Part 1 =======================================================================
-    p1_start = perf_counter_ns()
-    p1 = part1(dirs, maps)
-    p1_time = format_ns(perf_counter_ns() - p1_start)
-    print(f"Part 1: {p1}")
-
-    # === Part 2 =======================================================================
-    p2_start = perf_counter_ns()
-    p2 = part2(dirs, maps)
-    p2_time = format_ns(perf_counter_ns() - p2_start)
-    print(f"Part 2: {p2}")
-
-    # === Printing =====================================================================
-    print(f"\n\nSetup took {parse_time}")
-    print(f"Part 1 took {p1_time}")
-    print(f"Part 2 took {p2_time}")
+    from aoc_2023.runner import print_day
+
+    print_day(8)
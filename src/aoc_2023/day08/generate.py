@@ -0,0 +1,55 @@
+import itertools
+import random
+import string
+
+SIZES = (1_000, 2_000, 4_000, 8_000, 16_000)
+
+
+def generate(n: int, seed: int = 0) -> str:
+    """
+    A network of `n` nodes, split into chains that each run from a node ending in 'A'
+    to one ending in 'Z'. The first chain runs from AAA to ZZZ.
+
+    Going left always moves one node along the chain, and going right moves one or two,
+    so every start reaches its 'Z' whatever the instructions are. From the 'Z', both
+    directions loop back into the chain.
+    """
+    if not 2 <= n <= 26**2 * 24:
+        raise ValueError("Need between 2 and 16224 nodes")
+
+    rng = random.Random(seed)
+    n_chains = max(1, min(6, n // 50))
+
+    names = [
+        "".join(t)
+        for t in itertools.product(string.ascii_uppercase, repeat=3)
+        if t[2] not in "AZ"
+    ]
+    rng.shuffle(names)
+    others = [
+        "".join(t)
+        for t in itertools.product(string.ascii_uppercase, repeat=2)
+        if t != ("A", "A")
+    ]
+    prefixes = ["AA", *rng.sample(others, k=n_chains - 1)]
+
+    chains = [[f"{p}A"] for p in prefixes]
+    interior = iter(names)
+    for idx in range(n - 2 * n_chains):
+        chains[idx % n_chains].append(next(interior))
+    for chain, p in zip(chains, prefixes):
+        chain.append("ZZZ" if p == "AA" else f"{p}Z")
+
+    lines: list[str] = []
+    for chain in chains:
+        last = len(chain) - 1
+        for idx, node in enumerate(chain[:-1]):
+            left = chain[idx + 1]
+            right = chain[min(idx + rng.randint(1, 2), last)]
+            lines.append(f"{node} = ({left}, {right})")
+        loop_back = chain[1]
+        lines.append(f"{chain[-1]} = ({loop_back}, {loop_back})")
+    rng.shuffle(lines)
+
+    dirs = "".join(rng.choices("LR", k=rng.randint(50, 300)))
+    return dirs + "\n\n" + "\n".join(lines)
@@ -3,11 +3,15 @@ from pathlib import Path
 
 import numpy as np
 
-from aoc_2023.utils import format_ns
+from aoc_2023.ints import ints_per_line
+from aoc_2023.loader import strip
+
+# `parse_input` takes the input's bytes too. See `registry.Solution`
+READS_BYTES = True
 
 
 def parse(file: Path) -> np.ndarray:
-    return np.loadtxt(file, dtype=int)
+    return ints_per_line(file.read_text()).as_2d()
 
 
 def predict(line: np.ndarray, forward: bool = True) -> int:
@@ -41,29 +45,19 @@ def predict(line: np.ndarray, forward: bool = True) -> int:
     raise AssertionError("Too many iterations")
 
 
+def parse_input(raw_input: str | memoryview) -> np.ndarray:
+    return ints_per_line(strip(raw_input)).as_2d()
+
+
+def solve_part1(arr: np.ndarray) -> int:
+    return sum(predict(line) for line in arr)
+
+
+def solve_part2(arr: np.ndarray) -> int:
+    return sum(predict(line, False) for line in arr)
+
+
 if __name__ == "__main__":
-    from time import perf_counter_ns
-
-    # === Parse ========================================================================
-    parse_start = perf_counter_ns()
-
-    input_path = Path(__file__).parent / "input.txt"
-    arr = parse(input_path)
-    parse_time = format_ns(perf_counter_ns() - parse_start)
-
-    # === Part 1 =======================================================================
-    p1_start = perf_counter_ns()
-    p1 = sum(predict(line) for line in arr)
-    p1_time = format_ns(perf_counter_ns() - p1_start)
-    print(f"Part 1: {p1}")
-
-    # === Part 2 =======================================================================
-    p2_start = perf_counter_ns()
-    p2 = sum(predict(line, False) for line in arr)
-    p2_time = format_ns(perf_counter_ns() - p2_start)
-    print(f"Part 2: {p2}")
-
-    # === Printing =====================================================================
-    print(f"\n\nSetup took {parse_time}")
-    print(f"Part 1 took {p1_time}")
-    print(f"Part 2 took {p2_time}")
+    from aoc_2023.runner import print_day
+
+    print_day(9)
@@ -0,0 +1,18 @@
+import random
+
+SIZES = (200, 400, 800, 1_600, 3_200)
+
+
+def generate(n: int, seed: int = 0, length: int = 21) -> str:
+    """
+    `n` histories of `length` values each. Every history is a polynomial of degree 0 to
+    8 with small integer coefficients, so the differences always reach all zeros.
+    """
+    rng = random.Random(seed)
+    lines: list[str] = []
+    for _ in range(n):
+        coefs = [rng.randint(-3, 3) for _ in range(rng.randint(1, 9))]
+        values = [sum(c * x**p for p, c in enumerate(coefs)) for x in range(length)]
+        lines.append(" ".join(str(v) for v in values))
+
+    return "\n".join(lines)
@@ -1,9 +1,6 @@
 from __future__ import annotations  # Need this so class can reference itself
 
 from dataclasses import dataclass
-from pathlib import Path
-
-from aoc_2023.utils import format_ns
 
 
 def parse(raw_input: str) -> list[list[str]]:
@@ -130,30 +127,11 @@ def build_loop(arr: list[list[str]]) -> Node:
     return n0
 
 
-if __name__ == "__main__":
-    from time import perf_counter_ns
-
-    # === Parse ========================================================================
-    parse_start = perf_counter_ns()
-
-    input_path = Path(__file__).parent / "input.txt"
-    raw_input = input_path.read_text()
-    arr = parse(raw_input)
-    parse_time = format_ns(perf_counter_ns() - parse_start)
+def parse_input(raw_input: str) -> list[list[str]]:
+    return parse(raw_input)
 
-    # === Part 1 =======================================================================
-    p1_start = perf_counter_ns()
 
-    p1_time = format_ns(perf_counter_ns() - p1_start)
-    # print(f"Part 1: {p1}")
-
-    # === Part 2 =======================================================================
-    p2_start = perf_counter_ns()
-
-    p2_time = format_ns(perf_counter_ns() - p2_start)
-    # print(f"Part 2: {p2}")
+if __name__ == "__main__":
+    from aoc_2023.runner import print_day
 
-    # === Printing =====================================================================
-    print(f"\n\nSetup took {parse_time}")
-    print(f"Part 1 took {p1_time}")
-    print(f"Part 2 took {p2_time}")
+    print_day(10)
@@ -0,0 +1,33 @@
+import random
+
+PIPES = "|-LJ7F."
+
+SIZES = (140, 280, 560, 1_120, 2_240)
+
+
+def generate(n: int, seed: int = 0) -> str:
+    """
+    An `n` by `n` field of random pipes, with one rectangular loop just inside the
+    edge, and the start at its top-left corner. The tiles above and left of the start
+    are kept clear, so only the loop connects to it.
+    """
+    if n < 4:
+        raise ValueError("Need at least a 4x4 field to fit a loop in")
+
+    rng = random.Random(seed)
+    rows = [rng.choices(PIPES, k=n) for _ in range(n)]
+
+    first, last = 1, n - 2
+    for idx in range(first + 1, last):
+        rows[first][idx] = "-"
+        rows[last][idx] = "-"
+        rows[idx][first] = "|"
+        rows[idx][last] = "|"
+    rows[first][first] = "S"
+    rows[first][last] = "7"
+    rows[last][last] = "J"
+    rows[last][first] = "L"
+    rows[first - 1][first] = "."
+    rows[first][first - 1] = "."
+
+    return "\n".join("".join(row) for row in rows)
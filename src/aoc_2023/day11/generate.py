@@ -0,0 +1,30 @@
+import random
+
+SIZES = (35, 70, 140, 280, 560)
+
+
+def generate(n: int, seed: int = 0, density: float = 0.02) -> str:
+    """
+    An `n` by `n` image with roughly `density` of it galaxies, and about one in twenty
+    rows and columns left empty to be expanded.
+
+    `solve()` looks at every pair of galaxies, so the work grows with n^4.
+    """
+    rng = random.Random(seed)
+    empty_rows = set(rng.sample(range(n), k=n // 20))
+    empty_cols = set(rng.sample(range(n), k=n // 20))
+
+    lines: list[str] = []
+    for r in range(n):
+        lines.append(
+            "".join(
+                "#"
+                if r not in empty_rows
+                and c not in empty_cols
+                and rng.random() < density
+                else "."
+                for c in range(n)
+            )
+        )
+
+    return "\n".join(lines)
@@ -1,7 +1,4 @@
 from dataclasses import dataclass
-from pathlib import Path
-
-from aoc_2023.utils import format_ns
 
 
 @dataclass
@@ -32,29 +29,11 @@ class Blueprint:
     #     pass
 
 
-if __name__ == "__main__":
-    from time import perf_counter_ns
-
-    # === Parse ========================================================================
-    parse_start = perf_counter_ns()
-
-    input_path = Path(__file__).parent / "input.txt"
-    raw_input = input_path.read_text()
-    # arr = parse(raw_input)
-    parse_time = format_ns(perf_counter_ns() - parse_start)
-
-    # === Part 1 =======================================================================
-    p1_start = perf_counter_ns()
-    p1_time = format_ns(perf_counter_ns() - p1_start)
-    # print(f"Part 1: {p1}")
+def parse_input(raw_input: str) -> list[Blueprint]:
+    return [Blueprint.parse(line) for line in raw_input.splitlines()]
 
-    # === Part 2 =======================================================================
-    p2_start = perf_counter_ns()
 
-    p2_time = format_ns(perf_counter_ns() - p2_start)
-    # print(f"Part 2: {p2}")
+if __name__ == "__main__":
+    from aoc_2023.runner import print_day
 
-    # === Printing =====================================================================
-    print(f"\n\nSetup took {parse_time}")
-    print(f"Part 1 took {p1_time}")
-    print(f"Part 2 took {p2_time}")
+    print_day(12)
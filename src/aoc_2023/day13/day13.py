@@ -1,15 +1,10 @@
-from pathlib import Path
-
 import numpy as np
 
-from aoc_2023.utils import format_ns
+from aoc_2023.grid import Grid
 
 
 def parse_arr(sarr: str) -> np.ndarray:
-    return np.array(
-        [[1 if c == "#" else 0 for c in row] for row in sarr.splitlines()],
-        dtype=np.uint8,
-    )
+    return Grid.parse(sarr).mask("#").astype(np.uint8)
 
 
 def find_horz_reflection(arr: np.ndarray) -> int:
@@ -49,29 +44,15 @@ def part1(arrays: list[np.ndarray]) -> int:
     return total
 
 
+def parse_input(raw_input: str) -> list[np.ndarray]:
+    return [parse_arr(sarr) for sarr in raw_input.strip().split("\n\n")]
+
+
+def solve_part1(arrays: list[np.ndarray]) -> int:
+    return part1(arrays)
+
+
 if __name__ == "__main__":
-    from time import perf_counter_ns
-
-    # === Parse ========================================================================
-    parse_start = perf_counter_ns()
-
-    input_path = Path(__file__).parent / "input.txt"
-    raw_input = input_path.read_text()
-    arrays = [parse_arr(sarr) for sarr in raw_input.strip().split("\n\n")]
-    parse_time = format_ns(perf_counter_ns() - parse_start)
-
-    # === Part 1 =======================================================================
-    p1_start = perf_counter_ns()
-    p1 = part1(arrays)
-    p1_time = format_ns(perf_counter_ns() - p1_start)
-    print(f"Part 1: {p1}")
-
-    # === Part 2 =======================================================================
-    p2_start = perf_counter_ns()
-    p2_time = format_ns(perf_counter_ns() - p2_start)
-    # print(f"Part 2: {p2}")
-
-    # === Printing =====================================================================
-    print(f"\n\nSetup took {parse_time}")
-    print(f"Part 1 took {p1_time}")
-    print(f"Part 2 took {p2_time}")
+    from aoc_2023.runner import print_day
+
+    print_day(13)
@@ -0,0 +1,30 @@
+import random
+
+SIZES = (100, 200, 400, 800, 1_600)
+
+
+def _pattern(rng: random.Random, n_rows: int, n_cols: int) -> list[list[str]]:
+    "Random rows, with the ones either side of a random line mirrored"
+    rows = [rng.choices("#.", k=n_cols) for _ in range(n_rows)]
+    line = rng.randint(1, n_rows - 1)
+    for k in range(min(line, n_rows - line)):
+        rows[line + k] = rows[line - 1 - k].copy()
+    return rows
+
+
+def generate(n: int, seed: int = 0) -> str:
+    """
+    `n` patterns of 5 to 17 rows and columns. Each is built around one horizontal or
+    vertical line of reflection, so part 1 always finds one.
+    """
+    rng = random.Random(seed)
+    patterns: list[str] = []
+    for _ in range(n):
+        n_rows, n_cols = rng.randint(5, 17), rng.randint(5, 17)
+        if rng.random() < 0.5:
+            rows = _pattern(rng, n_rows, n_cols)
+        else:
+            rows = [list(col) for col in zip(*_pattern(rng, n_cols, n_rows))]
+        patterns.append("\n".join("".join(row) for row in rows))
+
+    return "\n\n".join(patterns)
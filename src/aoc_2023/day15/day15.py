@@ -1,9 +1,6 @@
 from collections import defaultdict
-from pathlib import Path
 from typing import NamedTuple
 
-from aoc_2023.utils import format_ns
-
 
 def HASH(s: str) -> int:
     """
@@ -37,6 +34,8 @@ def index_of(slabel: str, box: list[Lens]) -> int | None:
 
 def part2(steps: list[str]) -> int:
     """
+    Kept as the reference for `part2_dicts()`.
+
     The sequence of letters at the start of a step tells you the label of the lens.
     The result of the HASH algorithm on the label tells you the box
 
@@ -90,30 +89,52 @@ def part2(steps: list[str]) -> int:
     )
 
 
+def part2_dicts(steps: list[str]) -> int:
+    """
+    The same as `part2()`, with each box a dict of label to focal length. A dict keeps
+    its keys in the order they were first added, even when one's value is replaced, so
+    it's a box whose lenses can be found without searching it. Each label is only
+    hashed once.
+    """
+    boxes: list[dict[str, int]] = [{} for _ in range(256)]
+    hashes: dict[str, int] = {}
+
+    for stp in steps:
+        if stp.endswith("-"):
+            slabel = stp[:-1]
+            if (label := hashes.get(slabel)) is None:
+                label = hashes[slabel] = HASH(slabel)
+            boxes[label].pop(slabel, None)
+        else:
+            slabel, sfocal = stp.split("=", maxsplit=1)
+            if (label := hashes.get(slabel)) is None:
+                label = hashes[slabel] = HASH(slabel)
+            boxes[label][slabel] = int(sfocal)
+
+    return sum(
+        (box_num + 1) * (slot_num + 1) * focal
+        for box_num, box in enumerate(boxes)
+        for slot_num, focal in enumerate(box.values())
+    )
+
+
+def parse_input(raw_input: str) -> list[str]:
+    return [s for s in raw_input.strip().split(",")]
+
+
+def solve_part1(steps: list[str]) -> int:
+    return sum(HASH(step) for step in steps)
+
+
+def solve_part2(steps: list[str]) -> int:
+    return part2_dicts(steps)
+
+
+def reference_part2(steps: list[str]) -> int:
+    return part2(steps)
+
+
 if __name__ == "__main__":
-    from time import perf_counter_ns
-
-    # === Parse ========================================================================
-    parse_start = perf_counter_ns()
-
-    input_path = Path(__file__).parent / "input.txt"
-    raw_input = input_path.read_text()
-    steps = [s for s in raw_input.strip().split(",")]
-    parse_time = format_ns(perf_counter_ns() - parse_start)
-
-    # === Part 1 =======================================================================
-    p1_start = perf_counter_ns()
-    p1 = sum(HASH(step) for step in steps)
-    p1_time = format_ns(perf_counter_ns() - p1_start)
-    print(f"Part 1: {p1}")
-
-    # === Part 2 =======================================================================
-    p2_start = perf_counter_ns()
-    p2 = part2(steps)
-    p2_time = format_ns(perf_counter_ns() - p2_start)
-    print(f"Part 2: {p2}")
-
-    # === Printing =====================================================================
-    print(f"\n\nSetup took {parse_time}")
-    print(f"Part 1 took {p1_time}")
-    print(f"Part 2 took {p2_time}")
+    from aoc_2023.runner import print_day
+
+    print_day(15)
@@ -0,0 +1,26 @@
+import random
+import string
+
+SIZES = (4_000, 8_000, 16_000, 32_000, 64_000)
+
+
+def generate(n: int, seed: int = 0) -> str:
+    """
+    An initialization sequence of `n` steps. Labels are drawn from a pool of about a
+    third as many labels as steps, so lenses get replaced and removed as well as added.
+    """
+    rng = random.Random(seed)
+    labels = [
+        "".join(rng.choices(string.ascii_lowercase, k=rng.randint(2, 6)))
+        for _ in range(n // 3 + 1)
+    ]
+
+    steps: list[str] = []
+    for _ in range(n):
+        label = rng.choice(labels)
+        if rng.random() < 0.3:
+            steps.append(f"{label}-")
+        else:
+            steps.append(f"{label}={rng.randint(1, 9)}")
+
+    return ",".join(steps)
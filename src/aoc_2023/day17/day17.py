@@ -1,31 +1,14 @@
-from pathlib import Path
+import numpy as np
 
-from aoc_2023.utils import format_ns
 
-if __name__ == "__main__":
-    from time import perf_counter_ns
-
-    # === Parse ========================================================================
-    parse_start = perf_counter_ns()
-
-    input_path = Path(__file__).parent / "input.txt"
-    raw_input = input_path.read_text()
-    steps = [s for s in raw_input.strip().split(",")]
-    parse_time = format_ns(perf_counter_ns() - parse_start)
+def parse_input(raw_input: str) -> np.ndarray:
+    "Each digit is the heat lost by entering that city block"
+    return np.array(
+        [[int(c) for c in line] for line in raw_input.splitlines()], dtype=np.int8
+    )
 
-    # === Part 1 =======================================================================
-    p1_start = perf_counter_ns()
 
-    p1_time = format_ns(perf_counter_ns() - p1_start)
-    # print(f"Part 1: {p1}")
-
-    # === Part 2 =======================================================================
-    p2_start = perf_counter_ns()
-
-    p2_time = format_ns(perf_counter_ns() - p2_start)
-    # print(f"Part 2: {p2}")
+if __name__ == "__main__":
+    from aoc_2023.runner import print_day
 
-    # === Printing =====================================================================
-    print(f"\n\nSetup took {parse_time}")
-    print(f"Part 1 took {p1_time}")
-    print(f"Part 2 took {p2_time}")
+    print_day(17)
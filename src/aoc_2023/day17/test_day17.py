@@ -0,0 +1,11 @@
+from aoc_2023.day17.day17 import parse_input
+
+
+def test_parse_input():
+    raw_input = """2413
+3215
+3255"""
+    got = parse_input(raw_input)
+    assert (3, 4) == got.shape
+    assert [2, 4, 1, 3] == got[0].tolist()
+    assert 3 == got[2, 0]
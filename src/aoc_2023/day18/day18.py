@@ -1,9 +1,9 @@
-from pathlib import Path
-from typing import NamedTuple
+from typing import TYPE_CHECKING, NamedTuple
 
-import polars as pl
+from aoc_2023.counters import count
 
-from aoc_2023.utils import format_ns
+if TYPE_CHECKING:
+    import polars as pl
 
 
 class Instruction(NamedTuple):
@@ -19,7 +19,7 @@ class Instruction(NamedTuple):
         )
 
 
-def dig_trench(instructions: list[Instruction]) -> pl.DataFrame:
+def dig_trench(instructions: list[Instruction]) -> "pl.DataFrame":
     """
     Will have columns:
     - row
@@ -53,12 +53,14 @@ def dig_trench(instructions: list[Instruction]) -> pl.DataFrame:
                 ])
                 row += inst.cnt
 
+    import polars as pl
+
     return pl.DataFrame(
         data=pts_visited, schema=["row", "col", "hexcode"], orient="row"
     ).sort("row", "col")
 
 
-def part1(lake_boundary: pl.DataFrame) -> int:
+def part1(trench: "pl.DataFrame | pl.LazyFrame") -> int:
     """
     Count how many cubic meters of lava fit in the filled in shape described by the
     trech boundary.
@@ -68,6 +70,9 @@ def part1(lake_boundary: pl.DataFrame) -> int:
 
     When an edge is found, add it to seen, but don't get its neighbors
     """
+    # The colors aren't needed, so a scan of a cached trench never reads them
+    lake_boundary = trench.lazy().select("row", "col").collect()
+
     # Where's the middle? (row, col)
     srow = int(lake_boundary["row"].mean())  # type: ignore
     scol = int(lake_boundary["col"].mean())  # type: ignore
@@ -89,6 +94,7 @@ def part1(lake_boundary: pl.DataFrame) -> int:
     )
 
     while len(frontier) > 0:
+        count("frontier", len(frontier))
         # Add everything on the frontier to seen
         seen.update(frontier)
 
@@ -105,30 +111,17 @@ def part1(lake_boundary: pl.DataFrame) -> int:
     return len(seen)
 
 
-if __name__ == "__main__":
-    from time import perf_counter_ns
+def parse_input(raw_input: str) -> "pl.LazyFrame":
+    "Lazy, so that a `cache.ParseCache` keeps it as parquet"
+    instructions = [Instruction.parse(line) for line in raw_input.splitlines()]
+    return dig_trench(instructions).lazy()
 
-    # === Parse ========================================================================
-    parse_start = perf_counter_ns()
 
-    input_path = Path(__file__).parent / "input.txt"
-    raw_input = input_path.read_text()
-    instructions = [Instruction.parse(line) for line in raw_input.splitlines()]
-    trench = dig_trench(instructions)
-    parse_time = format_ns(perf_counter_ns() - parse_start)
-
-    # === Part 1 =======================================================================
-    p1_start = perf_counter_ns()
-    p1 = part1(trench)
-    p1_time = format_ns(perf_counter_ns() - p1_start)
-    print(f"Part 1: {p1}")
-
-    # === Part 2 =======================================================================
-    p2_start = perf_counter_ns()
-    p2_time = format_ns(perf_counter_ns() - p2_start)
-    # print(f"Part 2: {p2}")
-
-    # === Printing =====================================================================
-    print(f"\n\nSetup took {parse_time}")
-    print(f"Part 1 took {p1_time}")
-    print(f"Part 2 took {p2_time}")
+def solve_part1(trench: "pl.LazyFrame") -> int:
+    return part1(trench)
+
+
+if __name__ == "__main__":
+    from aoc_2023.runner import print_day
+
+    print_day(18)
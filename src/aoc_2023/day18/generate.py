@@ -0,0 +1,38 @@
+import random
+
+SIZES = (50, 100, 200, 400, 800)
+
+# Going clockwise round a square, the direction along each side, the direction that
+# points out of the shape, and back in again
+SIDES = (("R", "U", "D"), ("D", "R", "L"), ("L", "D", "U"), ("U", "L", "R"))
+
+
+def generate(n: int, seed: int = 0) -> str:
+    """
+    A dig plan for a lagoon that is an `n` by `n` square with rectangular bumps
+    sticking out of its sides.
+
+    Bumps are at least two wide, with at least two meters of straight edge between
+    them, so no two parts of the trench touch. They stick out by at most a quarter of
+    `n`, so the middle of the trench, where part 1 starts filling in from, is always
+    inside the lagoon.
+    """
+    if n < 8:
+        raise ValueError("Need a square of at least 8 meters")
+
+    rng = random.Random(seed)
+    steps: list[tuple[str, int]] = []
+    for along, out, back in SIDES:
+        remaining = n
+        while remaining > 0:
+            straight = min(remaining, rng.randint(2, n // 4))
+            steps.append((along, straight))
+            remaining -= straight
+
+            width = rng.randint(2, max(2, n // 6))
+            if remaining - width >= 2 and rng.random() < 0.5:
+                depth = rng.randint(1, n // 4)
+                steps.extend([(out, depth), (along, width), (back, depth)])
+                remaining -= width
+
+    return "\n".join(f"{d} {cnt} (#{rng.randrange(16**6):06x})" for d, cnt in steps)
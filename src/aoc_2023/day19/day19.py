@@ -1,8 +1,5 @@
-from pathlib import Path
 from typing import NamedTuple
 
-from aoc_2023.utils import format_ns
-
 
 class Part(NamedTuple):
     x: int
@@ -23,28 +20,6 @@ class Part(NamedTuple):
 
 
 if __name__ == "__main__":
-    from time import perf_counter_ns
-
-    # === Parse ========================================================================
-    parse_start = perf_counter_ns()
-
-    input_path = Path(__file__).parent / "input.txt"
-    raw_input = input_path.read_text()
-
-    parse_time = format_ns(perf_counter_ns() - parse_start)
-
-    # === Part 1 =======================================================================
-    p1_start = perf_counter_ns()
-
-    p1_time = format_ns(perf_counter_ns() - p1_start)
-    # print(f"Part 1: {p1}")
-
-    # === Part 2 =======================================================================
-    p2_start = perf_counter_ns()
-    p2_time = format_ns(perf_counter_ns() - p2_start)
-    # print(f"Part 2: {p2}")
+    from aoc_2023.runner import print_day
 
-    # === Printing =====================================================================
-    print(f"\n\nSetup took {parse_time}")
-    print(f"Part 1 took {p1_time}")
-    print(f"Part 2 took {p2_time}")
+    print_day(19)
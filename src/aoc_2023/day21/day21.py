@@ -1,9 +1,8 @@
-from pathlib import Path
-
 import numpy as np
-import scipy.sparse
 
-from aoc_2023.utils import format_ns
+from aoc_2023.graph import Graph
+from aoc_2023.grid import Grid, pad
+from aoc_2023.utils import span
 
 
 def parse_arr(raw_input: str) -> tuple[tuple[int, int], np.ndarray]:
@@ -26,25 +25,8 @@ def parse_arr(raw_input: str) -> tuple[tuple[int, int], np.ndarray]:
     Return position of 'S', and an array of booleans, True where you can go, and False
     otherwise.
     """
-    # First find the start position
-    start_pos = (-1, -1)
-    for ridx, line in enumerate(raw_input.splitlines()):
-        if "S" in line:
-            cidx = line.index("S")
-            start_pos = (ridx, cidx)
-    if start_pos == (-1, -1):
-        raise AssertionError("Could not find start position")
-
-    # Create the array
-    arr = np.array(
-        [
-            [True if c == "." else False for c in line]
-            for line in raw_input.replace("S", ".").splitlines()
-        ],
-        dtype=bool,
-    )
-
-    return start_pos, arr
+    grid = Grid.parse(raw_input)
+    return grid.find("S"), grid.mask(".S")
 
 
 def to_1d(n_cols: int, ridx: int, cidx: int) -> int:
@@ -59,42 +41,45 @@ def part1(start_idx: tuple[int, int], arr: np.ndarray, n_steps: int = 64) -> int
     Want to know how many different places can be reached after n_steps.
     Assuming that you can only step onto array positions that are `True`.
 
+    Anywhere `k` steps away can be reached in exactly n_steps if k <= n_steps, and k
+    has the same parity as n_steps, by stepping back and forth on the way. So a breadth
+    first search from the start, going no further than n_steps, is enough. Unless
+    there's nowhere to step at all.
+    """
+    padded = pad(arr, False)
+    graph = Graph.from_grid(padded)
+    start = padded.index(*start_idx)
+    if n_steps > 0 and len(graph.neighbours(start)) == 0:
+        return 0
+    with span("bfs"):
+        dist = graph.bfs(start, max_depth=n_steps)
+    return int(((dist >= 0) & (dist % 2 == n_steps % 2)).sum())
+
+
+def part1_markov(start_idx: tuple[int, int], arr: np.ndarray, n_steps: int = 64) -> int:
+    """
+    The same as `part1()`, and kept to check it against, but slower.
+
     Try using Markov chains for this. Create a table `P`, where each row represents
     where you are coming from, and each column represents where you are going to.
     Then can use the property that Pn = a*P^n, where a is the starting state.
     """
-    # Create the array P. Because each row represents a 2D index, use row-major indexing
-    # to flatten the 2D indices to 1D
-    side_len_P = np.prod(arr.shape)
-    ncols = arr.shape[1]
-
-    DIRS = (
-        (-1, 0),
-        (0, 1),
-        (1, 0),
-        (0, -1),
-    )
+    # Create the array P. Each row and column is the flat index of a cell in the padded
+    # array, whose border is never True, so no neighbor is ever out of bounds
+    padded = pad(arr, False)
+    side_len_P = padded.flat.size
+
     # For each element of arr, look at its neighbors. If a given neighbor is True, give
     # that idx a value
-    rows: list[int] = []
-    cols: list[int] = []
-    vals: list[float] = []
-    for ridx, row in enumerate(arr):
-        for cidx, item in enumerate(row):
-            for d in DIRS:
-                try:
-                    nbr_idx = (d[0] + ridx, d[1] + cidx)
-                    if any(ni < 0 for ni in nbr_idx):
-                        continue
-                    nbr = arr[nbr_idx]
-                    if nbr:
-                        # Row represents where we're coming from
-                        rows.append(to_1d(ncols, ridx, cidx))
-                        # Column represents where we're going to
-                        cols.append(to_1d(ncols, nbr_idx[0], nbr_idx[1]))
-                        vals.append(0.99)
-                except Exception:
-                    continue
+    cells = padded.inner()
+    nbrs = padded.neighbours(cells)
+    can_go = padded.flat[nbrs]
+    # Row represents where we're coming from, column where we're going to
+    rows = np.broadcast_to(cells[:, None], nbrs.shape)[can_go]
+    cols = nbrs[can_go]
+    vals = np.full(rows.size, 0.99)
+
+    import scipy.sparse
 
     P = scipy.sparse.coo_matrix(
         (vals, (rows, cols)), shape=(side_len_P, side_len_P)
@@ -102,9 +87,10 @@ def part1(start_idx: tuple[int, int], arr: np.ndarray, n_steps: int = 64) -> int
 
     # Create the start position
     a = np.zeros((1, side_len_P))
-    a[0, to_1d(ncols, start_idx[0], start_idx[1])] = 1
+    a[0, padded.index(*start_idx)] = 1
 
-    Pn = a @ sparse_mat_power(P, n_steps)
+    with span("matrix_power"):
+        Pn = a @ sparse_mat_power(P, n_steps)
 
     return (Pn > 0).sum()
 
@@ -117,29 +103,21 @@ def sparse_mat_power(mat, power: int):
     return result
 
 
+def parse_input(raw_input: str) -> tuple[tuple[int, int], np.ndarray]:
+    return parse_arr(raw_input)
+
+
+def solve_part1(parsed: tuple[tuple[int, int], np.ndarray]) -> int:
+    start_idx, arr = parsed
+    return part1(start_idx, arr)
+
+
+def reference_part1(parsed: tuple[tuple[int, int], np.ndarray]) -> int:
+    start_idx, arr = parsed
+    return part1_markov(start_idx, arr)
+
+
 if __name__ == "__main__":
-    from time import perf_counter_ns
-
-    # === Parse ========================================================================
-    parse_start = perf_counter_ns()
-
-    input_path = Path(__file__).parent / "input.txt"
-    raw_input = input_path.read_text()
-    start_idx, arr = parse_arr(raw_input)
-    parse_time = format_ns(perf_counter_ns() - parse_start)
-
-    # === Part 1 =======================================================================
-    p1_start = perf_counter_ns()
-    p1 = part1(start_idx, arr)
-    p1_time = format_ns(perf_counter_ns() - p1_start)
-    print(f"Part 1: {p1}")
-
-    # === Part 2 =======================================================================
-    p2_start = perf_counter_ns()
-    p2_time = format_ns(perf_counter_ns() - p2_start)
-    # print(f"Part 2: {p2}")
-
-    # === Printing =====================================================================
-    print(f"\n\nSetup took {parse_time}")
-    print(f"Part 1 took {p1_time}")
-    print(f"Part 2 took {p2_time}")
+    from aoc_2023.runner import print_day
+
+    print_day(21)
@@ -0,0 +1,28 @@
+import random
+
+SIZES = (11, 21, 41, 81)
+
+
+def generate(n: int, seed: int = 0, rocks: float = 0.12) -> str:
+    """
+    An `n` by `n` garden, with the start in the middle, and about `rocks` of the other
+    plots covered in rocks. The start's neighbours are always clear.
+    """
+    rng = random.Random(seed)
+    mid = n // 2
+    clear = {(mid, mid), (mid - 1, mid), (mid + 1, mid), (mid, mid - 1), (mid, mid + 1)}
+
+    lines: list[str] = []
+    for r in range(n):
+        lines.append(
+            "".join(
+                "S"
+                if (r, c) == (mid, mid)
+                else "#"
+                if (r, c) not in clear and rng.random() < rocks
+                else "."
+                for c in range(n)
+            )
+        )
+
+    return "\n".join(lines)
@@ -1,6 +1,6 @@
 import pytest
 
-from aoc_2023.day21.day21 import parse_arr, part1, to_1d
+from aoc_2023.day21.day21 import parse_arr, part1, part1_markov, to_1d
 
 tarr = [[0, 1, 2], [3, 4, 5], [6, 7, 8]]
 params = [(3, ridx, cidx, tarr[ridx][cidx]) for ridx in range(3) for cidx in range(3)]
@@ -15,9 +15,7 @@ def test_to_1d(n_cols, ridx, cidx, want):
 p1_params = [(1, 2), (2, 4), (3, 6), (6, 16)]
 
 
-@pytest.mark.parametrize("n_steps, want", p1_params)
-def test_part1(n_steps, want):
-    raw_input = """...........
+raw_input = """...........
 .....###.#.
 .###.##..#.
 ..#.#...#..
@@ -28,6 +26,17 @@ def test_part1(n_steps, want):
 .##.#.####.
 .##..##.##.
 ..........."""
+
+
+@pytest.mark.parametrize("n_steps, want", p1_params)
+def test_part1(n_steps, want):
     start_idx, arr = parse_arr(raw_input)
     got = part1(start_idx=start_idx, arr=arr, n_steps=n_steps)
     assert want == got
+
+
+@pytest.mark.parametrize("n_steps, want", p1_params)
+def test_part1_markov(n_steps, want):
+    start_idx, arr = parse_arr(raw_input)
+    got = part1_markov(start_idx=start_idx, arr=arr, n_steps=n_steps)
+    assert want == got
@@ -1,9 +1,11 @@
-from pathlib import Path
+from dataclasses import dataclass
 from typing import NamedTuple
 
-import networkx as nx
+import numpy as np
 
-from aoc_2023.utils import format_ns
+from aoc_2023.graph import Graph
+from aoc_2023.grid import NEIGHBOURS4
+from aoc_2023.utils import span
 
 
 class P(NamedTuple):
@@ -14,6 +16,24 @@ class P(NamedTuple):
         return P(self.r + other.r, self.c + other.c)
 
 
+DIRS = tuple(P(*d) for d in NEIGHBOURS4)
+
+
+@dataclass(frozen=True)
+class Trails:
+    "The trails as a `Graph`, and the node number of each position on them"
+
+    graph: Graph
+    index: dict[P, int]
+
+    @classmethod
+    def from_edges(cls, nodes: dict[P, str], edges: list[tuple[P, P]]) -> "Trails":
+        index = {n: i for i, n in enumerate(nodes)}
+        sources = [index[frm] for frm, _ in edges]
+        targets = [index[to] for _, to in edges]
+        return cls(Graph.from_edges(len(index), sources, targets), index)
+
+
 def get_nodes(
     raw_input: str, replace_slopes: bool = False
 ) -> tuple[P, P, dict[P, str]]:
@@ -43,20 +63,13 @@ def get_nodes(
     return snode, enode, nodes
 
 
-def build_p1_graph(nodes: dict[P, str]) -> nx.DiGraph:
+def build_p1_graph(nodes: dict[P, str]) -> Trails:
     """
     Connect each node to any neighbors if both are '.'.
     If node is a slope (<, >, ^, v), can connect to neighbor it points to, but that
     neighbor can't connect to it.
     """
-    DIRS = (
-        P(-1, 0),
-        P(0, 1),
-        P(1, 0),
-        P(0, -1),
-    )
-
-    g = nx.DiGraph()
+    edges: list[tuple[P, P]] = []
 
     for n, frm in nodes.items():
         for d in DIRS:
@@ -67,78 +80,65 @@ def build_p1_graph(nodes: dict[P, str]) -> nx.DiGraph:
             match (frm, d, to):
                 # If '<' and d is left of `n`, and can go into `to`
                 case ("<", P(0, -1), to) if to != ">":
-                    g.add_edge(n, n + d)
+                    edges.append((n, n + d))
                 case (".", P(0, -1), to) if to != ">":
-                    g.add_edge(n, n + d)
+                    edges.append((n, n + d))
                 case (">", P(0, 1), to) if to != "<":
-                    g.add_edge(n, n + d)
+                    edges.append((n, n + d))
                 case (".", P(0, 1), to) if to != "<":
-                    g.add_edge(n, n + d)
+                    edges.append((n, n + d))
                 case ("^", P(-1, 0), to) if to != "v":
-                    g.add_edge(n, n + d)
+                    edges.append((n, n + d))
                 case (".", P(-1, 0), to) if to != "v":
-                    g.add_edge(n, n + d)
+                    edges.append((n, n + d))
                 case ("v", P(1, 0), to) if to != "^":
-                    g.add_edge(n, n + d)
+                    edges.append((n, n + d))
                 case (".", P(1, 0), to) if to != "^":
-                    g.add_edge(n, n + d)
+                    edges.append((n, n + d))
 
-    return g
+    return Trails.from_edges(nodes, edges)
 
 
-def build_p2_graph(nodes: dict[P, str]) -> nx.DiGraph:
+def build_p2_graph(nodes: dict[P, str]) -> Trails:
     """
     Connect each node to any neighbors if both are '.'. Slopes have been removed.
     """
-    DIRS = (
-        P(-1, 0),
-        P(0, 1),
-        P(1, 0),
-        P(0, -1),
-    )
+    edges = [(n, n + d) for n in nodes for d in DIRS if n + d in nodes]
+    return Trails.from_edges(nodes, edges)
 
-    g = nx.DiGraph()
 
-    for n in nodes.keys():
-        for d in DIRS:
-            if n + d not in nodes:
-                continue
-            g.add_edge(n, n + d)
-    return g
+def longest_path(trails: Trails, snode: P, enode: P) -> int:
+    """
+    What's the longest path from snode to enode
+
+    Only the junctions, where there's more than one way to go, and the two ends matter,
+    so contract every trail between them to one edge, then try every path.
+    """
+    index = trails.index
+    keep = np.zeros(trails.graph.n_nodes, dtype=bool)
+    for n, i in index.items():
+        keep[i] = sum(n + d in index for d in DIRS) >= 3
+    keep[[index[snode], index[enode]]] = True
 
+    with span("contract"):
+        junctions, kept = trails.graph.contract(keep)
+    renumber = {n: i for i, n in enumerate(kept.tolist())}
+    return junctions.longest_path(renumber[index[snode]], renumber[index[enode]])
 
-def longest_path(g: nx.DiGraph, snode: P, enode: P) -> int:
-    """What's the longest path from snode to enode"""
-    return max(len(p) for p in nx.all_simple_edge_paths(g, snode, enode))
+
+def parse_input(raw_input: str) -> tuple[P, P, dict[P, str]]:
+    return get_nodes(raw_input)
+
+
+def solve_part1(parsed: tuple[P, P, dict[P, str]]) -> int:
+    snode, enode, nodes = parsed
+    with span("build_graph"):
+        g = build_p1_graph(nodes)
+    with span("longest_path"):
+        return longest_path(g, snode, enode)
 
 
 if __name__ == "__main__":
-    from time import perf_counter_ns
-
-    # === Parse ========================================================================
-    parse_start = perf_counter_ns()
-
-    input_path = Path(__file__).parent / "input.txt"
-    raw_input = input_path.read_text()
-    snode, enode, nodes = get_nodes(raw_input)
-    parse_time = format_ns(perf_counter_ns() - parse_start)
-
-    # === Part 1 =======================================================================
-    p1_start = perf_counter_ns()
-    g = build_p1_graph(nodes)
-    p1 = longest_path(g, snode, enode)
-    p1_time = format_ns(perf_counter_ns() - p1_start)
-    print(f"Part 1: {p1}")
-
-    # === Part 2 =======================================================================
-    p2_start = perf_counter_ns()
-    snode, enode, nodes = get_nodes(raw_input, replace_slopes=True)
-    g = build_p2_graph(nodes)
-    p2 = longest_path(g, snode, enode)
-    p2_time = format_ns(perf_counter_ns() - p2_start)
-    # print(f"Part 2: {p2}")
-
-    # === Printing =====================================================================
-    print(f"\n\nSetup took {parse_time}")
-    print(f"Part 1 took {p1_time}")
-    print(f"Part 2 took {p2_time}")
+    from aoc_2023.runner import print_day
+
+    print_day(23)
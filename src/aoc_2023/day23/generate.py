@@ -0,0 +1,44 @@
+import random
+
+SIZES = (3, 4, 5, 6, 7)
+
+
+def generate(n: int, seed: int = 0, spacing: int = 4) -> str:
+    """
+    A maze of `n` by `n` junctions, joined by paths `spacing` apart. Every path out of a
+    junction starts with a slope pointing right or down, so part 1 can only ever go
+    right or down, and has up to (2n - 2) choose (n - 1) hikes to try.
+
+    Paths off a random right-and-down route from the first junction to the last are
+    sometimes left out, to make each seed a different maze.
+    """
+    if n < 2 or spacing < 3:
+        raise ValueError("Need at least 2x2 junctions, at least 3 apart")
+
+    rng = random.Random(seed)
+    size = (n - 1) * spacing + 3
+    rows = [["#"] * size for _ in range(size)]
+
+    # One route that always gets through, as a set of (junction, direction) segments
+    route: set[tuple[int, int, str]] = set()
+    r = c = 0
+    for d in rng.sample(["R"] * (n - 1) + ["D"] * (n - 1), k=2 * (n - 1)):
+        route.add((r, c, d))
+        r, c = (r, c + 1) if d == "R" else (r + 1, c)
+
+    for jr in range(n):
+        for jc in range(n):
+            row, col = 1 + jr * spacing, 1 + jc * spacing
+            rows[row][col] = "."
+            for d, slope, dr, dc in (("R", ">", 0, 1), ("D", "v", 1, 0)):
+                if (d == "R" and jc == n - 1) or (d == "D" and jr == n - 1):
+                    continue
+                if (jr, jc, d) not in route and rng.random() < 0.2:
+                    continue
+                rows[row + dr][col + dc] = slope
+                for k in range(2, spacing):
+                    rows[row + k * dr][col + k * dc] = "."
+
+    rows[0][1] = "."
+    rows[size - 1][size - 2] = "."
+    return "\n".join("".join(row) for row in rows)
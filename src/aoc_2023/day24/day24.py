@@ -1,8 +1,13 @@
 from itertools import combinations
-from pathlib import Path
 from typing import NamedTuple
 
-from aoc_2023.utils import format_ns
+import numpy as np
+
+from aoc_2023.ints import ints_per_line
+from aoc_2023.loader import strip
+
+# `parse_input` takes the input's bytes too. See `registry.Solution`
+READS_BYTES = True
 
 
 class Ray(NamedTuple):
@@ -87,30 +92,20 @@ def part1(rays: list[Ray], minmax: tuple[int, int]) -> int:
     )
 
 
-if __name__ == "__main__":
-    from time import perf_counter_ns
-
-    # === Parse ========================================================================
-    parse_start = perf_counter_ns()
+def parse_input(raw_input: str | memoryview) -> np.ndarray:
+    """
+    One hailstone per row, in the order of `Ray`'s fields. An array rather than `Ray`s,
+    so that a `cache.ParseCache` keeps it as .npy, not a pickle
+    """
+    return ints_per_line(strip(raw_input)).as_2d()
 
-    input_path = Path(__file__).parent / "input.txt"
-    raw_input = input_path.read_text()
-    rays = [Ray.parse(line) for line in raw_input.splitlines()]
-    parse_time = format_ns(perf_counter_ns() - parse_start)
 
-    # === Part 1 =======================================================================
-    p1_start = perf_counter_ns()
-    p1 = part1(rays, minmax=(200000000000000, 400000000000000))
-    p1_time = format_ns(perf_counter_ns() - p1_start)
-    print(f"Part 1: {p1}")
+def solve_part1(hail: np.ndarray) -> int:
+    rays = [Ray(*row) for row in hail.tolist()]
+    return part1(rays, minmax=(200000000000000, 400000000000000))
 
-    # === Part 2 =======================================================================
-    p2_start = perf_counter_ns()
 
-    p2_time = format_ns(perf_counter_ns() - p2_start)
-    # print(f"Part 2: {p2}")
+if __name__ == "__main__":
+    from aoc_2023.runner import print_day
 
-    # === Printing =====================================================================
-    print(f"\n\nSetup took {parse_time}")
-    print(f"Part 1 took {p1_time}")
-    print(f"Part 2 took {p2_time}")
+    print_day(24)
@@ -0,0 +1,22 @@
+import random
+
+SIZES = (300, 600, 1_200, 2_400)
+
+
+def generate(n: int, seed: int = 0) -> str:
+    """
+    `n` hailstones, starting around the test area of part 1. No hailstone has an x
+    velocity of 0, since the slope in `Ray.intersects()` would divide by it.
+    """
+    rng = random.Random(seed)
+    lines: list[str] = []
+    for _ in range(n):
+        pos = [rng.randint(150_000_000_000_000, 450_000_000_000_000) for _ in range(3)]
+        vel = [rng.choice([-1, 1]) * rng.randint(1, 400)] + [
+            rng.randint(-400, 400) for _ in range(2)
+        ]
+        lines.append(
+            ", ".join(str(p) for p in pos) + " @ " + ", ".join(f"{v:>3}" for v in vel)
+        )
+
+    return "\n".join(lines)
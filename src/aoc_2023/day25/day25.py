@@ -1,12 +1,7 @@
-from pathlib import Path
+from aoc_2023.graph import Graph
 
-import numpy as np
-from scipy.sparse import csr_array
 
-from aoc_2023.utils import format_ns
-
-
-def parse_into_matrix(input_str: str) -> tuple[csr_array, list[str]]:
+def parse_into_graph(input_str: str) -> tuple[Graph, list[str]]:
     """
     Inputs look like
 
@@ -24,7 +19,7 @@ def parse_into_matrix(input_str: str) -> tuple[csr_array, list[str]]:
     rzs: qnr cmg lsr rsh
     frs: qnr lhk lsr
 
-    Where each line is a two-way connection. Want to create a connections matrix
+    Where each line is a two-way connection. Want to create a graph of the connections
     """
     # First get a dict of all the nodes, mapped to indexes
     nodes: dict[str, int] = {
@@ -34,46 +29,24 @@ def parse_into_matrix(input_str: str) -> tuple[csr_array, list[str]]:
         )
     }
 
-    # Create a connections matrix
-    arr = np.full(shape=(len(nodes), len(nodes)), dtype=bool, fill_value=False)
-
-    # Add the connections to a matrix
+    # Add the connections, in both directions
+    heads: list[int] = []
+    tails: list[int] = []
     for line in input_str.splitlines():
         head, tail = line.split(":", maxsplit=1)
-        hidx = nodes[head]
-        rest = tail.split()
-        for r in rest:
-            ridx = nodes[r]
-            # Add the connections on both sides of the diagonal
-            arr[hidx, ridx] = True
-            arr[ridx, hidx] = True
+        for r in tail.split():
+            heads.append(nodes[head])
+            tails.append(nodes[r])
 
-    return csr_array(arr), sorted(nodes.keys())
+    graph = Graph.from_edges(len(nodes), heads, tails, undirected=True)
+    return graph, sorted(nodes.keys())
 
 
-if __name__ == "__main__":
-    from time import perf_counter_ns
-
-    # === Parse ========================================================================
-    parse_start = perf_counter_ns()
+def parse_input(raw_input: str) -> tuple[Graph, list[str]]:
+    return parse_into_graph(raw_input)
 
-    input_path = Path(__file__).parent / "input.txt"
-    raw_input = input_path.read_text()
-    parse_time = format_ns(perf_counter_ns() - parse_start)
 
-    # === Part 1 =======================================================================
-    p1_start = perf_counter_ns()
-
-    p1_time = format_ns(perf_counter_ns() - p1_start)
-    # print(f"Part 1: {p1}")
-
-    # === Part 2 =======================================================================
-    p2_start = perf_counter_ns()
-
-    p2_time = format_ns(perf_counter_ns() - p2_start)
-    # print(f"Part 2: {p2}")
+if __name__ == "__main__":
+    from aoc_2023.runner import print_day
 
-    # === Printing =====================================================================
-    print(f"\n\nSetup took {parse_time}")
-    print(f"Part 1 took {p1_time}")
-    print(f"Part 2 took {p2_time}")
+    print_day(25)
@@ -0,0 +1,41 @@
+import itertools
+import random
+import string
+
+SIZES = (500, 1_000, 2_000, 4_000)
+
+
+def generate(n: int, seed: int = 0) -> str:
+    """
+    A wiring diagram of `n` components in two connected halves, with exactly three
+    wires between the halves. Each wire is listed once, under one of its ends.
+    """
+    if not 4 <= n <= 26**3:
+        raise ValueError("Need between 4 and 17576 components")
+
+    rng = random.Random(seed)
+    names = rng.sample(
+        ["".join(t) for t in itertools.product(string.ascii_lowercase, repeat=3)], k=n
+    )
+    halves = (names[: n // 2], names[n // 2 :])
+
+    wires: list[tuple[str, str]] = []
+    for half in halves:
+        # Wiring every component to a few earlier ones keeps each half connected
+        for idx in range(1, len(half)):
+            for other in rng.sample(half[:idx], k=min(idx, rng.randint(1, 3))):
+                wires.append((half[idx], other))
+    cut: set[tuple[str, str]] = set()
+    while len(cut) < 3:
+        cut.add((rng.choice(halves[0]), rng.choice(halves[1])))
+    wires.extend(sorted(cut))
+
+    listed: dict[str, list[str]] = {}
+    for a, b in wires:
+        if b in listed.get(a, ()) or a in listed.get(b, ()):
+            continue
+        listed.setdefault(a, []).append(b)
+
+    lines = [f"{head}: {' '.join(tail)}" for head, tail in listed.items()]
+    rng.shuffle(lines)
+    return "\n".join(lines)
@@ -0,0 +1,25 @@
+from aoc_2023.day25.day25 import parse_into_graph
+
+
+def test_parse_into_graph():
+    raw_input = """jqt: rhn xhk nvd
+rsh: frs pzl lsr
+xhk: hfx
+cmg: qnr nvd lhk bvb
+rhn: xhk bvb hfx
+bvb: xhk hfx
+pzl: lsr hfx nvd
+qnr: nvd
+ntq: jqt hfx bvb xhk
+nvd: lhk
+lsr: lhk
+rzs: qnr cmg lsr rsh
+frs: qnr lhk lsr"""
+    graph, names = parse_into_graph(raw_input)
+    assert 15 == graph.n_nodes == len(names)
+    # Each of the 33 connections goes both ways
+    assert 66 == len(graph.targets)
+    jqt = names.index("jqt")
+    assert ["ntq", "nvd", "rhn", "xhk"] == sorted(
+        names[n] for n in graph.neighbours(jqt)
+    )
@@ -0,0 +1,158 @@
+"""
+Check each faster solver against the simpler one it replaced, kept as the day's
+`reference_partN()` (see `registry.Solution`), on randomly generated inputs.
+
+When they give different answers, the input is shrunk, a piece at a time, to the
+smallest one that still shows the difference, which is what gets reported.
+"""
+
+import math
+import random
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+from types import ModuleType
+
+from aoc_2023.generators import discover_generators, load_generator
+from aoc_2023.registry import discover_days, get_day, load
+from aoc_2023.runner import as_answer
+
+# What an input is shrunk by removing pieces of. The first that splits it in more than
+# one piece is used, so lines, or the steps of an input that's one line
+SEPARATORS = ("\n", ",")
+
+
+@dataclass(frozen=True)
+class Mismatch:
+    day: int
+    part: str
+    seed: int
+    size: int
+    # The smallest input found that still gives different answers
+    raw_input: str
+    fast: int | str
+    reference: int | str
+
+    def describe(self) -> str:
+        return (
+            f"day{self.day:02}.{self.part}: solve_{self.part} gave {self.fast}, "
+            f"reference_{self.part} gave {self.reference}, on this input (shrunk from "
+            f"a generated one, size {self.size}, seed {self.seed}):\n{self.raw_input}"
+        )
+
+
+def _solve(module: ModuleType, fn: str, part: str, raw_input: str) -> int | str:
+    "Parsed afresh for each solver, since some modify their input"
+    if part == "part2" and hasattr(module, "parse_input_part2"):
+        parsed = module.parse_input_part2(raw_input)
+    else:
+        parsed = module.parse_input(raw_input)
+    return as_answer(getattr(module, fn)(parsed))
+
+
+def compare(module: ModuleType, part: str, raw_input: str) -> tuple | None:
+    """
+    The (fast, reference) answers if they differ, else None. An input the reference
+    can't solve isn't valid, so doesn't count, but the fast solver failing on a valid
+    one does, with the error as its answer.
+    """
+    try:
+        reference = _solve(module, f"reference_{part}", part, raw_input)
+    except Exception:
+        return None
+    try:
+        fast = _solve(module, f"solve_{part}", part, raw_input)
+    except Exception as e:
+        fast = f"{type(e).__name__}: {e}"
+    return None if fast == reference else (fast, reference)
+
+
+def minimise(pieces: list[str], fails: Callable[[list[str]], bool]) -> list[str]:
+    """
+    Zeller's delta debugging: try removing each of `n` chunks of `pieces`, keeping any
+    removal after which `fails` still holds. When none can be removed, try chunks half
+    the size, until they're single pieces.
+    """
+    n = 2
+    while len(pieces) >= 2:
+        size = math.ceil(len(pieces) / n)
+        for start in range(0, len(pieces), size):
+            rest = pieces[:start] + pieces[start + size :]
+            if rest and fails(rest):
+                pieces = rest
+                n = max(n - 1, 2)
+                break
+        else:
+            if n >= len(pieces):
+                break
+            n = min(2 * n, len(pieces))
+    return pieces
+
+
+def shrink(module: ModuleType, part: str, raw_input: str) -> str:
+    "The smallest part of `raw_input` found on which the answers still differ"
+    for sep in SEPARATORS:
+        pieces = raw_input.split(sep)
+        if len(pieces) > 1:
+            break
+    else:
+        return raw_input
+
+    def fails(keep: list[str]) -> bool:
+        return compare(module, part, sep.join(keep)) is not None
+
+    return sep.join(minimise(pieces, fails))
+
+
+def check_part(day: int, part: str, trials: int = 20, seed: int = 0) -> Mismatch | None:
+    """
+    Try up to `trials` generated inputs, each of a random size up to the generator's
+    smallest benchmark size, since the reference is likely slow. Stops at the first
+    that the answers differ on.
+    """
+    module = load(day)
+    gen = load_generator(day)
+    for trial_seed in range(seed, seed + trials):
+        size = random.Random(trial_seed).randint(1, gen.SIZES[0])
+        raw_input = gen.generate(size, seed=trial_seed)
+        if (answers := compare(module, part, raw_input)) is None:
+            continue
+
+        small = shrink(module, part, raw_input)
+        fast, reference = compare(module, part, small) or answers
+        return Mismatch(day, part, trial_seed, size, small, fast, reference)
+    return None
+
+
+def checkable_days() -> list[int]:
+    "Days with a reference solver, and a generator to make inputs with"
+    generated = set(discover_generators())
+    return [d for d in discover_days() if d in generated and get_day(d).references]
+
+
+def main(
+    days: list[int],
+    trials: int = 20,
+    seed: int = 0,
+    output: Path | None = None,
+) -> int:
+    days = sorted(set(days)) or checkable_days()
+    mismatches: list[Mismatch] = []
+    for day in days:
+        parts = get_day(day).references
+        if not parts or day not in discover_generators():
+            print(f"day{day:02}: no reference solver and generator to check with")
+            continue
+        for part in parts:
+            mismatch = check_part(day, part, trials=trials, seed=seed)
+            if mismatch is None:
+                print(f"day{day:02}.{part}: the same on {trials} inputs")
+                continue
+            mismatches.append(mismatch)
+            print(mismatch.describe())
+            if output is not None:
+                output.mkdir(parents=True, exist_ok=True)
+                path = output / f"day{day:02}.{part}.txt"
+                path.write_text(mismatch.raw_input + "\n")
+                print(f"Wrote the input to {path}")
+    return 1 if mismatches else 0
@@ -0,0 +1,29 @@
+import importlib
+import sys
+from pathlib import Path
+from types import ModuleType
+
+from aoc_2023.registry import PACKAGE_DIR
+
+
+def discover_generators() -> list[int]:
+    "Every day that has a `dayNN/generate.py`"
+    return sorted(int(p.parent.name[3:]) for p in PACKAGE_DIR.glob("day*/generate.py"))
+
+
+def load_generator(day: int) -> ModuleType:
+    """
+    Each generator module has a `generate(n, seed=0) -> str` function, where `n` is the
+    size of the input (the docstring says what it counts), and `SIZES`, a range of `n`
+    that takes the solver anywhere from milliseconds to a few seconds.
+    """
+    return importlib.import_module(f"aoc_2023.day{day:02}.generate")
+
+
+def main(day: int, size: int, seed: int = 0, output: Path | None = None) -> int:
+    raw_input = load_generator(day).generate(size, seed=seed)
+    if output is None:
+        sys.stdout.write(raw_input + "\n")
+    else:
+        output.write_text(raw_input + "\n")
+    return 0
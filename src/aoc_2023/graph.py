@@ -0,0 +1,201 @@
+"""
+Graphs with nodes numbered 0..n-1, stored as compressed sparse rows of int32, so
+searching one is indexing arrays rather than hashing tuples or building networkx objects.
+"""
+
+from dataclasses import dataclass
+from typing import Self
+
+import numpy as np
+
+from aoc_2023.counters import count
+from aoc_2023.grid import Padded
+
+
+@dataclass(frozen=True)
+class Graph:
+    """
+    Node `i`'s edges go to `targets[offsets[i] : offsets[i + 1]]`, with the same slice of
+    `weights`. Every weight is 1 unless given.
+    """
+
+    offsets: np.ndarray
+    targets: np.ndarray
+    weights: np.ndarray
+
+    @classmethod
+    def from_edges(
+        cls,
+        n_nodes: int,
+        sources,
+        targets,
+        weights=None,
+        undirected: bool = False,
+    ) -> Self:
+        sources = np.asarray(sources, dtype=np.int32)
+        targets = np.asarray(targets, dtype=np.int32)
+        if weights is None:
+            weights = np.ones(len(sources), dtype=np.int32)
+        weights = np.asarray(weights, dtype=np.int32)
+        if undirected:
+            sources, targets = (
+                np.concatenate([sources, targets]),
+                np.concatenate([targets, sources]),
+            )
+            weights = np.concatenate([weights, weights])
+
+        # Stable, so each node's edges stay in the order they were given
+        order = np.argsort(sources, kind="stable")
+        offsets = np.zeros(n_nodes + 1, dtype=np.int32)
+        np.cumsum(np.bincount(sources, minlength=n_nodes), out=offsets[1:])
+        return cls(offsets, targets[order], weights[order])
+
+    @classmethod
+    def from_grid(cls, padded: Padded, diagonals: bool = False) -> Self:
+        """
+        Nodes are the flat indices of `padded`, a padded mask. There's an edge from each
+        True cell to each of its True neighbours.
+        """
+        cells = np.flatnonzero(padded.flat)
+        nbrs = padded.neighbours(cells, diagonals)
+        can_go = padded.flat[nbrs]
+        sources = np.broadcast_to(cells[:, None], nbrs.shape)[can_go]
+        return cls.from_edges(padded.flat.size, sources, nbrs[can_go])
+
+    @property
+    def n_nodes(self) -> int:
+        return len(self.offsets) - 1
+
+    def neighbours(self, node: int) -> np.ndarray:
+        return self.targets[self.offsets[node] : self.offsets[node + 1]]
+
+    def weights_of(self, node: int) -> np.ndarray:
+        return self.weights[self.offsets[node] : self.offsets[node + 1]]
+
+    def _expand(self, frontier: np.ndarray) -> np.ndarray:
+        "The targets of every edge out of every node in `frontier`"
+        firsts = self.offsets[frontier]
+        counts = self.offsets[frontier + 1] - firsts
+        # For each edge, how far its index is past its node's first edge's
+        ends = np.cumsum(counts)
+        steps = np.arange(ends[-1] if len(ends) else 0)
+        steps -= np.repeat(ends - counts, counts)
+        return self.targets[np.repeat(firsts, counts) + steps]
+
+    def bfs(self, source: int, max_depth: int | None = None) -> np.ndarray:
+        """
+        Number of edges from `source` to each node, or -1 where there's no path. Expands
+        a whole level of the search at once. Ignores weights.
+        """
+        dist = np.full(self.n_nodes, -1, dtype=np.int32)
+        dist[source] = 0
+        frontier = np.array([source], dtype=np.int32)
+        depth = 0
+        while len(frontier) and depth != max_depth:
+            depth += 1
+            reached = self._expand(frontier)
+            frontier = np.unique(reached[dist[reached] == -1])
+            dist[frontier] = depth
+        return dist
+
+    def dijkstra(self, source: int) -> np.ndarray:
+        """
+        Shortest distance from `source` to each node, or -1 where there's no path.
+
+        Dial's algorithm: since weights are small non-negative integers, a node's
+        tentative distance is kept in a ring of buckets, one per distance, instead of a
+        heap.
+        """
+        offsets = self.offsets.tolist()
+        targets = self.targets.tolist()
+        weights = self.weights.tolist()
+        n_buckets = max(weights, default=0) + 1
+
+        dist = [-1] * self.n_nodes
+        dist[source] = 0
+        buckets: list[list[int]] = [[] for _ in range(n_buckets)]
+        buckets[0].append(source)
+        queued = 1
+        d = 0
+        while queued:
+            bucket = buckets[d % n_buckets]
+            while bucket:
+                node = bucket.pop()
+                queued -= 1
+                if dist[node] != d:
+                    # Queued again since, at a shorter distance
+                    continue
+                for i in range(offsets[node], offsets[node + 1]):
+                    target, new_d = targets[i], d + weights[i]
+                    if dist[target] == -1 or new_d < dist[target]:
+                        dist[target] = new_d
+                        buckets[new_d % n_buckets].append(target)
+                        queued += 1
+            d += 1
+        return np.array(dist, dtype=np.int64)
+
+    def contract(self, keep: np.ndarray) -> tuple[Self, np.ndarray]:
+        """
+        Replace every corridor, a chain of nodes with only one way on, by one edge
+        between the kept nodes at its ends, weighted by its length. Corridors that end
+        anywhere else are dropped. `keep` must include every node with more than one way
+        on, e.g. grid cells with 3 or more neighbours.
+
+        Returns the new graph, and the original number of each of its nodes.
+        """
+        kept = np.flatnonzero(keep)
+        renumber = np.full(self.n_nodes, -1, dtype=np.int32)
+        renumber[kept] = np.arange(len(kept), dtype=np.int32)
+        offsets = self.offsets.tolist()
+        targets = self.targets.tolist()
+        weights = self.weights.tolist()
+        is_kept = keep.tolist()
+
+        sources, ends, lengths = [], [], []
+        for start in kept.tolist():
+            for i in range(offsets[start], offsets[start + 1]):
+                prev, node, length = start, targets[i], weights[i]
+                # At most once round the graph, in case the corridor is a loop
+                for _ in range(self.n_nodes):
+                    if is_kept[node]:
+                        break
+                    onward = [
+                        j
+                        for j in range(offsets[node], offsets[node + 1])
+                        if targets[j] != prev
+                    ]
+                    if len(onward) != 1:
+                        break
+                    prev, node = node, targets[onward[0]]
+                    length += weights[onward[0]]
+                if is_kept[node]:
+                    sources.append(renumber[start])
+                    ends.append(renumber[node])
+                    lengths.append(length)
+
+        return type(self).from_edges(len(kept), sources, ends, lengths), kept
+
+    def longest_path(self, source: int, target: int) -> int:
+        """
+        Total weight of the heaviest path from `source` to `target` that never visits a
+        node twice, or -1 if there isn't one. This tries every such path, so is only
+        feasible on small graphs, e.g. after `contract()`. Counts the "paths" it tries.
+        """
+        edges = [
+            list(zip(self.neighbours(n).tolist(), self.weights_of(n).tolist()))
+            for n in range(self.n_nodes)
+        ]
+        best = -1
+        paths = 0
+        stack = [(source, 1 << source, 0)]
+        while stack:
+            node, seen, length = stack.pop()
+            if node == target:
+                best = max(best, length)
+                paths += 1
+                continue
+            for nbr, weight in edges[node]:
+                if not seen >> nbr & 1:
+                    stack.append((nbr, seen | 1 << nbr, length + weight))
+        count("paths", paths)
+        return best
@@ -0,0 +1,144 @@
+"""
+Character grids as NumPy arrays of bytes.
+
+`Grid.parse()` views the input's bytes as a 2D uint8 array, newlines included, and
+slices the newlines off, so nothing is copied after encoding the input, and given the
+bytes of a `loader.MappedInput`, nothing is copied at all. Padding a grid,
+or a mask of it, with a one cell border and flattening it gives `Padded`, where each
+cell's neighbours are at fixed offsets from its index, and none are ever out of bounds.
+"""
+
+from collections.abc import Buffer
+from dataclasses import dataclass
+from typing import Self
+
+import numpy as np
+
+from aoc_2023.loader import CARRIAGE_RETURN, NEWLINE, as_array
+
+LINE_ENDS = (NEWLINE, CARRIAGE_RETURN)
+
+# Clockwise from the top
+NEIGHBOURS4 = ((-1, 0), (0, 1), (1, 0), (0, -1))
+NEIGHBOURS8 = ((-1, -1), (-1, 0), (-1, 1), (0, 1), (1, 1), (1, 0), (1, -1), (0, -1))
+
+
+def as_bytes(chars: str) -> np.ndarray:
+    return np.frombuffer(chars.encode(), dtype=np.uint8)
+
+
+def _find_first(data: np.ndarray, value: int, chunk: int = 4096) -> int | None:
+    "Index of the first `value`, comparing a chunk at a time, not the whole array"
+    for start in range(0, len(data), chunk):
+        found = np.flatnonzero(data[start : start + chunk] == value)
+        if found.size:
+            return start + int(found[0])
+    return None
+
+
+@dataclass(frozen=True)
+class Grid:
+    "One byte per cell. `cells` is read only, since it's a view of the input"
+
+    cells: np.ndarray
+
+    @classmethod
+    def parse(cls, raw_input: str | Buffer) -> Self:
+        """
+        From text, or bytes. Blank lines before and after the grid are ignored, and
+        rows can end with "\r\n" as well as "\n", which is sliced off like the "\n"
+        """
+        data = as_array(raw_input)
+        start, stop = 0, len(data)
+        while start < stop and data[start] in LINE_ENDS:
+            start += 1
+        while stop > start and data[stop - 1] in LINE_ENDS:
+            stop -= 1
+
+        first = _find_first(data[start:stop], NEWLINE)
+        if first is None:
+            width = stop - start
+            crlf = data[stop : stop + 2].tobytes() == b"\r\n"
+        else:
+            crlf = first > 0 and data[start + first - 1] == CARRIAGE_RETURN
+            width = first - crlf
+        ending = b"\r\n" if crlf else b"\n"
+
+        end = stop + len(ending)
+        if data[stop:end].tobytes() == ending:
+            # Keep the last row's line ending, so every row ends with one
+            flat = data[start:end]
+        else:
+            flat = np.append(data[start:stop], np.frombuffer(ending, dtype=np.uint8))
+            flat.flags.writeable = False
+
+        row = width + len(ending)
+        if len(flat) % row != 0:
+            raise ValueError("Every row of a grid must be the same length")
+        return cls(flat.reshape(-1, row)[:, :width])
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        return self.cells.shape
+
+    def mask(self, chars: str) -> np.ndarray:
+        "True wherever the cell is any of `chars`"
+        if len(chars) == 1:
+            return self.cells == ord(chars)
+        return np.isin(self.cells, as_bytes(chars))
+
+    def find(self, char: str) -> tuple[int, int]:
+        "The row and column of the first `char`"
+        found = np.flatnonzero(self.cells == ord(char))
+        if found.size == 0:
+            raise ValueError(f"{char!r} is not in the grid")
+        ridx, cidx = divmod(int(found[0]), self.shape[1])
+        return ridx, cidx
+
+    def find_all(self, chars: str) -> np.ndarray:
+        "Row and column of every cell that's any of `chars`, one row each"
+        return np.argwhere(self.mask(chars))
+
+    def padded(self, fill: str) -> "Padded":
+        return pad(self.cells, ord(fill))
+
+
+@dataclass(frozen=True)
+class Padded:
+    """
+    A grid with a border one cell wide, flattened. `width` is the width of a padded
+    row, so the cell below index `i` is at `i + width`.
+    """
+
+    flat: np.ndarray
+    width: int
+
+    def index(self, ridx: int, cidx: int) -> int:
+        "Flat index of a cell in the original grid"
+        return (ridx + 1) * self.width + cidx + 1
+
+    def position(self, idx: int) -> tuple[int, int]:
+        "Row and column of a flat index, in the original grid"
+        ridx, cidx = divmod(idx, self.width)
+        return ridx - 1, cidx - 1
+
+    def inner(self) -> np.ndarray:
+        "Flat indices of every cell in the original grid, not the border"
+        n_rows = self.flat.size // self.width
+        idx = np.arange(self.flat.size).reshape(n_rows, self.width)
+        return idx[1:-1, 1:-1].ravel()
+
+    def stencil(self, diagonals: bool = False) -> np.ndarray:
+        "Offsets from a cell's index to its neighbours', in the order of NEIGHBOURS4/8"
+        dirs = NEIGHBOURS8 if diagonals else NEIGHBOURS4
+        return np.array([dr * self.width + dc for dr, dc in dirs])
+
+    def neighbours(self, idx: np.ndarray, diagonals: bool = False) -> np.ndarray:
+        "For each index in `idx`, a row of its neighbours' indices"
+        return np.asarray(idx)[..., None] + self.stencil(diagonals)
+
+
+def pad(arr: np.ndarray, fill) -> Padded:
+    "Pad any 2D array, e.g. a mask from `Grid.mask()`, with `fill`"
+    padded = np.pad(arr, 1, constant_values=fill)
+    return Padded(padded.ravel(), padded.shape[1])
@@ -0,0 +1,103 @@
+import subprocess
+import sys
+from dataclasses import dataclass
+
+from aoc_2023.registry import discover_days, module_name
+from aoc_2023.utils import format_ns
+
+
+@dataclass(frozen=True)
+class ImportTime:
+    "One line of `python -X importtime`, with times in microseconds"
+
+    name: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+def parse_importtime(stderr: str) -> list[ImportTime]:
+    """
+    Lines look like
+
+    import time: self [us] | cumulative | imported package
+    import time:        75 |         75 |     aoc_2023
+    import time:        61 |        136 |   aoc_2023.day07
+
+    Each level of nesting indents the name by two more spaces. Everything imported
+    while starting up the interpreter (up to and including `site`) is dropped.
+    """
+    imports: list[ImportTime] = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+        self_us, cumulative_us, name = line.removeprefix("import time:").split("|")
+        depth = (len(name) - len(name.lstrip(" ")) - 1) // 2
+        imports.append(
+            ImportTime(name.strip(), int(self_us), int(cumulative_us), depth)
+        )
+        if name.strip() == "site" and depth == 0:
+            imports.clear()
+    return imports
+
+
+def measure_imports(module: str, repeats: int = 3) -> list[ImportTime]:
+    """
+    Import `module` in a fresh interpreter `repeats` times, and keep the fastest run,
+    since the first one or two can be slowed down by a cold disk cache.
+    """
+    best: list[ImportTime] = []
+    for _ in range(repeats):
+        proc = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        imports = parse_importtime(proc.stderr)
+        if not best or total_us(imports) < total_us(best):
+            best = imports
+    return best
+
+
+def total_us(imports: list[ImportTime]) -> int:
+    return sum(i.cumulative_us for i in imports if i.depth == 0)
+
+
+def heaviest(imports: list[ImportTime], n: int = 3) -> list[ImportTime]:
+    "The most expensive packages imported directly by something in this project"
+    outside = [i for i in imports if i.depth == 1 and not i.name.startswith("aoc_2023")]
+    return sorted(outside, key=lambda i: i.cumulative_us, reverse=True)[:n]
+
+
+def format_table(results: dict[int, list[ImportTime]], budget_ms: float | None) -> str:
+    header = f"{'Day':<5}{'Import':>10}  Heaviest"
+    lines = [header]
+    for day, imports in results.items():
+        total = total_us(imports)
+        heavy = ", ".join(
+            f"{i.name} {format_ns(i.cumulative_us * 1_000)}" for i in heaviest(imports)
+        )
+        over = budget_ms is not None and total > budget_ms * 1_000
+        lines.append(
+            f"{day:02}   {format_ns(total * 1_000):>10}  {heavy or '-'}"
+            + ("  OVER BUDGET" if over else "")
+        )
+    return "\n".join(lines)
+
+
+def main(days: list[int], repeats: int = 3, budget_ms: float | None = None) -> int:
+    """
+    Print how long importing each day's module takes in a fresh interpreter, and what
+    the most expensive imports were. With `budget_ms`, returns 1 if any day takes
+    longer than that to import.
+    """
+    days = sorted(set(days)) or discover_days()
+    results = {day: measure_imports(module_name(day), repeats) for day in days}
+    print(format_table(results, budget_ms))
+
+    if budget_ms is not None and any(
+        total_us(imports) > budget_ms * 1_000 for imports in results.values()
+    ):
+        return 1
+    return 0
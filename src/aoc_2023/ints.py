@@ -0,0 +1,123 @@
+"""
+Every integer in a block of text, found with array operations over the text's bytes
+rather than by splitting it and calling `int()` on each piece.
+"""
+
+from collections.abc import Buffer
+from dataclasses import dataclass
+
+import numpy as np
+
+from aoc_2023.loader import NEWLINE, as_array
+
+# More digits than this could overflow an int64
+MAX_DIGITS = 18
+
+
+@dataclass(frozen=True)
+class Ints:
+    "The integers on each line. Line `i`'s are `values[offsets[i] : offsets[i + 1]]`"
+
+    values: np.ndarray
+    offsets: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def row(self, i: int) -> np.ndarray:
+        return self.values[self.offsets[i] : self.offsets[i + 1]]
+
+    def rows(self) -> list[np.ndarray]:
+        return np.split(self.values, self.offsets[1:-1])
+
+    def as_2d(self) -> np.ndarray:
+        "When every line has as many integers, one line per row"
+        counts = np.diff(self.offsets)
+        if len(counts) and (counts != counts[0]).any():
+            raise ValueError("Lines have different numbers of integers")
+        width = counts[0] if len(counts) else 0
+        return self.values.reshape(len(counts), width)
+
+
+def _digits8(words: np.ndarray) -> np.ndarray:
+    """
+    The value of each uint64's 8 bytes, read as 8 ASCII digits, most significant first.
+    Adds neighbouring digits into pairs, pairs into fours, and fours into eights, with
+    one multiply each, since a lane times 10**k plus the lane above it is just the
+    lane times (10**k << lane_bits) + 1, shifted down.
+    """
+    words &= np.uint64(0x0F0F0F0F0F0F0F0F)
+    words = (words * np.uint64(10 << 8 | 1)) >> np.uint64(8)
+    words &= np.uint64(0x00FF00FF00FF00FF)
+    words = (words * np.uint64(100 << 16 | 1)) >> np.uint64(16)
+    words &= np.uint64(0x0000FFFF0000FFFF)
+    return (words * np.uint64(10000 << 32 | 1)) >> np.uint64(32)
+
+
+def _find(data: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    The value of each integer in `data`, and the index of its first digit.
+
+    The 8 bytes ending at each integer's last digit are read as one uint64, and the
+    bytes before its first digit are masked to '0'. Longer integers take another 8 bytes
+    for every 8 more digits.
+    """
+    is_digit = (data - np.uint8(ord("0"))) < 10
+    if not is_digit.any():
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.intp)
+
+    # Where a run of digits starts or stops. They alternate, starting with a start
+    edges = np.empty(len(data) + 1, dtype=bool)
+    edges[0], edges[-1] = is_digit[0], is_digit[-1]
+    np.not_equal(is_digit[1:], is_digit[:-1], out=edges[1:-1])
+    bounds = np.flatnonzero(edges)
+    starts, ends = bounds[::2], bounds[1::2]
+    lengths = ends - starts
+    if lengths.max() > MAX_DIGITS:
+        raise ValueError(f"An integer has more than {MAX_DIGITS} digits")
+
+    # Pad the front, so every word, and the two bytes before each integer, are in bounds
+    n_words = -(-int(lengths.max()) // 8)
+    lead = 8 * n_words + 2
+    padded = np.zeros(lead + len(data), dtype=np.uint8)
+    padded[lead:] = data
+    # A little endian uint64 starting at every byte, so the first byte is the lowest
+    words_at = np.ndarray(
+        (len(padded) - 7,), dtype="<u8", buffer=padded.data, strides=(1,)
+    )
+
+    values = np.zeros(len(starts), dtype=np.uint64)
+    for word in reversed(range(n_words)):
+        words = words_at[lead + ends - 8 * (word + 1)]
+        n_digits = np.clip(lengths - 8 * word, 0, 8).astype(np.uint64)
+        # Shifting by 64 isn't defined, so shift by 56 and zero the whole word after
+        shift = np.uint64(8) * (np.uint64(8) - np.maximum(n_digits, 1))
+        words &= np.where(n_digits > 0, ~np.uint64(0) << shift, np.uint64(0))
+        values = values * np.uint64(10**8) + _digits8(words)
+    values = values.astype(np.int64)
+
+    # A '-' right before the digits is a sign, unless it's between two numbers, e.g. 3-4
+    negative = padded[lead + starts - 1] == ord("-")
+    negative &= (padded[lead + starts - 2] - np.uint8(ord("0"))) >= 10
+    values[negative] *= -1
+    return values, starts
+
+
+def ints(text: str | Buffer) -> np.ndarray:
+    "Every integer in `text`, or bytes such as a `loader.MappedInput`'s, as int64"
+    values, _ = _find(as_array(text))
+    return values
+
+
+def ints_per_line(text: str | Buffer) -> Ints:
+    "Every integer in `text`, or bytes, along with which line each was on"
+    data = as_array(text)
+    values, starts = _find(data)
+
+    # Each line ends where the integers after its newline start
+    newlines = np.flatnonzero(data == NEWLINE)
+    ends = [np.searchsorted(starts, newlines)]
+    if len(data) and data[-1] != NEWLINE:
+        ends.append([len(values)])
+    offsets = np.concatenate([[0], *ends]).astype(np.intp)
+    return Ints(values, offsets)
@@ -0,0 +1,136 @@
+"""
+Input files memory mapped, rather than read into a `str`.
+
+`read_text()` reads a whole file and decodes it, then `splitlines()` and the like copy
+it all again. A `MappedInput` maps the file instead, and hands out its bytes as a read
+only `memoryview` or NumPy array, or one line at a time, none of which copy anything,
+since they're all views of the pages the OS already has cached. It's only decoded to a
+`str` if asked to be, and then its line endings are made "\n", as `read_text()` does.
+
+A day whose parsers take the input's bytes as well as its text says so with
+`READS_BYTES = True` (see `registry.Solution`), and `runner.run_stages()` hands it the
+mapped bytes, so an input of hundreds of MB is never in memory twice. Every other day
+gets them decoded.
+"""
+
+import mmap
+from collections.abc import Buffer, Iterator
+from functools import cached_property
+from pathlib import Path
+from typing import TYPE_CHECKING, Self
+
+if TYPE_CHECKING:
+    import numpy as np
+
+NEWLINE = ord("\n")
+CARRIAGE_RETURN = ord("\r")
+WHITESPACE = frozenset(b" \t\r\n")
+
+
+def reads_bytes(module) -> bool:
+    "Whether a day's parsers take the input's bytes, not just its text"
+    return getattr(module, "READS_BYTES", False)
+
+
+def as_array(raw_input: str | Buffer) -> "np.ndarray":
+    "The input's bytes as uint8. A view of them, unless it's a `str` to encode"
+    import numpy as np
+
+    data = raw_input.encode() if isinstance(raw_input, str) else raw_input
+    return np.frombuffer(data, dtype=np.uint8)
+
+
+def decode(data: Buffer, encoding: str = "utf-8") -> str:
+    "Bytes as text, with each line ending made a newline, as `read_text()` does"
+    text = str(data, encoding)
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+def strip[T: (str, memoryview)](raw_input: T) -> T:
+    "Like `str.strip()`, for either, but slicing a memoryview rather than copying it"
+    if isinstance(raw_input, str):
+        return raw_input.strip()
+    start, stop = 0, len(raw_input)
+    while start < stop and raw_input[start] in WHITESPACE:
+        start += 1
+    while stop > start and raw_input[stop - 1] in WHITESPACE:
+        stop -= 1
+    return raw_input[start:stop]
+
+
+class MappedInput:
+    """
+    ```
+    with MappedInput(path) as mapped:
+        for line in mapped.lines():
+            ...
+    ```
+
+    Anything handed out is a view of the mapping, so once the mapping is closed, using
+    it is an error. If an array from it is still around when it's closed, the mapping
+    is left open, and unmapped once nothing uses it.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        with path.open("rb") as f:
+            # An empty file can't be mapped
+            empty = f.seek(0, 2) == 0
+            self._mmap = (
+                None if empty else mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            )
+        self.data = memoryview(self._mmap if self._mmap is not None else b"")
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def array(self) -> "np.ndarray":
+        "The bytes as a read only uint8 array"
+        return as_array(self.data)
+
+    @cached_property
+    def line_offsets(self) -> "np.ndarray":
+        """
+        Where each line starts, then one past the end of the last line's newline, or
+        one past the end of the file if it doesn't end with one. So line `i` is
+        `data[offsets[i] : offsets[i + 1] - 1]`, like `splitlines()` without a copy.
+        """
+        import numpy as np
+
+        arr = self.array()
+        ends = np.flatnonzero(arr == NEWLINE)
+        if len(arr) and arr[-1] != NEWLINE:
+            ends = np.append(ends, len(arr))
+        return np.concatenate([[0], ends + 1])
+
+    def line(self, i: int) -> memoryview:
+        "Line `i`, without its line ending"
+        offsets = self.line_offsets
+        start, stop = int(offsets[i]), int(offsets[i + 1]) - 1
+        if stop > start and self.data[stop - 1] == CARRIAGE_RETURN:
+            stop -= 1
+        return self.data[start:stop]
+
+    def lines(self) -> Iterator[memoryview]:
+        for i in range(len(self.line_offsets) - 1):
+            yield self.line(i)
+
+    def text(self, encoding: str = "utf-8") -> str:
+        "The whole file decoded, which copies it. See `decode()`"
+        return decode(self.data, encoding)
+
+    def close(self) -> None:
+        try:
+            self.data.release()
+            if self._mmap is not None:
+                self._mmap.close()
+        except BufferError:
+            pass
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
@@ -0,0 +1,54 @@
+import os
+import tracemalloc
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+
+PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+
+@dataclass
+class StageMemory:
+    "Bytes allocated at the high-water mark of a stage, over what it started with"
+
+    peak: int = 0
+
+
+def current_rss() -> int:
+    """
+    Resident set size of this process, in bytes. Always 0 where there's no /proc.
+
+    tracemalloc only sees allocations made through Python (numpy's included), so the
+    change in RSS catches what it misses, e.g. polars' buffers.
+    """
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * PAGE_SIZE
+    except OSError:
+        return 0
+
+
+@contextmanager
+def track_memory() -> Iterator[StageMemory]:
+    """
+    Record the peak traced memory of the block. Starts `tracemalloc` if it isn't already
+    running, and stops it again afterwards.
+
+    Tracing slows allocation-heavy code down a lot, so never time a block while
+    tracking its memory. Nested blocks reset the peak, so an outer block only sees the
+    peak since its last inner block started.
+    """
+    started_here = not tracemalloc.is_tracing()
+    if started_here:
+        tracemalloc.start()
+
+    tracemalloc.reset_peak()
+    baseline, _ = tracemalloc.get_traced_memory()
+    mem = StageMemory()
+    try:
+        yield mem
+    finally:
+        _, peak = tracemalloc.get_traced_memory()
+        mem.peak = max(peak - baseline, 0)
+        if started_here:
+            tracemalloc.stop()
@@ -0,0 +1,107 @@
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+from aoc_2023.bench import stage_key
+from aoc_2023.runner import DayResult
+
+
+async def follow(
+    stream: asyncio.StreamReader,
+    result: DayResult,
+    timeout: float,
+    budgets: dict[str, float],
+) -> None:
+    """
+    Read a worker's events into `result`, until it's finished, or a stage runs over
+    its budget. A stage's budget runs from its "start", or for the parse, from when
+    the worker started. Any wait between stages gets the plain `timeout`.
+
+    Lines that aren't events, e.g. the half written last line of a killed worker, are
+    skipped, and the worker's exit status decides whether it failed.
+    """
+    stage: str | None = "parse"
+    while True:
+        if stage is None:
+            budget = timeout
+        else:
+            budget = budgets.get(stage_key(result.day, stage), timeout)
+        try:
+            line = await asyncio.wait_for(stream.readline(), budget)
+        except TimeoutError:
+            if stage is None:
+                result.error = f"worker stalled for {timeout}s between stages"
+            else:
+                result.timed_out = stage
+            return
+        if not line:
+            return
+
+        try:
+            event = json.loads(line)
+        except ValueError:
+            continue
+        if not isinstance(event, dict):
+            continue
+        match event.get("event"):
+            case "start":
+                stage = event["stage"]
+            case "done":
+                result.timings[event["stage"]] = event["ns"]
+                if event["answer"] is not None:
+                    result.answers[event["stage"]] = event["answer"]
+                stage = None
+            case "spans":
+                result.spans = event["spans"]
+
+
+async def run_day(
+    day: int,
+    timeout: float,
+    budgets: dict[str, float] | None = None,
+    path: Path | None = None,
+) -> DayResult:
+    """
+    Solve a day in a `python -m aoc_2023.worker` subprocess, giving each of its stages
+    `timeout` seconds, or its own budget from `budgets` (keyed like "day05.part2"),
+    before killing the worker. Importing the day counts towards the parse stage.
+
+    Whatever stages finished before then are still in the result, and the one that was
+    running is in `timed_out`.
+    """
+    budgets = budgets or {}
+    args = [sys.executable, "-m", "aoc_2023.worker", str(day)]
+    if path is not None:
+        args.append(str(path))
+    proc = await asyncio.create_subprocess_exec(*args, stdout=asyncio.subprocess.PIPE)
+    assert proc.stdout is not None
+
+    result = DayResult(day=day)
+    try:
+        await follow(proc.stdout, result, timeout, budgets)
+    finally:
+        # Also when this task is cancelled, so no worker outlives the run
+        if proc.returncode is None:
+            proc.kill()
+        await proc.wait()
+
+    if result.timed_out is None and result.error is None and proc.returncode != 0:
+        result.error = f"worker exited with {proc.returncode}"
+    return result
+
+
+async def run_all(
+    days: list[int],
+    timeout: float,
+    budgets: dict[str, float] | None = None,
+    jobs: int = 1,
+) -> list[DayResult]:
+    "Run the days, at most `jobs` at a time"
+    limit = asyncio.Semaphore(jobs)
+
+    async def run_one(day: int) -> DayResult:
+        async with limit:
+            return await run_day(day, timeout, budgets)
+
+    return list(await asyncio.gather(*(run_one(day) for day in days)))
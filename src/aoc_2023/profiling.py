@@ -0,0 +1,116 @@
+import cProfile
+import pstats
+import sys
+import threading
+from collections import Counter
+from contextlib import AbstractContextManager, nullcontext
+from pathlib import Path
+from types import FrameType
+from typing import Self
+
+from aoc_2023.registry import PARTS, get_day, input_path
+from aoc_2023.runner import run_stages
+
+
+def frame_name(frame: FrameType) -> str:
+    "Like 'aoc_2023.day23.day23:longest_path'. No spaces or ';', for flamegraph tools"
+    module = frame.f_globals.get("__name__", "?")
+    return f"{module}:{frame.f_code.co_qualname}".replace(";", ":").replace(" ", "_")
+
+
+class StackSampler:
+    """
+    Sample the stack of the thread that enters it, every `interval` seconds, from a
+    background thread. Stacks start at the function that entered the sampler, so they
+    don't include the runner's own frames.
+
+    Sampling only slows the profiled code down by however long it takes to grab a
+    stack, unlike tracing every call, so the proportions come out about right.
+    """
+
+    def __init__(self, interval: float = 0.001):
+        self.interval = interval
+        self.counts: Counter[str] = Counter()
+        self._stop = threading.Event()
+
+    def __enter__(self) -> Self:
+        self._thread_id = threading.get_ident()
+        self._root = sys._getframe(1)
+        # Otherwise the sampling thread only gets the GIL every 5ms
+        self._switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(self.interval)
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._sample, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._stop.set()
+        self._thread.join()
+        sys.setswitchinterval(self._switch_interval)
+
+    def _sample(self) -> None:
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self._thread_id)
+            names = []
+            while frame is not None and frame is not self._root:
+                names.append(frame_name(frame))
+                frame = frame.f_back
+            if frame is self._root and names:
+                self.counts[";".join(reversed(names))] += 1
+
+    def collapsed(self) -> str:
+        "One 'outer;inner;innermost count' line per stack, as flamegraph.pl expects"
+        return "\n".join(f"{stack} {n}" for stack, n in sorted(self.counts.items()))
+
+
+def profile_day(
+    day: int, stage: str, output_dir: Path, path: Path | None = None
+) -> list[Path]:
+    """
+    Run a day twice, once with `stage` under cProfile, and once sampling its stack. The
+    samples would be mostly of cProfile's overhead if they were taken at the same time.
+    Parts other than `stage` are skipped.
+
+    Writes `dayNN.stage.prof` (for pstats, snakeviz, etc.), `dayNN.stage.txt`, the
+    pstats summary sorted by cumulative and then by own time, and
+    `dayNN.stage.collapsed`, for flamegraph.pl, speedscope, etc.
+    """
+    if stage not in get_day(day).stages:
+        raise ValueError(f"Day {day} has no {stage} stage")
+    module = get_day(day).load()
+    raw_input = (path or input_path(day)).read_text()
+
+    def only(stage_profiler: AbstractContextManager):
+        return lambda s: stage_profiler if s == stage else nullcontext()
+
+    parts = (stage,) if stage in PARTS else ()
+
+    profiler = cProfile.Profile()
+    run_stages(day, module, raw_input, around=only(profiler), parts=parts)
+
+    sampler = StackSampler()
+    run_stages(day, module, raw_input, around=only(sampler), parts=parts)
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+    stem = f"day{day:02}.{stage}"
+    prof_path = output_dir / f"{stem}.prof"
+    profiler.dump_stats(prof_path)
+
+    summary_path = output_dir / f"{stem}.txt"
+    with summary_path.open("w") as f:
+        stats = pstats.Stats(profiler, stream=f).strip_dirs()
+        stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(30)
+        stats.sort_stats(pstats.SortKey.TIME).print_stats(30)
+
+    collapsed_path = output_dir / f"{stem}.collapsed"
+    collapsed_path.write_text(sampler.collapsed() + "\n")
+
+    return [prof_path, summary_path, collapsed_path]
+
+
+def main(days: list[int], stage: str, output_dir: Path) -> int:
+    for day in days:
+        for path in profile_day(day, stage, output_dir):
+            print(f"Wrote {path}")
+    return 0
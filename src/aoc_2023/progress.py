@@ -0,0 +1,139 @@
+"""
+Progress of long running solvers, cheap enough to leave in the hottest loop.
+
+A solver only ever adds to a plain integer on a `Progress`, a chunk of work at a time,
+e.g. every 65536 seeds, never per item. A background thread reads that count every
+`interval` seconds, and passes a `Snapshot` of it to `report`, which by default redraws
+a status line on stderr. So how often anything is shown doesn't depend on how fast the
+loop is going, and the loop never waits on a terminal.
+"""
+
+import sys
+import threading
+from collections.abc import Callable, Iterator, Sequence
+from dataclasses import dataclass
+from time import perf_counter
+from typing import Self, TypeVar
+
+T = TypeVar("T", bound=Sequence)
+
+# Big enough that counting chunks costs nothing next to the work in them
+CHUNK = 1 << 16
+
+
+@dataclass(frozen=True)
+class Snapshot:
+    desc: str
+    done: int
+    total: int | None
+    elapsed: float
+
+    @property
+    def rate(self) -> float:
+        "Per second"
+        return self.done / self.elapsed if self.elapsed > 0 else 0.0
+
+    @property
+    def eta(self) -> float | None:
+        "Seconds left, at the rate so far"
+        if self.total is None or self.rate == 0:
+            return None
+        return (self.total - self.done) / self.rate
+
+
+def _format_count(n: float) -> str:
+    for unit in ("", "k", "M", "G"):
+        if abs(n) < 1000:
+            return f"{n:.0f}{unit}" if unit == "" else f"{n:.1f}{unit}"
+        n /= 1000
+    return f"{n:.1f}T"
+
+
+def _format_seconds(secs: float) -> str:
+    mins, secs = divmod(int(secs), 60)
+    hours, mins = divmod(mins, 60)
+    return f"{hours}h{mins:02}m{secs:02}s" if hours else f"{mins}m{secs:02}s"
+
+
+def format_snapshot(s: Snapshot) -> str:
+    "e.g. 'seeds  12.3%  1.2G/9.8G  3.1M/s  2m41s left'"
+    parts = [s.desc] if s.desc else []
+    if s.total:
+        parts.append(f"{100 * s.done / s.total:5.1f}%")
+        parts.append(f"{_format_count(s.done)}/{_format_count(s.total)}")
+    else:
+        parts.append(_format_count(s.done))
+    parts.append(f"{_format_count(s.rate)}/s")
+    if s.eta is not None:
+        parts.append(f"{_format_seconds(s.eta)} left")
+    return "  ".join(parts)
+
+
+def to_stderr(snapshot: Snapshot, final: bool = False) -> None:
+    "Redraw one status line, if stderr is a terminal. Logs don't want them"
+    if not sys.stderr.isatty():
+        return
+    end = "\n" if final else ""
+    sys.stderr.write(f"\r\x1b[K{format_snapshot(snapshot)}{end}")
+    sys.stderr.flush()
+
+
+class Progress:
+    """
+    ```
+    with Progress(total=n_seeds, desc="seeds") as progress:
+        for chunk in progress.chunks(seeds):
+            for seed in chunk:
+                ...
+    ```
+
+    Or add to `done` directly. `report(snapshot, final)` is called from the background
+    thread every `interval` seconds, and once more with `final=True` at the end.
+    """
+
+    def __init__(
+        self,
+        total: int | None = None,
+        desc: str = "",
+        interval: float = 0.5,
+        report: Callable[..., None] = to_stderr,
+    ):
+        self.total = total
+        self.desc = desc
+        self.interval = interval
+        self.report = report
+        self.done = 0
+        self._start = 0.0
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def snapshot(self) -> Snapshot:
+        return Snapshot(self.desc, self.done, self.total, perf_counter() - self._start)
+
+    def chunks(self, seq: T, size: int = CHUNK) -> Iterator[T]:
+        """
+        `seq` in slices of `size`, counting each one as done once it's been iterated.
+        Slicing a `range` doesn't copy anything.
+        """
+        for start in range(0, len(seq), size):
+            chunk = seq[start : start + size]
+            yield chunk
+            self.done += len(chunk)
+
+    def _publish(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.report(self.snapshot())
+
+    def __enter__(self) -> Self:
+        self._start = perf_counter()
+        self._thread = threading.Thread(
+            target=self._publish, name=f"progress {self.desc}", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        self.report(self.snapshot(), final=True)
@@ -0,0 +1,114 @@
+"""
+Every day's solution, found by looking at the files, so that listing the days, or what
+stages one has, never imports it. A day's module is only imported to run it.
+"""
+
+import ast
+import functools
+import importlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Protocol
+
+PACKAGE_DIR = Path(__file__).parent
+PARTS = ("part1", "part2")
+
+
+class Solution(Protocol):
+    """
+    What a day's module provides. `solve_part2` is optional too, since no day has one
+    until part 1 is done. A day whose part 2 reads the input differently also defines
+    `parse_input_part2(raw_input)`, and its `solve_part2` takes what that returns.
+
+    When a part's solver is made faster, the simpler version it replaced can be kept as
+    `reference_part1(parsed)` (or 2), taking the same input, for `differential` to check
+    the faster one against.
+
+    A day whose parsers take the input's bytes as well as its text, e.g. because they
+    only use `ints` or `Grid`, sets `READS_BYTES = True`, and is given the bytes of a
+    `loader.MappedInput` when solving an input file.
+    """
+
+    def parse_input(self, raw_input: str) -> Any: ...
+
+    def solve_part1(self, parsed: Any) -> Any: ...
+
+
+@dataclass(frozen=True)
+class Day:
+    number: int
+
+    @property
+    def name(self) -> str:
+        return f"day{self.number:02}"
+
+    @property
+    def module_name(self) -> str:
+        return f"aoc_2023.{self.name}.{self.name}"
+
+    @property
+    def solver_path(self) -> Path:
+        return PACKAGE_DIR / self.name / f"{self.name}.py"
+
+    @property
+    def input_path(self) -> Path:
+        return PACKAGE_DIR / self.name / "input.txt"
+
+    @functools.cached_property
+    def functions(self) -> frozenset[str]:
+        "Names of the functions the module defines, from its source"
+        tree = ast.parse(self.solver_path.read_bytes())
+        return frozenset(
+            node.name for node in tree.body if isinstance(node, ast.FunctionDef)
+        )
+
+    @property
+    def stages(self) -> tuple[str, ...]:
+        "The stages it can run, e.g. ('parse', 'part1')"
+        if "parse_input" not in self.functions:
+            return ()
+        return ("parse",) + tuple(p for p in PARTS if f"solve_{p}" in self.functions)
+
+    @property
+    def references(self) -> tuple[str, ...]:
+        "The parts with a reference solver to check them against"
+        return tuple(
+            p
+            for p in PARTS
+            if f"solve_{p}" in self.functions and f"reference_{p}" in self.functions
+        )
+
+    def load(self) -> Solution:
+        return importlib.import_module(self.module_name)
+
+
+def get_day(day: int) -> Day:
+    "Raises a KeyError if there's no such day"
+    if not Day(day).solver_path.is_file():
+        raise KeyError(f"No solution for day {day}")
+    return Day(day)
+
+
+def discover_days() -> list[int]:
+    "Every `dayNN` package that has a `dayNN.py` module in it"
+    return sorted(
+        int(p.name[3:])
+        for p in PACKAGE_DIR.glob("day[0-9][0-9]")
+        if (p / f"{p.name}.py").is_file()
+    )
+
+
+def load(day: int) -> Solution:
+    return get_day(day).load()
+
+
+def module_name(day: int) -> str:
+    return Day(day).module_name
+
+
+def input_path(day: int) -> Path:
+    return Day(day).input_path
+
+
+def solver_path(day: int) -> Path:
+    return Day(day).solver_path
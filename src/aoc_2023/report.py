@@ -0,0 +1,126 @@
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from aoc_2023.generators import discover_generators, load_generator
+from aoc_2023.registry import load
+from aoc_2023.runner import run_stages
+from aoc_2023.utils import format_ns
+
+STYLE = Path(__file__).parents[2] / "style.mplstyle"
+
+
+@dataclass
+class Sweep:
+    """
+    The fastest time, in nanoseconds, of each stage of a day at each input size.
+
+    Exponents are fitted against the length of the input, rather than the generator's
+    `n`, since for the grid days `n` is the side of the grid.
+    """
+
+    day: int
+    sizes: list[int] = field(default_factory=list)
+    input_lengths: list[int] = field(default_factory=list)
+    timings: dict[str, list[int]] = field(default_factory=dict)
+
+    def exponents(self) -> dict[str, float]:
+        return {
+            stage: fit_exponent(self.input_lengths, times)
+            for stage, times in self.timings.items()
+        }
+
+
+def fit_exponent(sizes: list[int], times: list[int]) -> float:
+    """
+    Fit `time = c * n^k` by least squares on a log-log scale, and return `k`. Roughly 1
+    for a linear stage, 2 for a quadratic one.
+    """
+    import numpy as np
+
+    k, _ = np.polyfit(np.log(sizes), np.log(np.maximum(times, 1)), deg=1)
+    return float(k)
+
+
+def sweep_day(
+    day: int, sizes: list[int] | None = None, seed: int = 0, repeats: int = 3
+) -> Sweep:
+    """
+    Generate an input of each size (defaulting to the generator's `SIZES`), and run the
+    day's stages on it `repeats` times, keeping the fastest time of each stage.
+    """
+    gen = load_generator(day)
+    module = load(day)
+    sweep = Sweep(day=day, sizes=list(sizes or gen.SIZES))
+
+    for n in sweep.sizes:
+        raw_input = gen.generate(n, seed=seed)
+        sweep.input_lengths.append(len(raw_input))
+        best: dict[str, int] = {}
+        for _ in range(repeats):
+            for stage, ns in run_stages(day, module, raw_input).timings.items():
+                best[stage] = min(ns, best.get(stage, ns))
+        for stage, ns in best.items():
+            sweep.timings.setdefault(stage, []).append(ns)
+
+    return sweep
+
+
+def format_table(sweeps: list[Sweep], warn_above: float = 1.5) -> str:
+    header = f"{'Stage':<14}{'Smallest':>12}{'Largest':>12}{'Exponent':>10}"
+    lines = [header]
+    for s in sweeps:
+        for stage, k in s.exponents().items():
+            times = s.timings[stage]
+            flag = "  superlinear" if k > warn_above else ""
+            lines.append(
+                f"{f'day{s.day:02}.{stage}':<14}"
+                f"{format_ns(times[0], 2):>12}{format_ns(times[-1], 2):>12}"
+                f"{k:>10.2f}{flag}"
+            )
+    return "\n".join(lines)
+
+
+def plot(sweep: Sweep, path: Path) -> None:
+    """
+    Plot time against input size on log-log axes, one line per stage, so a stage's
+    exponent is the slope of its line.
+
+    matplotlib is only imported here, since it's slow to import and nothing else
+    needs it. Uses the project's `style.mplstyle` when running from a checkout.
+    """
+    import matplotlib.style
+    import numpy as np
+    from matplotlib.figure import Figure
+
+    with matplotlib.style.context(STYLE if STYLE.is_file() else "default"):
+        fig = Figure(figsize=(10, 7), layout="constrained")
+        ax = fig.subplots()
+        for stage, k in sweep.exponents().items():
+            seconds = np.array(sweep.timings[stage]) / 1e9
+            ax.loglog(
+                sweep.input_lengths, seconds, marker="o", label=f"{stage} (k={k:.2f})"
+            )
+        ax.set_title(f"Day {sweep.day}")
+        ax.set_xlabel("Input length (characters)")
+        ax.set_ylabel("Time (s)")
+        ax.legend()
+        fig.savefig(path)
+
+
+def main(
+    days: list[int], seed: int = 0, repeats: int = 3, output: Path | None = None
+) -> int:
+    """
+    Sweep each day over its generated inputs, and print the fitted exponents. With
+    `output`, also write a `dayNN.png` plot for each day into that directory.
+    """
+    days = sorted(set(days)) or discover_generators()
+    sweeps = [sweep_day(day, seed=seed, repeats=repeats) for day in days]
+
+    print(format_table(sweeps))
+    if output is not None:
+        output.mkdir(parents=True, exist_ok=True)
+        for s in sweeps:
+            plot(s, output / f"day{s.day:02}.png")
+        print(f"\nWrote plots to {output}")
+    return 0
@@ -0,0 +1,356 @@
+import asyncio
+import functools
+import multiprocessing
+import operator
+import os
+from collections.abc import Buffer, Callable
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import AbstractContextManager, nullcontext
+from dataclasses import dataclass, field
+from pathlib import Path
+from time import perf_counter_ns
+
+from aoc_2023.answers import AnswerStore
+from aoc_2023.cache import ParseCache, file_hash, tree_hash
+from aoc_2023.counters import record_counters
+from aoc_2023.loader import MappedInput, decode, reads_bytes
+from aoc_2023.memory import current_rss, track_memory
+from aoc_2023.registry import (
+    PARTS,
+    Solution,
+    discover_days,
+    input_path,
+    load,
+    solver_path,
+)
+from aoc_2023.utils import format_bytes, format_ns, record_spans, span
+
+
+@dataclass
+class DayResult:
+    day: int
+    answers: dict[str, int | str] = field(default_factory=dict)
+    timings: dict[str, int] = field(default_factory=dict)
+    peak_memory: dict[str, int] = field(default_factory=dict)
+    rss_delta: dict[str, int] = field(default_factory=dict)
+    spans: dict[str, int] = field(default_factory=dict)
+    counters: dict[str, int] = field(default_factory=dict)
+    input_bytes: int = 0
+    from_store: bool = False
+    timed_out: str | None = None
+    error: str | None = None
+
+    @property
+    def total_ns(self) -> int:
+        return sum(self.timings.values())
+
+
+def as_answer(x) -> int | str:
+    "Answers come back as python ints, numpy ints, etc. Make them all plain ints"
+    try:
+        return operator.index(x)
+    except TypeError:
+        return str(x)
+
+
+def _parse_and_solve(parse: Callable, solve: Callable, raw_input: str | Buffer):
+    return solve(parse(raw_input))
+
+
+def run_stages(
+    day: int,
+    module: Solution,
+    raw_input: str | Buffer,
+    measure_memory: bool = False,
+    around: Callable[[str], AbstractContextManager] | None = None,
+    parts: tuple[str, ...] = PARTS,
+    cache: ParseCache | None = None,
+    on_stage: Callable[[str, DayResult], None] | None = None,
+    count_work: bool = False,
+) -> DayResult:
+    """
+    Run the stages a day module provides, timing each one. If part 2 needs its own
+    parse (see `registry.Solution`), that parse is timed as part of part 2.
+
+    How much each stage grew the resident set is always recorded, since reading it is
+    cheap. With `measure_memory`, also record the peak traced memory of each stage.
+    Tracing memory slows the stages down, so the timings of such a run are not worth
+    much.
+
+    Any `utils.span()` a stage enters ends up in `spans`, keyed like
+    "part1/build_graph". `around(stage)`, if given, is entered just inside the timing of
+    each stage, e.g. to profile one of them. Only the `parts` given are solved. With a
+    `cache`, the parsers are only run if there's no parse of this input on disk.
+
+    `on_stage(stage, result)` is called as each stage finishes, with the result so far,
+    e.g. to report the stages that did finish if a later one never does.
+
+    With `count_work`, every `counters.count()` a stage makes ends up in `counters`,
+    keyed like "part1/steps". Counting slows some stages down too.
+
+    `raw_input` can be the input's bytes, e.g. a `loader.MappedInput`'s, which are
+    decoded first for a day that doesn't read bytes (see `registry.Solution`).
+    """
+    if isinstance(raw_input, str):
+        result = DayResult(day=day, input_bytes=len(raw_input.encode()))
+    else:
+        result = DayResult(day=day, input_bytes=memoryview(raw_input).nbytes)
+        if not reads_bytes(module):
+            raw_input = decode(raw_input)
+    if not hasattr(module, "parse_input"):
+        return result
+
+    def run(stage: str, fn: Callable, *args):
+        memory = track_memory() if measure_memory else nullcontext()
+        counting = record_counters() if count_work else nullcontext()
+        extra = around(stage) if around is not None else nullcontext()
+        rss_before = current_rss()
+        with memory as mem, counting as counts, span(stage), extra:
+            out = fn(*args)
+        result.timings[stage] = spans.timings[stage]
+        result.rss_delta[stage] = current_rss() - rss_before
+        if mem is not None:
+            result.peak_memory[stage] = mem.peak
+        if counts is not None:
+            result.counters |= {f"{stage}/{name}": n for name, n in counts.items()}
+        return out
+
+    def parser(name: str) -> Callable:
+        return cache.parser(module, name) if cache else getattr(module, name)
+
+    with record_spans() as spans:
+        parsed = run("parse", parser("parse_input"), raw_input)
+        if on_stage is not None:
+            on_stage("parse", result)
+
+        for part in parts:
+            solver = getattr(module, f"solve_{part}", None)
+            if solver is None:
+                continue
+
+            if part == "part2" and hasattr(module, "parse_input_part2"):
+                answer = run(
+                    part,
+                    _parse_and_solve,
+                    parser("parse_input_part2"),
+                    solver,
+                    raw_input,
+                )
+            else:
+                answer = run(part, solver, parsed)
+            result.answers[part] = as_answer(answer)
+            if on_stage is not None:
+                on_stage(part, result)
+
+    result.spans = {path: ns for path, ns in spans.timings.items() if "/" in path}
+    return result
+
+
+def run_day(
+    day: int,
+    path: Path | None = None,
+    measure_memory: bool = False,
+    cache: ParseCache | None = None,
+    count_work: bool = False,
+) -> DayResult:
+    """
+    Import the day's module, and run it on `path`, defaulting to its `input.txt`. The
+    file is memory mapped, and only decoded if the day doesn't read bytes.
+
+    With `measure_memory`, run it a second time to find the peak traced memory of each
+    stage, so that tracing doesn't throw the timings off. Likewise with `count_work`,
+    for the counts of each stage's work.
+    """
+    module = load(day)
+    with MappedInput(path or input_path(day)) as mapped:
+        raw_input = mapped.data if reads_bytes(module) else mapped.text()
+        result = run_stages(day, module, raw_input, cache=cache)
+        if measure_memory:
+            result.peak_memory = run_stages(
+                day, module, raw_input, measure_memory=True
+            ).peak_memory
+        if count_work:
+            counted = run_stages(day, module, raw_input, count_work=True)
+            result.counters = counted.counters
+    return result
+
+
+def print_day(day: int) -> None:
+    """
+    Solve a day on its `input.txt`, and print the answers, then how long each stage
+    (and any spans inside it) took. What each day runs when run as a script.
+    """
+    result = run_day(day)
+    for part, answer in result.answers.items():
+        print(f"Part {part[-1]}: {answer}")
+
+    print("\n")
+    names = {"parse": "Setup", "part1": "Part 1", "part2": "Part 2"}
+    for stage, ns in result.timings.items():
+        print(f"{names[stage]} took {format_ns(ns)}")
+        for path, span_ns in result.spans.items():
+            if path.startswith(f"{stage}/"):
+                *parents, name = path.split("/")
+                print(f"{'  ' * len(parents)}{name} took {format_ns(span_ns)}")
+
+
+def answer_key(day: int) -> tuple[str, str]:
+    """
+    What an answer store looks a day's answers up by: hashes of its input, and of its
+    code, including the shared modules it imports
+    """
+    return file_hash(input_path(day)), tree_hash(solver_path(day))
+
+
+def stored_result(store: AnswerStore, day: int) -> DayResult | None:
+    answers = store.get(day, *answer_key(day))
+    return DayResult(day=day, answers=answers, from_store=True) if answers else None
+
+
+def _fmt_time(ns: int | None) -> str:
+    return format_ns(ns) if ns else "-"
+
+
+def _stage_cell(r: DayResult, stage: str) -> str:
+    if r.timed_out == stage:
+        return "timeout"
+    if r.error is not None and stage not in r.timings:
+        return "error"
+    return _fmt_time(r.timings.get(stage))
+
+
+def format_table(results: list[DayResult]) -> str:
+    header = (
+        f"{'Day':<5}{'Part 1':>18}{'Part 2':>18}"
+        f"{'Parse':>10}{'Part 1':>10}{'Part 2':>10}{'Total':>10}"
+    )
+    lines = [header]
+    for r in results:
+        p1 = r.answers.get("part1", "-")
+        p2 = r.answers.get("part2", "-")
+        if r.from_store:
+            lines.append(f"{r.day:02}   {p1:>18}{p2:>18}{'(stored answers)':>40}")
+            continue
+        lines.append(
+            f"{r.day:02}   {p1:>18}{p2:>18}"
+            f"{_stage_cell(r, 'parse'):>10}"
+            f"{_stage_cell(r, 'part1'):>10}"
+            f"{_stage_cell(r, 'part2'):>10}"
+            f"{_fmt_time(r.total_ns):>10}"
+        )
+    return "\n".join(lines)
+
+
+def format_memory_table(results: list[DayResult]) -> str:
+    header = f"{'Stage':<14}{'Peak traced':>14}{'RSS delta':>14}"
+    lines = [header]
+    for r in results:
+        for stage in r.timings:
+            peak = r.peak_memory.get(stage)
+            rss = r.rss_delta.get(stage)
+            lines.append(
+                f"{f'day{r.day:02}.{stage}':<14}"
+                f"{format_bytes(peak) if peak is not None else '-':>14}"
+                f"{format_bytes(rss) if rss is not None else '-':>14}"
+            )
+    return "\n".join(lines)
+
+
+def format_counters_table(results: list[DayResult]) -> str:
+    "Each count, and how many that is per byte of the input"
+    header = f"{'Counter':<30}{'Count':>16}{'Per byte':>12}"
+    lines = [header]
+    for r in results:
+        for name, n in r.counters.items():
+            per_byte = f"{n / r.input_bytes:.2f}" if r.input_bytes else "-"
+            lines.append(f"{f'day{r.day:02}.{name}':<30}{n:>16,}{per_byte:>12}")
+    return "\n".join(lines)
+
+
+def run_all(
+    days: list[int],
+    jobs: int | None = None,
+    measure_memory: bool = False,
+    cache: ParseCache | None = None,
+    count_work: bool = False,
+) -> list[DayResult]:
+    """
+    Farm the days out over a process pool. Each worker only imports the days it runs,
+    and pays for numpy, polars, etc. once, no matter how many days it picks up.
+
+    Workers are spawned rather than forked, since forking a process that already has
+    threads running (e.g. polars' thread pool) can deadlock.
+    """
+    if not days:
+        return []
+    jobs = min(jobs or os.cpu_count() or 1, len(days))
+    ctx = multiprocessing.get_context("spawn")
+    run = functools.partial(
+        run_day, measure_memory=measure_memory, cache=cache, count_work=count_work
+    )
+    with ProcessPoolExecutor(max_workers=jobs, mp_context=ctx) as pool:
+        return list(pool.map(run, days))
+
+
+def main(
+    days: list[int],
+    jobs: int | None = None,
+    measure_memory: bool = False,
+    cache: ParseCache | None = None,
+    answers: AnswerStore | None = None,
+    timeout: float | None = None,
+    budgets: dict[str, float] | None = None,
+    count_work: bool = False,
+) -> int:
+    """
+    Run the days, and print a table of their answers and timings. With an `answers`
+    store, days whose input and code haven't changed since they were last run aren't
+    run again, and the answers of the days that are run get stored.
+
+    With a `timeout`, each day runs in its own worker process instead, which is killed
+    if any stage takes longer than `timeout` seconds (or its budget in `budgets`). Then
+    measuring memory, counting work, and the parse cache aren't available.
+    """
+    days = sorted(set(days)) or discover_days()
+    start = perf_counter_ns()
+
+    stored = [r for day in days if answers and (r := stored_result(answers, day))]
+    to_run = [day for day in days if day not in {r.day for r in stored}]
+    if timeout is None:
+        results = run_all(
+            to_run,
+            jobs,
+            measure_memory=measure_memory,
+            cache=cache,
+            count_work=count_work,
+        )
+    else:
+        # Imported here, since it imports this module
+        from aoc_2023 import orchestrate
+
+        jobs = jobs or os.cpu_count() or 1
+        results = asyncio.run(orchestrate.run_all(to_run, timeout, budgets, jobs))
+
+    if answers is not None:
+        for r in results:
+            # A day that didn't finish would otherwise never be run in full again
+            if r.answers and r.timed_out is None and r.error is None:
+                answers.put(r.day, *answer_key(r.day), r.answers)
+    results = sorted(stored + results, key=lambda r: r.day)
+
+    wall_time = perf_counter_ns() - start
+
+    print(format_table(results))
+    if measure_memory:
+        print()
+        print(format_memory_table(results))
+    if count_work:
+        print()
+        print(format_counters_table(results))
+    print(f"\nWall time {format_ns(wall_time)}")
+    print(f"Sum of days {_fmt_time(sum(r.total_ns for r in results))}")
+
+    unfinished = [r for r in results if r.timed_out or r.error]
+    for r in unfinished:
+        print(f"Day {r.day:02} {r.error or f'timed out in {r.timed_out}'}")
+    return 1 if unfinished else 0
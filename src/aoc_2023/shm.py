@@ -0,0 +1,99 @@
+"""
+Parsed inputs in shared memory, so that worker processes can all use one without it
+being pickled, sent down a pipe, and unpickled again in every one of them.
+
+`share()` pickles the parsed input with protocol 5, which hands over the data of each
+NumPy array separately instead of copying it into the pickle, and lays out the pickle
+and those buffers in one `SharedMemory` block. Workers are only sent a `SharedRef`, the
+block's name and where things are in it, and `load()` unpickles the input with each
+array a read only view of the block.
+"""
+
+import pickle
+import sys
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any
+
+# Each array's data starts on a cache line
+ALIGN = 64
+
+# The blocks this process has attached to, by name
+_attached: dict[str, SharedMemory] = {}
+
+
+@dataclass(frozen=True)
+class SharedRef:
+    "A shared object. The pickle is at the start of the block, then each array's data"
+
+    name: str
+    pickle_size: int
+    buffers: tuple[tuple[int, int], ...]
+
+
+def _align(pos: int) -> int:
+    return -(-pos // ALIGN) * ALIGN
+
+
+@contextmanager
+def share(obj: Any) -> Iterator[SharedRef]:
+    "Put `obj` in a new block, which is removed when the `with` block ends"
+    buffers: list[pickle.PickleBuffer] = []
+    data = pickle.dumps(obj, protocol=5, buffer_callback=buffers.append)
+    raws = [b.raw() for b in buffers]
+
+    spans = []
+    end = len(data)
+    for raw in raws:
+        start = _align(end)
+        end = start + raw.nbytes
+        spans.append((start, end))
+
+    shm = SharedMemory(create=True, size=max(end, 1))
+    try:
+        shm.buf[: len(data)] = data
+        for raw, (start, stop) in zip(raws, spans, strict=True):
+            shm.buf[start:stop] = raw
+        yield SharedRef(shm.name, len(data), tuple(spans))
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+def _attach(name: str) -> SharedMemory:
+    if sys.version_info >= (3, 13):
+        return SharedMemory(name, track=False)
+    # Otherwise this process would remove the block when it exits, though it's not its
+    shm = SharedMemory(name)
+    resource_tracker.unregister(shm._name, "shared_memory")
+    return shm
+
+
+def load(ref: SharedRef) -> Any:
+    """
+    A new copy of the shared object each call, apart from its arrays, which are read
+    only views of the block, so a solver can't change them under another process.
+    """
+    shm = _attached.get(ref.name)
+    if shm is None:
+        shm = _attached[ref.name] = _attach(ref.name)
+    buf = shm.buf.toreadonly()
+    views = [buf[start:stop] for start, stop in ref.buffers]
+    return pickle.loads(buf[: ref.pickle_size], buffers=views)
+
+
+def detach(ref: SharedRef) -> None:
+    """
+    Unmap the block in this process, once nothing loaded from it is used any more. If
+    some array from it is still around, it stays mapped until the process exits.
+    """
+    shm = _attached.pop(ref.name, None)
+    if shm is None:
+        return
+    try:
+        shm.close()
+    except BufferError:
+        _attached[ref.name] = shm
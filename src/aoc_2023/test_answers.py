@@ -0,0 +1,21 @@
+from aoc_2023.answers import AnswerStore
+
+
+def test_answer_store(tmp_path):
+    store = AnswerStore(path=tmp_path / "answers.sqlite")
+    assert {} == store.get(5, "input", "solver")
+
+    store.put(5, "input", "solver", {"part1": 2**70, "part2": "ABC"})
+    assert {"part1": 2**70, "part2": "ABC"} == store.get(5, "input", "solver")
+
+    # Changing the code or the input means nothing is stored for them yet
+    assert {} == store.get(5, "input", "edited solver")
+    assert {} == store.get(5, "other input", "solver")
+    assert {} == store.get(6, "input", "solver")
+
+
+def test_answer_store_replaces(tmp_path):
+    store = AnswerStore(path=tmp_path / "answers.sqlite")
+    store.put(5, "input", "solver", {"part1": 1})
+    store.put(5, "input", "solver", {"part1": 2})
+    assert {"part1": 2} == store.get(5, "input", "solver")
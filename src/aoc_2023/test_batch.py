@@ -0,0 +1,85 @@
+import csv
+
+import pytest
+
+from aoc_2023.batch import find_inputs, main, solve_batch, solve_file, write_table
+from aoc_2023.cache import ParseCache
+
+example = """\
+Time:      7  15   30
+Distance:  9  40  200
+"""
+
+
+@pytest.fixture
+def inputs(tmp_path):
+    day_dir = tmp_path / "day06"
+    day_dir.mkdir()
+    (day_dir / "a.txt").write_text(example)
+    (day_dir / "b.txt").write_text(example)
+    (day_dir / "bad.txt").write_text("Time: 7\n")
+    return tmp_path
+
+
+def test_find_inputs(inputs):
+    expected = ["a.txt", "b.txt", "bad.txt"]
+    assert expected == [p.name for p in find_inputs(str(inputs / "day06"), 6)]
+    assert expected == [p.name for p in find_inputs(str(inputs / "day{day:02}"), 6)]
+    assert ["a.txt"] == [p.name for p in find_inputs(str(inputs / "*/a.txt"), 6)]
+    assert [] == find_inputs(str(inputs / "day{day:02}"), 7)
+
+
+def test_solve_file(inputs):
+    row = solve_file(6, inputs / "day06" / "a.txt")
+    assert ("288", "71503", "") == (row["part1"], row["part2"], row["error"])
+    assert row["parse_ns"] > 0
+
+    bad = solve_file(6, inputs / "day06" / "bad.txt")
+    assert bad["error"]
+    assert bad["part1"] is None
+
+
+def test_solve_batch(inputs):
+    tasks = [(6, p) for p in find_inputs(str(inputs / "day06"), 6)]
+    rows = solve_batch(tasks, jobs=2)
+    assert [p.name for _, p in tasks] == [row["input"].split("/")[-1] for row in rows]
+    assert ["288", "288", None] == [row["part1"] for row in rows]
+    assert [] == solve_batch([])
+
+
+def test_solve_batch_cache(inputs, tmp_path):
+    cache = ParseCache(directory=tmp_path / "cache")
+    tasks = [(6, inputs / "day06" / "a.txt")]
+    first = solve_batch(tasks, jobs=1, cache=cache)
+    # One for each of day 6's parsers
+    entries = cache.entries()
+    assert 2 == len(entries)
+    assert first[0]["part1"] == solve_batch(tasks, jobs=1, cache=cache)[0]["part1"]
+    # Both hit, so nothing new was written. Hits reorder them, so compare as sets
+    assert set(entries) == set(cache.entries())
+
+
+def test_write_table_csv(inputs, tmp_path):
+    rows = [solve_file(6, inputs / "day06" / "a.txt")]
+    write_table(rows, tmp_path / "out" / "answers.csv")
+    with (tmp_path / "out" / "answers.csv").open() as f:
+        (got,) = list(csv.DictReader(f))
+    assert "288" == got["part1"]
+
+
+def test_write_table_parquet(inputs, tmp_path):
+    pl = pytest.importorskip("polars")
+    rows = [solve_file(6, p) for p in find_inputs(str(inputs / "day06"), 6)]
+    write_table(rows, tmp_path / "answers.parquet")
+    table = pl.read_parquet(tmp_path / "answers.parquet")
+    assert ["288", "288", None] == table["part1"].to_list()
+
+
+def test_main(inputs, tmp_path):
+    (inputs / "day06" / "bad.txt").unlink()
+    out = tmp_path / "answers.csv"
+    assert 0 == main(str(inputs / "day{day:02}"), [6], jobs=1, output=out)
+    assert out.is_file()
+    # Several days need to know where each day's inputs are
+    assert 2 == main(str(inputs / "day06"), [6, 9])
+    assert 1 == main(str(inputs / "nothing"), [6])
@@ -0,0 +1,74 @@
+import json
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from aoc_2023.bench import DayBenchmark, Stats, benchmark_day, format_table, to_json
+
+
+def test_stats_from_samples():
+    got = Stats.from_samples([5, 1, 3, 2, 4])
+    assert got.runs == 5
+    assert got.min == 1
+    assert got.median == 3
+    assert got.mean == 3
+    assert got.p95 == pytest.approx(4.8)
+    assert got.stddev == pytest.approx(1.5811, abs=1e-4)
+
+
+def test_stats_single_sample():
+    got = Stats.from_samples([7])
+    assert (got.min, got.median, got.p95, got.stddev) == (7, 7, 7, 0.0)
+
+
+def test_benchmark_day():
+    got = benchmark_day(4, repeats=3, warmup=1)
+    # Day 4's part 2 modifies the cards, so this only holds if each run re-parses
+    assert got.answers == {"part1": 21088, "part2": 6874754}
+    assert set(got.stages) == {"parse", "part1", "part2"}
+    assert all(s.runs == 3 for s in got.stages.values())
+
+
+def test_to_json():
+    b = benchmark_day(2, repeats=2, warmup=0)
+    got = json.loads(json.dumps(to_json([b], repeats=2, warmup=0)))
+    assert got["meta"]["repeats"] == 2
+    assert got["answers"] == {"day02.part1": 2449, "day02.part2": 63981}
+    assert set(got["stages"]) == {"day02.parse", "day02.part1", "day02.part2"}
+    assert got["stages"]["day02.parse"]["runs"] == 2
+    assert got["input_bytes"]["day02"] > 0
+    assert "day02.part2" in format_table([b])
+
+
+def test_format_table_long_stage():
+    stats = Stats.from_samples([1, 2, 3])
+    stage = "part2/" + "x" * 40
+    b = DayBenchmark(day=3, stages={"parse": stats, stage: stats})
+    header, *rows = format_table([b]).splitlines()
+    # The numbers line up under the header, however long the stage's name
+    assert all(len(row) == len(header) for row in rows)
+    assert rows[1].startswith(f"day03.{stage}  ")
+
+
+def test_benchmark_day_counters():
+    got = benchmark_day(8, repeats=1, warmup=0, measure_memory=False)
+    assert {} == got.peak_memory
+    assert got.answers["part1"] == got.counters["part1/steps"]
+    flat = to_json([got], repeats=1, warmup=0)["counters"]
+    assert flat["day08.part1/steps"] == got.counters["part1/steps"]
+
+
+def test_benchmark_day_pool():
+    ctx = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=2, mp_context=ctx) as pool:
+        got = benchmark_day(4, repeats=3, warmup=1, pool=pool, jobs=2)
+    # The parts' runs are split 2 and 1, each on its own copy of the cards
+    assert got.answers == {"part1": 21088, "part2": 6874754}
+    assert set(got.stages) == {"parse", "part1", "part2"}
+    assert all(s.runs == 3 for s in got.stages.values())
+
+    # Day 19 has no stages yet, so nothing to share with the workers
+    with ProcessPoolExecutor(max_workers=2, mp_context=ctx) as pool:
+        got = benchmark_day(19, repeats=2, warmup=0, pool=pool, jobs=2)
+    assert ({}, {}) == (got.answers, got.stages)
@@ -0,0 +1,188 @@
+import os
+from types import SimpleNamespace
+
+import numpy as np
+import polars as pl
+
+from aoc_2023 import registry
+from aoc_2023.answers import AnswerStore
+from aoc_2023.cache import ParseCache, tree_hash
+from aoc_2023.day07 import day07
+from aoc_2023.day11 import day11
+from aoc_2023.day15 import day15
+from aoc_2023.runner import answer_key, run_day, stored_result
+
+raw_input = """...#......
+.......#..
+#.........
+..........
+......#...
+.#........
+.........#
+..........
+.......#..
+#...#....."""
+
+
+def test_parse_cache(tmp_path):
+    cache = ParseCache(directory=tmp_path)
+    want = day11.parse_input(raw_input)
+
+    first = cache.parse(day11, "parse_input", raw_input)
+    second = cache.parse(day11, "parse_input", raw_input)
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert np.array_equal(want, first)
+    assert np.array_equal(want, second)
+    assert [".npy"] == [p.suffix for p in tmp_path.iterdir()]
+
+    # A different input is a different entry
+    cache.parse(day11, "parse_input", raw_input.replace("#", "."))
+    assert (cache.hits, cache.misses) == (1, 2)
+
+
+def test_parse_cache_formats(tmp_path):
+    cache = ParseCache(directory=tmp_path)
+    hands = "32T3K 765\nT55J5 684"
+    want = day07.parse_input(hands).collect()
+    for _ in range(2):
+        # Scans of the parquet file, whether it was just written or not
+        got = cache.parse(day07, "parse_input", hands)
+        assert isinstance(got, pl.LazyFrame)
+        assert got.collect().equals(want)
+
+    steps = "rn=1,cm-"
+    assert day15.parse_input(steps) == cache.parse(day15, "parse_input", steps)
+    assert {".parquet", ".pkl"} == {p.suffix for p in tmp_path.iterdir()}
+
+
+def test_parse_cache_data_frame(tmp_path, monkeypatch):
+    # Eager data frames are kept as Arrow IPC instead
+    monkeypatch.setattr(day07, "parse_input", lambda s: day07.parse_hands(s).collect())
+    cache = ParseCache(directory=tmp_path)
+    hands = "32T3K 765\nT55J5 684"
+    first = cache.parse(day07, "parse_input", hands)
+    second = cache.parse(day07, "parse_input", hands)
+    assert isinstance(second, pl.DataFrame)
+    assert second.equals(first)
+    assert [".arrow"] == [p.suffix for p in tmp_path.iterdir()]
+
+
+def test_parse_cache_bad_parquet(tmp_path):
+    cache = ParseCache(directory=tmp_path)
+    hands = "32T3K 765"
+    cache.parse(day07, "parse_input", hands)
+    (path,) = tmp_path.iterdir()
+    path.write_bytes(b"PAR1")
+    # Parsed again, and the broken entry replaced
+    assert 765 == cache.parse(day07, "parse_input", hands).collect()["bid"].item()
+    assert (cache.hits, cache.misses) == (0, 2)
+
+
+def test_parse_cache_ignores_entries_being_written(tmp_path):
+    cache = ParseCache(directory=tmp_path)
+    key = cache.key(day11, "parse_input", raw_input)
+    # Another process part way through storing it, as either kind
+    writing = {
+        tmp_path / f"{key}.npy.123.tmp": b"\x93NUMPY\x01",
+        tmp_path / f"{key}.pkl.123.tmp": b"\x80",
+    }
+    for path, data in writing.items():
+        path.write_bytes(data)
+
+    assert np.array_equal(
+        day11.parse_input(raw_input), cache.parse(day11, "parse_input", raw_input)
+    )
+    assert (cache.hits, cache.misses) == (0, 1)
+    assert all(path.exists() for path in writing)
+
+
+def test_parse_cache_bad_pickle(tmp_path):
+    cache = ParseCache(directory=tmp_path)
+    cache.parse(day15, "parse_input", "rn=1")
+    (path,) = tmp_path.iterdir()
+    path.write_bytes(b"not a pickle")
+    assert ["rn=1"] == cache.parse(day15, "parse_input", "rn=1")
+    assert (cache.hits, cache.misses) == (0, 2)
+
+
+def test_parse_cache_evicts_least_recently_used(tmp_path):
+    cache = ParseCache(directory=tmp_path, max_bytes=1)
+    cache.parse(day15, "parse_input", "rn=1")
+    oldest = next(tmp_path.iterdir())
+    os.utime(oldest, (0, 0))
+
+    cache.parse(day15, "parse_input", "cm-")
+    # Always over the limit, so only the entry just written is left
+    assert 1 == len(cache.entries())
+    assert not oldest.exists()
+
+
+def test_parse_cache_keeps_entries_in_use(tmp_path):
+    # As a batch worker would, while another one adds to the cache
+    cache = ParseCache(directory=tmp_path, max_bytes=1)
+    scan = cache.parse(day07, "parse_input", "32T3K 765")
+    ParseCache(directory=tmp_path, max_bytes=1).parse(day07, "parse_input", "T55J5 684")
+    assert 2 == len(cache.entries())
+    assert 765 == scan.collect()["bid"].item()
+
+    # Once it's not been used for `min_age`, it goes
+    cache.min_age = 0
+    cache.parse(day15, "parse_input", "rn=1")
+    assert 1 == len(cache.entries())
+
+
+def test_run_day_with_cache(tmp_path):
+    cache = ParseCache(directory=tmp_path)
+    want = run_day(6).answers
+    assert want == run_day(6, cache=cache).answers
+    assert want == run_day(6, cache=cache).answers
+    assert (cache.hits, cache.misses) == (2, 2)
+
+
+def package(tmp_path):
+    "A day 99 using a shared `helper` module, in a package of its own"
+    package_dir = tmp_path / "aoc_2023"
+    (package_dir / "day99").mkdir(parents=True)
+    (package_dir / "day99" / "day99.py").write_text(
+        "from aoc_2023.helper import parse\n\n"
+        "if __name__ == '__main__':\n"
+        "    from aoc_2023.runner import print_day\n"
+    )
+    (package_dir / "day99" / "input.txt").write_text("1 2 3")
+    (package_dir / "helper.py").write_text("from aoc_2023 import other\n")
+    (package_dir / "other.py").write_text("")
+    return package_dir
+
+
+def test_tree_hash(tmp_path):
+    package_dir = package(tmp_path)
+    solver = package_dir / "day99" / "day99.py"
+    before = tree_hash(solver)
+    # Imported by the helper, so used by the day too
+    (package_dir / "other.py").write_text("X = 1\n")
+    assert before != tree_hash(solver)
+
+
+def test_shared_module_edit_invalidates_parse(tmp_path):
+    package_dir = package(tmp_path)
+    solver = package_dir / "day99" / "day99.py"
+    module = SimpleNamespace(
+        __file__=str(solver), __name__="aoc_2023.day99.day99", parse_input=str.split
+    )
+    cache = ParseCache(directory=tmp_path / "parsed")
+    cache.parse(module, "parse_input", "1 2 3")
+
+    (package_dir / "helper.py").write_text("from aoc_2023 import other\n\nX = 2\n")
+    cache.parse(module, "parse_input", "1 2 3")
+    assert (cache.hits, cache.misses) == (0, 2)
+
+
+def test_shared_module_edit_invalidates_answers(tmp_path, monkeypatch):
+    package_dir = package(tmp_path)
+    monkeypatch.setattr(registry, "PACKAGE_DIR", package_dir)
+    store = AnswerStore(tmp_path / "answers.sqlite")
+    store.put(99, *answer_key(99), {"part1": 6})
+    assert stored_result(store, 99) is not None
+
+    (package_dir / "other.py").write_text("X = 2\n")
+    assert stored_result(store, 99) is None
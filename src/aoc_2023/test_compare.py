@@ -0,0 +1,89 @@
+import json
+
+import pytest
+
+from aoc_2023.bench import benchmark_day, to_json
+from aoc_2023.compare import compare, days_in, format_diff, main, only_days
+
+
+def results(median: float, peak: int, answer: int = 10) -> dict:
+    return {
+        "answers": {"day07.part1": answer},
+        "stages": {"day07.part1": {"median": median}},
+        "memory": {"day07.part1": peak},
+    }
+
+
+compare_params = [
+    # Within the threshold
+    (results(1_000_000, 1_000_000), results(1_100_000, 1_100_000), False),
+    # 50% slower
+    (results(1_000_000, 1_000_000), results(1_500_000, 1_000_000), True),
+    # 50% slower, but only by a few microseconds, so just noise
+    (results(1_000, 1_000_000), results(1_500, 1_000_000), False),
+    # Twice the memory
+    (results(1_000_000, 1_000_000), results(1_000_000, 2_000_000), True),
+    # Faster, and less memory
+    (results(1_000_000, 1_000_000), results(500_000, 500_000), False),
+    # Different answer
+    (results(1_000_000, 1_000_000), results(1_000_000, 1_000_000, answer=11), True),
+]
+
+
+@pytest.mark.parametrize("baseline, current, want", compare_params)
+def test_compare(baseline, current, want):
+    changes = compare(baseline, current, threshold=0.2)
+    got = any(c.regressed for c in changes)
+    assert want == got
+
+
+def test_compare_missing():
+    # Part 2 crashed, so there's no time or answer for it
+    baseline = results(1_000_000, 1_000_000)
+    baseline["stages"]["day07.part2"] = {"median": 1_000_000}
+    baseline["answers"]["day07.part2"] = 5
+    changes = compare(baseline, results(1_000_000, 1_000_000))
+    missing = {(c.key, c.metric) for c in changes if c.regressed}
+    assert {("day07.part2", "time"), ("day07.part2", "answer")} == missing
+    assert "missing" in format_diff(changes)
+
+    # Something new isn't a regression
+    changes = compare(results(1_000_000, 1_000_000), baseline)
+    assert not any(c.regressed for c in changes)
+    assert "new" in format_diff(changes)
+
+
+def test_only_days():
+    both = {
+        "stages": {"day05.part1": {}, "day07.part1": {}},
+        "answers": {"day07.part1": 1},
+    }
+    assert {
+        "stages": {"day07.part1": {}},
+        "memory": {},
+        "answers": {"day07.part1": 1},
+    } == (only_days(both, [7]))
+
+
+def test_format_diff():
+    changes = compare(results(1_000_000, 1_000), results(1_500_000, 1_000))
+    got = format_diff(changes)
+    assert "+50%" in got
+    assert "REGRESSED" in got
+
+
+def test_days_in():
+    got = days_in({"stages": {"day05.part2": {}, "day05.parse": {}, "day11.part1": {}}})
+    assert [5, 11] == got
+
+
+def test_main(tmp_path, capsys):
+    baseline = to_json([benchmark_day(6, repeats=2, warmup=0)], repeats=2, warmup=0)
+    # Pretend everything used to be a lot slower, so the re-run can't regress
+    for stats in baseline["stages"].values():
+        stats["median"] *= 1_000
+    path = tmp_path / "baseline.json"
+    path.write_text(json.dumps(baseline))
+
+    assert 0 == main(path, days=[], repeats=2, warmup=0, threshold=0.2)
+    assert "No regressions" in capsys.readouterr().out
@@ -0,0 +1,51 @@
+from aoc_2023 import counters
+from aoc_2023.counters import count, record_counters
+from aoc_2023.day05.day05 import Mapping
+from aoc_2023.graph import Graph
+
+
+def test_count():
+    with record_counters() as got:
+        assert counters.enabled
+        count("steps")
+        count("steps", 2)
+        count("probes", 5)
+    assert {"steps": 3, "probes": 5} == got
+    assert not counters.enabled
+
+
+def test_count_not_recording():
+    # Does nothing, rather than failing
+    count("steps")
+    assert not counters.enabled
+
+
+def test_nested():
+    with record_counters() as outer:
+        count("a")
+        with record_counters() as inner:
+            count("b")
+        assert counters.enabled
+        count("a")
+    assert {"a": 2} == outer
+    assert {"b": 1} == inner
+
+
+def test_mapping_range_probes():
+    m = Mapping(
+        source="soil",
+        dest="fertilizer",
+        mapping={range(15, 52): range(1, 38), range(52, 54): range(37, 39)},
+    )
+    with record_counters() as got:
+        assert 38 == m.get(53)
+        assert 100 == m.get(100)
+    # The second range for 53, then both for 100, which isn't in either
+    assert {"range_probes": 4} == got
+
+
+def test_longest_path_paths():
+    graph = Graph.from_edges(3, [0, 0, 1], [2, 1, 2], weights=[5, 1, 1])
+    with record_counters() as got:
+        assert 5 == graph.longest_path(0, 2)
+    assert {"paths": 2} == got
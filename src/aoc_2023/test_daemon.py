@@ -0,0 +1,84 @@
+import os
+import stat
+import tempfile
+import threading
+
+import pytest
+
+from aoc_2023.conftest import edit
+from aoc_2023.daemon import SolverDaemon, default_socket_path, request, solve
+
+
+@pytest.fixture
+def socket_path(tmp_path):
+    path = tmp_path / "aoc.sock"
+    daemon = SolverDaemon(path)
+    thread = threading.Thread(target=daemon.serve_forever)
+    thread.start()
+    yield path
+    daemon.shutdown()
+    thread.join()
+    daemon.server_close()
+
+
+def test_daemon_solve(socket_path):
+    got = request({"day": 6}, socket_path)
+    assert got["ok"]
+    assert {"part1": 131376, "part2": 34123437} == got["answers"]
+    assert {"parse", "part1", "part2"} == set(got["timings"])
+
+
+def test_daemon_solve_input(socket_path):
+    raw_input = "Time:      7  15   30\nDistance:  9  40  200"
+    got = request({"day": 6, "parts": ["part1"], "input": raw_input}, socket_path)
+    assert {"part1": 288} == got["answers"]
+
+
+def test_daemon_errors(socket_path):
+    assert not request({"day": 14}, socket_path)["ok"]
+    got = request({"day": 6, "path": "/does/not/exist"}, socket_path)
+    assert got["error"].startswith("FileNotFoundError")
+    # Still serving after a failed request
+    assert request({"command": "ping"}, socket_path)["ok"]
+
+
+def test_solve(socket_path, capsys):
+    assert 0 == solve(6, ["part2"], socket_path=socket_path)
+    assert "Part 2: 34123437" in capsys.readouterr().out
+
+
+def test_daemon_reloads_shared_modules(day99, tmp_path):
+    with SolverDaemon(tmp_path / "aoc.sock") as daemon:
+        assert {"part1": 6} == daemon.solve({"day": 99})["answers"]
+        # Used by the day through `shared99`, which is reloaded after it
+        edit(day99 / "scale99.py", "SCALE = 2\n")
+        assert {"part1": 12} == daemon.solve({"day": 99})["answers"]
+
+
+def test_default_socket_path(tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path / "run"))
+    assert tmp_path / "run" == default_socket_path().parent
+
+    # Without one, a directory only the user can get into
+    monkeypatch.delenv("XDG_RUNTIME_DIR")
+    monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+    path = default_socket_path()
+    assert tmp_path == path.parent.parent
+    assert 0o700 == stat.S_IMODE(path.parent.stat().st_mode)
+    assert path == default_socket_path()
+
+    # Not one someone else could connect through
+    os.chmod(path.parent, 0o777)
+    with pytest.raises(PermissionError):
+        default_socket_path()
+
+
+def test_shutdown(tmp_path):
+    path = tmp_path / "aoc.sock"
+    with SolverDaemon(path) as daemon:
+        thread = threading.Thread(target=daemon.serve_forever)
+        thread.start()
+        assert request({"command": "shutdown"}, path)["ok"]
+        thread.join(timeout=5)
+        assert not thread.is_alive()
+    assert not path.exists()
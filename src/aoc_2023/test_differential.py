@@ -0,0 +1,71 @@
+import pytest
+
+from aoc_2023.day15 import day15
+from aoc_2023.differential import (
+    check_part,
+    checkable_days,
+    compare,
+    main,
+    minimise,
+    shrink,
+)
+from aoc_2023.registry import get_day
+
+
+def test_minimise():
+    # Fails whenever both 3 and 7 are kept
+    got = minimise(list(range(10)), lambda keep: {3, 7} <= set(keep))
+    assert [3, 7] == got
+
+
+def test_minimise_keeps_one():
+    assert [4] == minimise(list(range(10)), lambda keep: 4 in keep)
+
+
+def test_checkable_days():
+    assert {5, 11, 15, 21} <= set(checkable_days())
+
+
+@pytest.mark.parametrize(
+    "day, part",
+    [(day, part) for day in checkable_days() for part in get_day(day).references],
+)
+def test_solvers_match_references(day, part):
+    assert check_part(day, part, trials=5) is None
+
+
+def broken_part2(steps: list[str]) -> int:
+    "Gets every input with a removal wrong"
+    return day15.part2_dicts(steps) + any(s.endswith("-") for s in steps)
+
+
+def test_mismatch_is_shrunk(monkeypatch):
+    monkeypatch.setattr(day15, "solve_part2", broken_part2)
+    raw_input = "ab=1,cd=2,ab-,ef=3"
+    assert (821, 820) == compare(day15, "part2", raw_input)
+    assert "ab-" == shrink(day15, "part2", raw_input)
+
+    got = check_part(15, "part2", trials=3)
+    assert got is not None
+    assert 1 == got.raw_input.count(",") + 1
+    assert got.raw_input.endswith("-")
+    assert got.fast == got.reference + 1
+
+
+def test_fast_solver_raising(monkeypatch):
+    def raises(steps):
+        raise KeyError(steps[0])
+
+    monkeypatch.setattr(day15, "solve_part2", raises)
+    fast, reference = compare(day15, "part2", "ab=1")
+    assert "KeyError: 'ab=1'" == fast
+    assert day15.part2(["ab=1"]) == reference
+
+
+def test_main(monkeypatch, tmp_path, capsys):
+    assert 0 == main([11], trials=2)
+    assert "day11.part2: the same on 2 inputs" in capsys.readouterr().out
+
+    monkeypatch.setattr(day15, "solve_part2", broken_part2)
+    assert 1 == main([15], trials=2, output=tmp_path)
+    assert (tmp_path / "day15.part2.txt").read_text().strip().endswith("-")
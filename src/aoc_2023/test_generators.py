@@ -0,0 +1,28 @@
+import pytest
+
+from aoc_2023.generators import discover_generators, load_generator, main
+from aoc_2023.registry import load
+from aoc_2023.runner import run_stages
+
+
+def test_discover_generators():
+    got = discover_generators()
+    assert {3, 5, 11, 24} <= set(got)
+
+
+@pytest.mark.parametrize("day", discover_generators())
+def test_generated_input_solves(day):
+    gen = load_generator(day)
+    raw_input = gen.generate(gen.SIZES[0], seed=1)
+    assert raw_input == gen.generate(gen.SIZES[0], seed=1)
+
+    module = load(day)
+    got = run_stages(day, module, raw_input)
+    assert "parse" in got.timings
+    assert all(isinstance(answer, int) for answer in got.answers.values())
+
+
+def test_main(tmp_path):
+    path = tmp_path / "input.txt"
+    assert 0 == main(6, 3, seed=2, output=path)
+    assert load_generator(6).generate(3, seed=2) + "\n" == path.read_text()
@@ -0,0 +1,86 @@
+import numpy as np
+import pytest
+
+from aoc_2023.graph import Graph
+from aoc_2023.grid import Grid, pad
+
+maze = """\
+..#.
+.##.
+....
+"""
+
+
+@pytest.fixture
+def padded():
+    return pad(Grid.parse(maze).mask("."), False)
+
+
+def test_from_edges():
+    graph = Graph.from_edges(4, [2, 0, 0, 1], [3, 2, 1, 2], weights=[5, 1, 2, 3])
+    assert 4 == graph.n_nodes
+    assert [2, 1] == graph.neighbours(0).tolist()
+    assert [1, 2] == graph.weights_of(0).tolist()
+    assert [] == graph.neighbours(3).tolist()
+    assert np.int32 == graph.targets.dtype
+
+
+def test_from_edges_undirected():
+    graph = Graph.from_edges(3, [0, 1], [1, 2], undirected=True)
+    got = [sorted(graph.neighbours(n).tolist()) for n in range(3)]
+    assert [[1], [0, 2], [1]] == got
+
+
+def test_from_grid(padded):
+    graph = Graph.from_grid(padded)
+    assert padded.flat.size == graph.n_nodes
+    # Right and down from the top left
+    got = graph.neighbours(padded.index(0, 0)).tolist()
+    assert [padded.index(0, 1), padded.index(1, 0)] == got
+    assert [] == graph.neighbours(padded.index(0, 2)).tolist()
+
+
+def test_bfs(padded):
+    graph = Graph.from_grid(padded)
+    dist = graph.bfs(padded.index(0, 0))
+    assert 0 == dist[padded.index(0, 0)]
+    assert 3 == dist[padded.index(2, 1)]
+    assert 7 == dist[padded.index(0, 3)]
+    assert -1 == dist[padded.index(0, 2)]
+
+    near = graph.bfs(padded.index(0, 0), max_depth=3)
+    assert -1 == near[padded.index(0, 3)]
+    assert 3 == near[padded.index(2, 1)]
+
+
+def test_dijkstra():
+    # The direct edge is heavier than going the long way round
+    graph = Graph.from_edges(4, [0, 0, 1, 2], [3, 1, 2, 3], weights=[9, 1, 2, 3])
+    assert [0, 1, 3, 6] == graph.dijkstra(0).tolist()
+    assert [-1, 0, 2, 5] == graph.dijkstra(1).tolist()
+
+
+def test_dijkstra_matches_bfs(padded):
+    graph = Graph.from_grid(padded)
+    start = padded.index(2, 3)
+    assert graph.bfs(start).tolist() == graph.dijkstra(start).tolist()
+
+
+def test_contract(padded):
+    graph = Graph.from_grid(padded)
+    keep = np.zeros(graph.n_nodes, dtype=bool)
+    ends = [padded.index(0, 0), padded.index(0, 3)]
+    keep[ends] = True
+    contracted, kept = graph.contract(keep)
+    assert ends == kept.tolist()
+    assert [[1], [0]] == [contracted.neighbours(n).tolist() for n in range(2)]
+    assert [7] == contracted.weights_of(0).tolist()
+
+
+def test_longest_path():
+    # 0 -> 3 directly, through 1, or through 1 and 2
+    graph = Graph.from_edges(
+        4, [0, 0, 1, 1, 2, 2], [3, 1, 3, 2, 1, 3], weights=[5, 1, 1, 2, 2, 4]
+    )
+    assert 7 == graph.longest_path(0, 3)
+    assert -1 == graph.longest_path(3, 0)
@@ -0,0 +1,67 @@
+import numpy as np
+import pytest
+
+from aoc_2023.grid import Grid, pad
+
+raw_input = """#.S
+..#
+#..
+"""
+
+
+def test_parse():
+    grid = Grid.parse(raw_input)
+    assert (3, 3) == grid.shape
+    assert b"#.S" == grid.cells[0].tobytes()
+    # A view of the input, not a copy
+    assert grid.cells.base is not None
+
+
+def test_parse_bytes():
+    data = memoryview(("\n" + raw_input + "\n").encode())
+    grid = Grid.parse(data)
+    assert (3, 3) == grid.shape
+    assert b"#.S" == grid.cells[0].tobytes()
+    assert not grid.cells.flags.writeable
+    # Without a last newline to keep, the grid is copied, but still read only
+    assert not Grid.parse(b"#.\n.#").cells.flags.writeable
+
+    crlf = Grid.parse(memoryview(raw_input.replace("\n", "\r\n").encode()))
+    assert (grid.cells == crlf.cells).all()
+    assert (grid.cells == Grid.parse(b"#.S\r\n..#\r\n#..").cells).all()
+
+
+def test_parse_ragged():
+    with pytest.raises(ValueError):
+        Grid.parse("...\n..\n")
+
+
+def test_mask_find():
+    grid = Grid.parse(raw_input)
+    assert [[True, False, False], [False, False, True], [True, False, False]] == (
+        grid.mask("#").tolist()
+    )
+    assert 6 == grid.mask(".S").sum()
+    assert (0, 2) == grid.find("S")
+    assert [[0, 0], [1, 2], [2, 0]] == grid.find_all("#").tolist()
+    with pytest.raises(ValueError):
+        grid.find("X")
+
+
+def test_padded():
+    padded = Grid.parse(raw_input).padded("#")
+    assert 5 == padded.width
+    assert 25 == padded.flat.size
+    assert (1, 2) == padded.position(padded.index(1, 2))
+    assert [ord("S")] == padded.flat[[padded.index(0, 2)]].tolist()
+
+    # Up, right, down and left of the middle, then of the top left corner
+    got = padded.flat[padded.neighbours([padded.index(1, 1), padded.index(0, 0)])]
+    assert [b".#..", b"#..#"] == [bytes(row) for row in got.astype(np.uint8)]
+    assert 8 == padded.neighbours([padded.index(1, 1)], diagonals=True).shape[1]
+
+
+def test_pad_mask():
+    padded = pad(Grid.parse(raw_input).mask("."), False)
+    assert 5 == padded.flat[padded.inner()].sum()
+    assert 5 == padded.flat.sum()
@@ -0,0 +1,38 @@
+from aoc_2023.importtime import (
+    format_table,
+    heaviest,
+    measure_imports,
+    parse_importtime,
+    total_us,
+)
+
+stderr = """import time: self [us] | cumulative | imported package
+import time:       100 |        100 |   encodings
+import time:       665 |      14777 | site
+import time:        75 |         75 |     aoc_2023
+import time:        61 |        136 |   aoc_2023.day21
+import time:     20000 |      20000 |   numpy
+import time:       853 |      20988 | aoc_2023.day21.day21"""
+
+
+def test_parse_importtime():
+    got = parse_importtime(stderr)
+    assert ["aoc_2023", "aoc_2023.day21", "numpy", "aoc_2023.day21.day21"] == [
+        i.name for i in got
+    ]
+    assert [2, 1, 1, 0] == [i.depth for i in got]
+    assert 20988 == total_us(got)
+    assert ["numpy"] == [i.name for i in heaviest(got)]
+
+
+def test_format_table():
+    got = format_table({21: parse_importtime(stderr)}, budget_ms=10)
+    assert "numpy 20ms" in got
+    assert got.endswith("OVER BUDGET")
+
+
+def test_measure_imports():
+    got = measure_imports("aoc_2023.day07.day07", repeats=1)
+    assert "aoc_2023.day07.day07" in [i.name for i in got]
+    # Polars only gets imported once a day 7 function needs it
+    assert "polars" not in [i.name for i in got]
@@ -0,0 +1,53 @@
+import numpy as np
+import pytest
+
+from aoc_2023.ints import MAX_DIGITS, ints, ints_per_line
+
+ints_cases = [
+    ("", []),
+    ("no numbers", []),
+    ("seeds: 79 14 55 13", [79, 14, 55, 13]),
+    ("19, 13, 30 @ -2,  1, -2", [19, 13, 30, -2, 1, -2]),
+    # Only a sign when it isn't between two numbers
+    ("3-4 -5 x-6", [3, 4, -5, -6]),
+    ("-", []),
+    ("0 007 12345678 123456789", [0, 7, 12345678, 123456789]),
+    ("9" * MAX_DIGITS, [int("9" * MAX_DIGITS)]),
+    ("-246839126345624 -1", [-246839126345624, -1]),
+]
+
+
+@pytest.mark.parametrize("text, want", ints_cases)
+def test_ints(text, want):
+    got = ints(text)
+    assert np.int64 == got.dtype
+    assert want == got.tolist()
+
+
+def test_ints_too_long():
+    with pytest.raises(ValueError):
+        ints("1" * (MAX_DIGITS + 1))
+
+
+def test_ints_matches_split():
+    rng = np.random.default_rng(1)
+    nums = rng.integers(-(10**15), 10**15, 1000) // 10 ** rng.integers(0, 15, 1000)
+    assert nums.tolist() == ints(" ".join(map(str, nums))).tolist()
+
+
+def test_ints_per_line():
+    got = ints_per_line("1 2\n\nCard -3: 4 5\n6")
+    assert 4 == len(got)
+    assert [[1, 2], [], [-3, 4, 5], [6]] == [row.tolist() for row in got.rows()]
+    assert [-3, 4, 5] == got.row(2).tolist()
+    assert 1 == len(ints_per_line("1 2\n"))
+    assert 0 == len(ints_per_line(""))
+    # Or bytes, e.g. of a memory mapped file
+    got = ints_per_line(memoryview(b"1 2\n\nCard -3: 4 5\n6"))
+    assert [[1, 2], [], [-3, 4, 5], [6]] == [row.tolist() for row in got.rows()]
+
+
+def test_as_2d():
+    assert [[0, 3, 6], [1, 3, 6]] == ints_per_line("0 3 6\n1 3 6\n").as_2d().tolist()
+    with pytest.raises(ValueError):
+        ints_per_line("1 2\n3").as_2d()
@@ -0,0 +1,72 @@
+import numpy as np
+import pytest
+
+from aoc_2023.loader import MappedInput, as_array, decode, strip
+
+raw_input = "1 2\r\n\nthree 4\n5"
+
+
+@pytest.fixture
+def path(tmp_path):
+    path = tmp_path / "input.txt"
+    path.write_bytes(raw_input.encode())
+    return path
+
+
+def test_mapped_input(path):
+    with MappedInput(path) as mapped:
+        assert len(raw_input) == len(mapped)
+        # Line endings made "\n", as `read_text()` would
+        assert raw_input.replace("\r\n", "\n") == mapped.text()
+        assert raw_input.splitlines() == [
+            bytes(line).decode() for line in mapped.lines()
+        ]
+        assert b"three 4" == bytes(mapped.line(2))
+
+        arr = mapped.array()
+        assert np.uint8 == arr.dtype
+        assert not arr.flags.writeable
+        # A view of the mapping, not a copy
+        assert arr.base is not None
+
+
+def test_line_offsets(path, tmp_path):
+    with MappedInput(path) as mapped:
+        assert [0, 5, 6, 14, 16] == mapped.line_offsets.tolist()
+
+    # A last newline doesn't start another line
+    (tmp_path / "newline.txt").write_bytes(b"ab\ncd\n")
+    with MappedInput(tmp_path / "newline.txt") as mapped:
+        assert [b"ab", b"cd"] == [bytes(line) for line in mapped.lines()]
+
+
+def test_empty(tmp_path):
+    (tmp_path / "empty.txt").touch()
+    with MappedInput(tmp_path / "empty.txt") as mapped:
+        assert 0 == len(mapped)
+        assert [] == list(mapped.lines())
+        assert "" == mapped.text()
+
+
+def test_close_with_views(path):
+    mapped = MappedInput(path)
+    arr = mapped.array()
+    # Left mapped, since `arr` still uses it
+    mapped.close()
+    assert ord("1") == arr[0]
+
+
+def test_as_array():
+    assert [104, 105] == as_array("hi").tolist()
+    data = memoryview(b"hi")
+    assert as_array(data).base is not None
+
+
+def test_decode():
+    assert "a\nb\nc\n" == decode(b"a\r\nb\rc\n")
+
+
+def test_strip():
+    assert "a b" == strip(" a b\n\n")
+    assert b"a b" == bytes(strip(memoryview(b"\r\n a b\n")))
+    assert b"" == bytes(strip(memoryview(b" \n")))
@@ -0,0 +1,37 @@
+import tracemalloc
+
+import pytest
+
+from aoc_2023.memory import current_rss, track_memory
+
+
+def test_track_memory():
+    with track_memory() as mem:
+        big = bytearray(2_000_000)
+        del big
+
+    assert mem.peak >= 2_000_000
+    assert not tracemalloc.is_tracing()
+
+
+def test_track_memory_nested():
+    with track_memory() as outer:
+        with track_memory() as inner:
+            small = bytearray(1_000)
+        big = bytearray(1_000_000)
+        del small, big
+        assert tracemalloc.is_tracing()
+
+    assert 1_000 <= inner.peak < 1_000_000
+    assert outer.peak >= 1_000_000
+
+
+def test_current_rss():
+    before = current_rss()
+    if before == 0:
+        pytest.skip("No /proc to read the RSS from")
+
+    # Fill it in, so every page is actually resident
+    big = bytearray(b"x" * 50_000_000)
+    assert current_rss() - before >= 25_000_000
+    del big
@@ -0,0 +1,86 @@
+import asyncio
+import json
+
+from aoc_2023.orchestrate import follow, run_all, run_day
+from aoc_2023.runner import DayResult
+
+
+def follow_lines(lines: list, eof: bool = True, **kwargs) -> DayResult:
+    "What `follow()` makes of a worker writing `lines`, then exiting, or hanging"
+
+    async def go() -> DayResult:
+        stream = asyncio.StreamReader()
+        for line in lines:
+            data = line if isinstance(line, bytes) else json.dumps(line).encode()
+            stream.feed_data(data + b"\n")
+        if eof:
+            stream.feed_eof()
+        result = DayResult(day=6)
+        await follow(stream, result, **kwargs)
+        return result
+
+    return asyncio.run(go())
+
+
+def test_follow_skips_lines_that_arent_events():
+    result = follow_lines(
+        [
+            b"a print from the day",
+            {"event": "start", "stage": "parse"},
+            b"[1, 2]",
+            {"event": "done", "stage": "parse", "ns": 5, "answer": None},
+            # What a killed worker may leave
+            b'{"event": "sta',
+        ],
+        timeout=1,
+        budgets={},
+    )
+    assert {"parse": 5} == result.timings
+    assert result.timed_out is None
+
+
+def test_follow_budget_only_while_the_stage_runs():
+    # Parse finished in time. What's after it isn't charged to its budget
+    lines = [
+        {"event": "start", "stage": "parse"},
+        {"event": "done", "stage": "parse", "ns": 5, "answer": None},
+    ]
+    result = follow_lines(lines, eof=False, timeout=0.05, budgets={"day06.parse": 1e-6})
+    assert result.timed_out is None
+    assert "between stages" in result.error
+
+    result = follow_lines(
+        [*lines, {"event": "start", "stage": "part1"}],
+        eof=False,
+        timeout=30,
+        budgets={"day06.part1": 0.05},
+    )
+    assert "part1" == result.timed_out
+
+
+def test_run_day():
+    result = asyncio.run(run_day(6, timeout=30))
+    assert {"part1": 131376, "part2": 34123437} == result.answers
+    assert ["parse", "part1", "part2"] == list(result.timings)
+    assert result.timed_out is None
+    assert result.error is None
+
+
+def test_run_day_budget():
+    # Part 2 can't finish in a microsecond, but parse and part 1 still get reported
+    result = asyncio.run(run_day(6, timeout=30, budgets={"day06.part2": 1e-6}))
+    assert "part2" == result.timed_out
+    assert {"part1": 131376} == result.answers
+    assert ["parse", "part1"] == list(result.timings)
+
+
+def test_run_day_error(tmp_path):
+    result = asyncio.run(run_day(6, timeout=30, path=tmp_path / "missing.txt"))
+    assert result.error is not None
+    assert not result.answers
+
+
+def test_run_all():
+    results = asyncio.run(run_all([6, 9], timeout=30, jobs=2))
+    assert [6, 9] == [r.day for r in results]
+    assert all(len(r.answers) == 2 for r in results)
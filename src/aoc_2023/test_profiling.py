@@ -0,0 +1,38 @@
+import time
+
+import pytest
+
+from aoc_2023.profiling import StackSampler, profile_day
+
+
+def busy(seconds: float) -> None:
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+
+
+def test_stack_sampler():
+    with StackSampler() as sampler:
+        busy(0.05)
+
+    got = sampler.collapsed()
+    assert "aoc_2023.test_profiling:busy" in got
+    # Stacks start inside the block, not at pytest's frames
+    assert all(
+        line.startswith("aoc_2023.test_profiling:busy") for line in got.split("\n")
+    )
+
+
+def test_profile_day(tmp_path):
+    got = profile_day(11, "part2", tmp_path)
+    assert [p.name for p in got] == [
+        "day11.part2.prof",
+        "day11.part2.txt",
+        "day11.part2.collapsed",
+    ]
+    assert "solve_part2" in (tmp_path / "day11.part2.txt").read_text()
+
+
+def test_profile_day_without_stage(tmp_path):
+    with pytest.raises(ValueError):
+        profile_day(10, "part1", tmp_path)
@@ -0,0 +1,59 @@
+import threading
+
+import pytest
+
+from aoc_2023.progress import Progress, Snapshot, format_snapshot, to_stderr
+
+
+def test_chunks():
+    reports = []
+    with Progress(total=10, report=lambda s, final=False: reports.append(s)) as p:
+        seen = []
+        for chunk in p.chunks(range(10), size=4):
+            # Only counted once the chunk's been iterated
+            assert len(seen) == p.done
+            seen.extend(chunk)
+    assert list(range(10)) == seen
+    assert 10 == p.done
+    assert 10 == reports[-1].done
+
+
+def test_reports_in_the_background():
+    two = threading.Event()
+    reports = []
+
+    def report(snapshot, final=False):
+        reports.append((snapshot.done, final))
+        if len(reports) >= 2:
+            two.set()
+
+    with Progress(interval=0.001, report=report) as p:
+        p.done = 5
+        assert two.wait(5)
+    assert (5, True) == reports[-1]
+    assert not any(final for _, final in reports[:-1])
+
+
+def test_snapshot():
+    s = Snapshot("seeds", done=250, total=1000, elapsed=2.0)
+    assert 125 == s.rate
+    assert 6 == s.eta
+    assert Snapshot("", 0, None, 0.0).eta is None
+    assert "seeds   25.0%  250/1.0k  125/s  0m06s left" == format_snapshot(s)
+
+    big = Snapshot("", 3_600_000, 10_000_000, 1.0)
+    # Padded, so the line doesn't jump about as it's redrawn
+    assert " 36.0%  3.6M/10.0M  3.6M/s  0m01s left" == format_snapshot(big)
+
+
+def test_to_stderr_not_a_terminal(capsys):
+    to_stderr(Snapshot("", 1, 2, 1.0), final=True)
+    assert "" == capsys.readouterr().err
+
+
+@pytest.mark.parametrize("size", [1, 3, 100])
+def test_chunks_sizes(size):
+    with Progress(report=lambda *a, **k: None) as p:
+        got = [x for chunk in p.chunks([1, 2, 3, 4, 5], size=size) for x in chunk]
+    assert [1, 2, 3, 4, 5] == got
+    assert 5 == p.done
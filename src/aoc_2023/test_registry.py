@@ -0,0 +1,47 @@
+import sys
+
+import pytest
+
+from aoc_2023.registry import Day, discover_days, get_day, load
+
+
+def test_discover_days():
+    got = discover_days()
+    assert got[0] == 1
+    assert 14 not in got
+    assert 25 in got
+
+
+def test_get_day():
+    day = get_day(5)
+    assert "aoc_2023.day05.day05" == day.module_name
+    assert day.input_path.is_file()
+    with pytest.raises(KeyError):
+        get_day(14)
+
+
+def test_stages():
+    assert ("parse", "part1", "part2") == get_day(1).stages
+    assert ("parse",) == get_day(10).stages
+    assert "parse_input_part2" in get_day(5).functions
+
+
+def test_references():
+    assert ("part2",) == get_day(5).references
+    assert ("part1", "part2") == get_day(11).references
+    assert () == get_day(1).references
+
+
+def test_stages_without_importing():
+    # Not imported by any other test, since it has no solution
+    day = Day(17)
+    sys.modules.pop(day.module_name, None)
+    assert ("parse",) == day.stages
+    assert day.module_name not in sys.modules
+
+
+def test_load():
+    module = load(6)
+    assert 288 == module.solve_part1(
+        module.parse_input("Time: 7 15 30\nDistance: 9 40 200")
+    )
@@ -0,0 +1,53 @@
+import pytest
+
+from aoc_2023.report import Sweep, fit_exponent, format_table, main, plot, sweep_day
+
+fit_params = [
+    ([10, 100, 1_000], [5, 50, 500], 1.0),
+    ([10, 100, 1_000], [3, 300, 30_000], 2.0),
+    ([10, 100, 1_000], [7, 7, 7], 0.0),
+]
+
+
+@pytest.mark.parametrize("sizes, times, want", fit_params)
+def test_fit_exponent(sizes, times, want):
+    got = fit_exponent(sizes, times)
+    assert want == pytest.approx(got, abs=1e-9)
+
+
+def test_sweep_day():
+    got = sweep_day(6, sizes=[2, 4], repeats=1)
+    assert [2, 4] == got.sizes
+    assert got.input_lengths[0] < got.input_lengths[1]
+    assert {"parse", "part1", "part2"} == set(got.timings)
+    assert all(len(times) == 2 for times in got.timings.values())
+
+
+def test_format_table():
+    sweep = Sweep(
+        day=4,
+        sizes=[10, 100],
+        input_lengths=[10, 100],
+        timings={"part2": [1_000, 100_000]},
+    )
+    got = format_table([sweep])
+    assert "day04.part2" in got
+    assert "2.00  superlinear" in got
+
+
+def test_plot(tmp_path):
+    sweep = Sweep(
+        day=4,
+        sizes=[10, 100],
+        input_lengths=[10, 100],
+        timings={"part2": [1_000, 100_000]},
+    )
+    path = tmp_path / "day04.png"
+    plot(sweep, path)
+    assert path.read_bytes().startswith(b"\x89PNG")
+
+
+def test_main(tmp_path, capsys):
+    assert 0 == main([6], repeats=1, output=tmp_path)
+    assert "day06.part1" in capsys.readouterr().out
+    assert (tmp_path / "day06.png").is_file()
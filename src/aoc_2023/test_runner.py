@@ -0,0 +1,107 @@
+import pytest
+
+from aoc_2023.answers import AnswerStore
+from aoc_2023.registry import input_path
+from aoc_2023.runner import (
+    format_counters_table,
+    format_memory_table,
+    format_table,
+    main,
+    print_day,
+    run_all,
+    run_day,
+)
+
+
+def test_run_day():
+    got = run_day(1)
+    assert got.answers == {"part1": 54940, "part2": 54208}
+    assert set(got.timings) == {"parse", "part1", "part2"}
+
+
+def test_run_day_bytes(tmp_path):
+    # Day 11 reads the mapped input's bytes, day 1 gets them decoded
+    path = tmp_path / "input.txt"
+    path.write_text("#..\n...\n..#\n")
+    got = run_day(11, path)
+    assert {"part1": 6, "part2": 2000002} == got.answers
+    assert 12 == got.input_bytes
+    path.write_text("1abc2\nxtwone3four\n")
+    assert 12 + 24 == run_day(1, path).answers["part2"]
+
+
+def test_run_day_crlf():
+    # Day 5's input has "\r\n" line endings, which text days get as "\n"
+    assert {"part1": 340994526, "part2": 52210644} == run_day(5).answers
+
+
+@pytest.mark.parametrize("day", [9, 11, 24])
+def test_run_day_bytes_crlf(day, tmp_path):
+    # The days reading bytes see the "\r" too
+    path = tmp_path / "input.txt"
+    path.write_bytes(input_path(day).read_bytes().replace(b"\n", b"\r\n"))
+    assert run_day(day).answers == run_day(day, path).answers
+
+
+def test_run_day_memory():
+    got = run_day(23, measure_memory=True)
+    assert set(got.peak_memory) == {"parse", "part1"}
+    assert set(got.rss_delta) == {"parse", "part1"}
+    assert got.peak_memory["part1"] > 1_000_000
+
+    table = format_memory_table([got])
+    assert table.splitlines()[2].startswith("day23.part1")
+
+
+def test_run_day_counters():
+    got = run_day(8, count_work=True)
+    # Part 1 counts each step it takes, so as many as its answer
+    assert got.counters["part1/steps"] == got.answers["part1"]
+    assert got.counters["part2/steps"] > 0
+    assert got.input_bytes > 0
+
+    table = format_counters_table([got])
+    assert table.splitlines()[1].startswith("day08.part1/steps")
+    assert {} == run_day(8).counters
+
+
+def test_run_day_without_parts():
+    got = run_day(10)
+    assert got.answers == {}
+    assert set(got.timings) == {"parse"}
+
+
+def test_run_day_spans():
+    got = run_day(23)
+    assert set(got.timings) == {"parse", "part1"}
+    want = {"part1/build_graph", "part1/longest_path", "part1/longest_path/contract"}
+    assert want <= set(got.spans)
+
+
+def test_print_day(capsys):
+    print_day(23)
+    got = capsys.readouterr().out
+    assert "Part 1: 2214" in got
+    assert "\n  build_graph took " in got
+    assert "\n    contract took " in got
+
+
+def test_run_all():
+    got = run_all([2, 4], jobs=2)
+    assert [r.day for r in got] == [2, 4]
+    assert got[0].answers == {"part1": 2449, "part2": 63981}
+    assert got[1].answers == {"part1": 21088, "part2": 6874754}
+
+    table = format_table(got)
+    assert table.splitlines()[1].startswith("02")
+
+
+def test_main_with_answer_store(tmp_path, capsys):
+    store = AnswerStore(path=tmp_path / "answers.sqlite")
+    assert 0 == main([6], jobs=1, answers=store)
+    assert "(stored answers)" not in capsys.readouterr().out
+
+    assert 0 == main([6], jobs=1, answers=store)
+    got = capsys.readouterr().out
+    assert "(stored answers)" in got
+    assert "131376" in got
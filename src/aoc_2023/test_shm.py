@@ -0,0 +1,63 @@
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pytest
+
+from aoc_2023 import shm
+from aoc_2023.grid import Grid, pad
+
+
+def total(ref: shm.SharedRef) -> tuple[int, str]:
+    "Run in a worker"
+    arrays, label = shm.load(ref)
+    return int(sum(a.sum() for a in arrays)), label
+
+
+def test_round_trip():
+    parsed = {
+        "grid": Grid.parse("#.\n.#\n").mask("#"),
+        "padded": pad(np.arange(6).reshape(2, 3), -1),
+        "start": (0, 1),
+    }
+    with shm.share(parsed) as ref:
+        got = shm.load(ref)
+        assert parsed["grid"].tolist() == got["grid"].tolist()
+        assert parsed["padded"].flat.tolist() == got["padded"].flat.tolist()
+        assert 5 == got["padded"].width
+        assert (0, 1) == got["start"]
+        # Both arrays are in the block, rather than in the pickle
+        assert 2 == len(ref.buffers)
+        assert all(start % shm.ALIGN == 0 for start, _ in ref.buffers)
+        del got
+        shm.detach(ref)
+
+
+def test_load_is_read_only():
+    with shm.share([np.zeros(4)]) as ref:
+        (arr,) = shm.load(ref)
+        with pytest.raises(ValueError, match="read-only"):
+            arr[0] = 1
+        # But everything else is a new copy each time
+        assert shm.load(ref) is not shm.load(ref)
+        del arr
+        shm.detach(ref)
+
+
+def test_detach_with_views_left():
+    with shm.share(np.ones(3)) as ref:
+        kept = shm.load(ref)
+        shm.detach(ref)
+        # Still mapped, since `kept` is a view of it
+        assert 3 == kept.sum()
+
+
+def test_workers():
+    arrays = [np.arange(10), np.full((3, 3), 2)]
+    ctx = multiprocessing.get_context("spawn")
+    with (
+        shm.share((arrays, "label")) as ref,
+        ProcessPoolExecutor(max_workers=2, mp_context=ctx) as pool,
+    ):
+        got = list(pool.map(total, [ref, ref]))
+    assert [(63, "label")] * 2 == got
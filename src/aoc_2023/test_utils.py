@@ -1,6 +1,6 @@
 import pytest
 
-from aoc_2023.utils import format_ns
+from aoc_2023.utils import format_bytes, format_ns, record_spans, span, timed
 
 format_ns_cases = list(
     zip(
@@ -24,3 +24,67 @@ format_ns_cases = list(
 @pytest.mark.parametrize("input,want", format_ns_cases)
 def test_format_ns(input, want):
     assert want == format_ns(input)
+
+
+format_ns_precision_cases = [
+    (0, 2, "0ns"),
+    (1_900_000, 0, "1ms"),
+    (1_900_000, 2, "1.90ms"),
+    (12_345, 1, "12.3μs"),
+    (999.5, 1, "999.5ns"),
+    (0.707, 2, "0.71ns"),
+    (2_500_000_000, 3, "2.500s"),
+]
+
+
+@pytest.mark.parametrize("input,precision,want", format_ns_precision_cases)
+def test_format_ns_precision(input, precision, want):
+    assert want == format_ns(input, precision)
+
+
+format_bytes_cases = [
+    (0, "0B"),
+    (1023, "1023B"),
+    (1024, "1.0KiB"),
+    (1536, "1.5KiB"),
+    (5 * 1024**2, "5.0MiB"),
+    (3 * 1024**3, "3.0GiB"),
+]
+
+
+@pytest.mark.parametrize("input,want", format_bytes_cases)
+def test_format_bytes(input, want):
+    assert want == format_bytes(input)
+
+
+@timed
+def build_graph():
+    with span("add_edges"):
+        pass
+
+
+def test_spans():
+    with record_spans() as spans:
+        with span("part1"):
+            build_graph()
+            build_graph()
+        with span("part2"):
+            pass
+
+    assert [
+        "part1",
+        "part1/build_graph",
+        "part1/build_graph/add_edges",
+        "part2",
+    ] == list(spans.timings)
+    assert spans.timings["part1"] >= spans.timings["part1/build_graph"]
+    assert [] == spans.stack
+
+
+def test_spans_not_recording():
+    # Nothing is recorded outside of `record_spans()`, and nothing breaks either
+    with span("part1"):
+        build_graph()
+    with record_spans() as spans:
+        pass
+    assert {} == spans.timings
@@ -0,0 +1,126 @@
+from types import ModuleType
+
+import pytest
+
+from aoc_2023.conftest import edit
+from aoc_2023.watch import WatchCache, Watcher, code_hash, stage_hashes
+
+SOURCE = """
+import re
+
+NUMBER = re.compile(r"\\d+")
+
+
+def parse_input(raw_input):
+    return [int(n) for n in NUMBER.findall(raw_input)]
+
+
+def total(xs):
+    return sum(xs)
+
+
+def solve_part1(xs):
+    return total(xs)
+
+
+def solve_part2(xs):
+    return max(xs)
+"""
+
+
+def test_code_hash():
+    assert code_hash(SOURCE, ("parse_input",)) is not None
+    assert code_hash(SOURCE, ("solve_part3",)) is None
+    # Comments and formatting aren't code
+    edited = SOURCE.replace("return sum(xs)", "return sum( xs )  # all of them")
+    assert code_hash(SOURCE, ("solve_part1",)) == code_hash(edited, ("solve_part1",))
+
+
+def test_stage_hashes():
+    before = stage_hashes(SOURCE)
+    assert {"parse", "part1", "part2"} == set(before)
+
+    # A helper only part 1 uses
+    after = stage_hashes(SOURCE.replace("sum(xs)", "sum(xs) + 0"))
+    assert [before["parse"], before["part2"]] == [after["parse"], after["part2"]]
+    assert before["part1"] != after["part1"]
+
+    # A constant the parser uses changes every stage, since the parts use the parse
+    after = stage_hashes(SOURCE.replace(r"\d+", r"-?\d+"))
+    assert all(before[stage] != after[stage] for stage in before)
+
+
+def test_watch_cache_key_shared_module(tmp_path):
+    package_dir = tmp_path / "aoc_2023"
+    (package_dir / "day99").mkdir(parents=True)
+    solver = package_dir / "day99" / "day99.py"
+    solver.write_text(
+        "from aoc_2023.helper import split\n\n"
+        "def parse_input(raw_input):\n"
+        "    return split(raw_input)\n"
+    )
+    (package_dir / "helper.py").write_text("from aoc_2023 import other\n")
+    (package_dir / "other.py").write_text("")
+    module = ModuleType("aoc_2023.day99.day99")
+    module.__file__ = str(solver)
+
+    cache = WatchCache(directory=tmp_path / "cache")
+    before = cache.key(module, "parse_input", "1 2 3")
+    # Imported by the helper the parser uses, so it may change the parse
+    (package_dir / "other.py").write_text("X = 1\n")
+    assert before != cache.key(module, "parse_input", "1 2 3")
+
+
+def test_watcher_shared_module_change(day99, tmp_path):
+    watcher = Watcher([99], WatchCache(directory=tmp_path / "cache"))
+    watcher.poll()
+    assert 6 == watcher.watched[99].result.answers["part1"]
+
+    # Used by the day through `shared99`, which is reloaded after it
+    edit(day99 / "scale99.py", "SCALE = 2\n")
+    (report,) = watcher.poll()
+    assert report.startswith("day99: ran part1")
+    assert 12 == watcher.watched[99].result.answers["part1"]
+    assert [] == watcher.poll()
+
+
+@pytest.fixture
+def watcher(tmp_path):
+    return Watcher([6], WatchCache(directory=tmp_path))
+
+
+def test_watcher_first_poll(watcher):
+    (report,) = watcher.poll()
+    assert report.startswith("day06: ran part1, part2")
+    assert "34123437" in report
+    # Nothing changed since
+    assert [] == watcher.poll()
+
+
+def test_watcher_code_change(watcher):
+    watcher.poll()
+    watched = watcher.watched[6]
+    parse_ns = watched.result.timings["parse"]
+    # As if part 2's code had been edited
+    watched.solver_mtime = None
+    watched.hashes["part2"] = "edited"
+
+    (report,) = watcher.poll()
+    assert report.startswith("day06: ran part2\n")
+    assert "(cached)" in report
+    assert "part1" not in report
+    # Both of day 6's parsers were loaded rather than run
+    assert 2 == watcher.cache.misses
+    # Still the time it took to actually parse
+    assert parse_ns == watched.result.timings["parse"]
+
+
+def test_watcher_input_touched(watcher):
+    watcher.poll()
+    # Same content, so nothing to run
+    watcher.watched[6].input_mtime = None
+    assert [] == watcher.poll()
+    watcher.watched[6].input_hash = "edited"
+    watcher.watched[6].input_mtime = None
+    (report,) = watcher.poll()
+    assert report.startswith("day06: ran part1, part2")
@@ -1,4 +1,9 @@
+import functools
 import math
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass, field
+from time import perf_counter_ns
 
 
 def order_of_magnitude(x: int | float) -> int:
@@ -6,17 +11,114 @@ def order_of_magnitude(x: int | float) -> int:
     return int(math.floor(math.log10(abs(x))))
 
 
-def format_ns(nanosecs: int) -> str:
+def format_ns(nanosecs: int | float, precision: int = 0) -> str:
     """
     The idea here is to take in some number of nanoseconds, and automatically format it
     into ns, us, ms, s, etc.
+
+    By default the value is truncated to a whole number of units, so 1.9ms is "1ms".
+    Pass `precision` to keep that many decimal places instead, e.g. "1.90ms".
     """
+    if nanosecs == 0:
+        return "0ns"
+
     match order_of_magnitude(nanosecs):
-        case 0 | 1 | 2:
-            return f"{nanosecs}ns"
+        # Under 1ns, e.g. the standard deviation of two near identical samples
+        case n if n <= 2:
+            unit, scale = "ns", 1
         case 3 | 4 | 5:
-            return f"{int(nanosecs / 1e3)}μs"
+            unit, scale = "μs", 1e3
         case 6 | 7 | 8:
-            return f"{int(nanosecs / 1e6)}ms"
+            unit, scale = "ms", 1e6
         case _:
-            return f"{int(nanosecs / 1e9)}s"
+            unit, scale = "s", 1e9
+
+    if precision == 0:
+        return f"{int(nanosecs / scale)}{unit}"
+    return f"{nanosecs / scale:.{precision}f}{unit}"
+
+
+def format_bytes(n_bytes: int) -> str:
+    "Like `format_ns()`, but for B, KiB, MiB and GiB"
+    value = float(n_bytes)
+    for unit in ("B", "KiB", "MiB"):
+        if abs(value) < 1024:
+            return f"{value:.0f}{unit}" if unit == "B" else f"{value:.1f}{unit}"
+        value /= 1024
+    return f"{value:.1f}GiB"
+
+
+@dataclass
+class Spans:
+    """
+    Time spent in each named span, in nanoseconds. Nested spans are keyed by their path,
+    e.g. "part1/build_graph", and a span entered more than once adds up its times.
+    """
+
+    timings: dict[str, int] = field(default_factory=dict)
+    stack: list[str] = field(default_factory=list)
+
+
+# The recorder `span()` writes into, if any. While it is None, spans do nothing
+_active: Spans | None = None
+_NOT_RECORDING = nullcontext()
+
+
+class _Span:
+    __slots__ = ("name", "path", "spans", "start")
+
+    def __init__(self, spans: Spans, name: str):
+        self.spans = spans
+        self.name = name
+
+    def __enter__(self) -> None:
+        self.spans.stack.append(self.name)
+        self.path = "/".join(self.spans.stack)
+        # Add the key now, so the timings are in the order the spans were entered
+        self.spans.timings.setdefault(self.path, 0)
+        self.start = perf_counter_ns()
+
+    def __exit__(self, *exc) -> None:
+        elapsed = perf_counter_ns() - self.start
+        self.spans.stack.pop()
+        self.spans.timings[self.path] += elapsed
+
+
+def span(name: str):
+    """
+    Time a block of code, e.g.
+
+    ```
+    with span("build_graph"):
+        g = build_graph(nodes)
+    ```
+
+    Only does anything inside `record_spans()`, so solvers can leave their spans in.
+    """
+    if _active is None:
+        return _NOT_RECORDING
+    return _Span(_active, name)
+
+
+def timed(fn: Callable) -> Callable:
+    "Like `span()`, for a whole function, named after the function"
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        if _active is None:
+            return fn(*args, **kwargs)
+        with _Span(_active, fn.__name__):
+            return fn(*args, **kwargs)
+
+    return wrapper
+
+
+@contextmanager
+def record_spans() -> Iterator[Spans]:
+    "Record every `span()` and `timed` function entered inside this block"
+    global _active
+    previous, _active = _active, Spans()
+    try:
+        yield _active
+    finally:
+        _active = previous
@@ -0,0 +1,303 @@
+"""
+Re-run days as their code or input is edited, e.g. while making one faster.
+
+Every `interval` seconds, the `dayNN.py` and `input.txt` of each day watched, and the
+`aoc_2023` modules it imports, are checked for changes, from one long running
+interpreter, so numpy, polars, etc. are only imported once. Only the days that changed
+are run again, and only their stages whose code changed: each stage's code is what its
+solver uses from the module, found by reading its source, so editing part 2 leaves the
+parse and part 1 be, and editing a comment runs nothing. Editing a shared module like
+`grid.py` runs every stage of the days using it. A changed module is reloaded, along
+with the modules that import it, and no other.
+
+The parse is kept on disk, keyed by its own code rather than the whole module's, so
+re-running a part loads its input rather than parsing it again. Each stage's new time
+is shown next to its time the run before.
+"""
+
+import ast
+import hashlib
+import importlib
+import sys
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import ModuleType
+
+from aoc_2023.cache import (
+    ParseCache,
+    default_cache_dir,
+    imported_files,
+    imports_hash,
+    reload_imports,
+)
+from aoc_2023.registry import PARTS, discover_days, input_path, module_name, solver_path
+from aoc_2023.runner import DayResult, run_stages
+from aoc_2023.utils import format_ns
+
+# The functions of a day's module that run each stage
+STAGE_FUNCTIONS = {
+    "parse": ("parse_input",),
+    "part1": ("solve_part1",),
+    "part2": ("solve_part2", "parse_input_part2"),
+}
+
+
+def _definitions(tree: ast.Module) -> dict[str, list[ast.stmt]]:
+    "The statements binding each name at the top level of a module"
+    defs: dict[str, list[ast.stmt]] = {}
+    for node in tree.body:
+        match node:
+            case ast.FunctionDef() | ast.AsyncFunctionDef() | ast.ClassDef():
+                names = [node.name]
+            case ast.Import() | ast.ImportFrom():
+                names = [(a.asname or a.name).partition(".")[0] for a in node.names]
+            case ast.Assign():
+                names = [
+                    n.id
+                    for target in node.targets
+                    for n in ast.walk(target)
+                    if isinstance(n, ast.Name)
+                ]
+            case (
+                ast.AnnAssign(target=ast.Name(id=name))
+                | ast.AugAssign(target=ast.Name(id=name))
+            ):
+                names = [name]
+            case _:
+                continue
+        for name in names:
+            defs.setdefault(name, []).append(node)
+    return defs
+
+
+def code_hash(source: str, functions: tuple[str, ...]) -> str | None:
+    """
+    A hash of the `functions` in a module's `source`, and everything at its top level
+    they use, however indirectly. Comments and formatting don't change it. None if
+    the module defines none of them.
+    """
+    defs = _definitions(ast.parse(source))
+    todo = [name for name in functions if name in defs]
+    if not todo:
+        return None
+
+    used = set(todo)
+    while todo:
+        for node in defs[todo.pop()]:
+            for n in ast.walk(node):
+                if isinstance(n, ast.Name) and n.id in defs and n.id not in used:
+                    used.add(n.id)
+                    todo.append(n.id)
+
+    h = hashlib.sha256()
+    # A statement binding more than one name is only hashed once
+    nodes = {id(node): node for name in sorted(used) for node in defs[name]}
+    for node in nodes.values():
+        h.update(ast.dump(node).encode())
+    return h.hexdigest()
+
+
+def stage_hashes(source: str) -> dict[str, str]:
+    "The `code_hash()` of each stage the module has. A part's includes its parse's"
+    hashes: dict[str, str] = {}
+    for stage, functions in STAGE_FUNCTIONS.items():
+        code = code_hash(source, functions)
+        if code is None:
+            continue
+        if stage != "parse":
+            code += hashes.get("parse", "")
+        hashes[stage] = hashlib.sha256(code.encode()).hexdigest()
+    return hashes
+
+
+@dataclass
+class WatchCache(ParseCache):
+    """
+    A `ParseCache` keyed by the code of the parser alone, rather than the whole module,
+    so that editing a solver doesn't throw away the parse. Along with the `aoc_2023`
+    modules the day imports, since the parser may well use them.
+    """
+
+    directory: Path = field(default_factory=lambda: default_cache_dir() / "watch")
+
+    def key(self, module: ModuleType, parser: str, raw_input: str) -> str:
+        path = Path(module.__file__ or "")
+        source = path.read_text()
+        h = hashlib.sha256()
+        code = code_hash(source, (parser,)) or ""
+        for part in (code, imports_hash(path), parser, raw_input):
+            h.update(part.encode())
+            h.update(b"\0")
+        day = module.__name__.rpartition(".")[2]
+        return f"{day}.{parser}.{h.hexdigest()[:24]}"
+
+
+@dataclass
+class Watched:
+    "What a day's files were the last time it was run"
+
+    day: int
+    solver_mtime: int | None = None
+    input_mtime: int | None = None
+    input_hash: str = ""
+    hashes: dict[str, str] = field(default_factory=dict)
+    # Of the `aoc_2023` modules the day imports
+    import_mtimes: dict[Path, int | None] = field(default_factory=dict)
+    # Each stage's latest answer and time, whichever run it was in
+    result: DayResult | None = None
+
+
+def _mtime(path: Path) -> int | None:
+    try:
+        return path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+
+class Watcher:
+    def __init__(self, days: list[int], cache: ParseCache | None = None):
+        self.watched = {day: Watched(day) for day in days}
+        self.cache = cache if cache is not None else WatchCache()
+
+    def poll(self) -> list[str]:
+        "Re-run each day whose files changed since the last poll, and report on them"
+        reports = []
+        for w in self.watched.values():
+            solver_mtime = _mtime(solver_path(w.day))
+            input_mtime = _mtime(input_path(w.day))
+            import_mtimes = _import_mtimes(w)
+            mtimes = (solver_mtime, input_mtime, import_mtimes)
+            if mtimes == (w.solver_mtime, w.input_mtime, w.import_mtimes):
+                continue
+
+            edited = _edited(w.import_mtimes, import_mtimes)
+            reload = w.solver_mtime != solver_mtime or bool(edited)
+            w.solver_mtime, w.input_mtime = solver_mtime, input_mtime
+            w.import_mtimes = import_mtimes
+            try:
+                report = self.rerun(w, reload, edited)
+            except Exception as e:
+                # Most likely a typo mid-edit, which the next save will fix
+                report = f"day{w.day:02}: {type(e).__name__}: {e}"
+            if report is not None:
+                reports.append(report)
+        return reports
+
+    def rerun(
+        self, w: Watched, reload: bool, edited: set[Path] | None = None
+    ) -> str | None:
+        """
+        Run the stages that changed since `w` was last run. None if nothing that the
+        stages use did. Until a run succeeds, the next one is compared with the last
+        one that did. Every stage changed if any of the `edited` modules the day
+        imports did, and they're reloaded before the day is.
+        """
+        raw_input = input_path(w.day).read_text()
+        input_hash = hashlib.sha256(raw_input.encode()).hexdigest()
+        hashes = stage_hashes(solver_path(w.day).read_text())
+        if input_hash != w.input_hash or w.result is None or edited:
+            changed = tuple(hashes)
+        else:
+            changed = tuple(s for s in hashes if hashes[s] != w.hashes.get(s))
+
+        if edited:
+            reload_imports(solver_path(w.day), edited)
+        module = _module(w.day, reload)
+        if not changed:
+            return None
+
+        hits = self.cache.hits
+        parse_hits = []
+
+        def on_stage(stage: str, _: DayResult) -> None:
+            if stage == "parse":
+                parse_hits.append(self.cache.hits - hits)
+
+        parts = tuple(p for p in PARTS if p in changed)
+        result = run_stages(
+            w.day, module, raw_input, parts=parts, cache=self.cache, on_stage=on_stage
+        )
+        # Then what was timed is loading the parse, rather than parsing
+        parse_cached = parse_hits[0] > 0
+        if parse_cached:
+            del result.timings["parse"]
+
+        previous = w.result
+        w.input_hash, w.hashes = input_hash, hashes
+        w.result = DayResult(
+            day=w.day,
+            answers=(previous.answers if previous else {}) | result.answers,
+            timings=(previous.timings if previous else {}) | result.timings,
+        )
+        return format_rerun(previous, result, parts, parse_cached)
+
+
+def _import_mtimes(w: Watched) -> dict[Path, int | None]:
+    "Of the modules `w`'s day imports, or as they were if it can't be read mid-edit"
+    try:
+        return {path: _mtime(path) for path in imported_files(solver_path(w.day))}
+    except (SyntaxError, FileNotFoundError):
+        return w.import_mtimes
+
+
+def _edited(before: dict[Path, int | None], after: dict[Path, int | None]) -> set[Path]:
+    "The modules whose mtimes changed. None the first time, with nothing to compare"
+    if not before:
+        return set()
+    return {path for path, mtime in after.items() if before.get(path) != mtime}
+
+
+def _module(day: int, reload: bool) -> ModuleType:
+    "The day's module, imported if it isn't yet, and reloaded if asked"
+    module = sys.modules.get(module_name(day))
+    if module is None:
+        return importlib.import_module(module_name(day))
+    return importlib.reload(module) if reload else module
+
+
+def _change(ns: int, before: int | None) -> str:
+    if not before:
+        return ""
+    return f"{100 * (ns - before) / before:+.1f}%"
+
+
+def format_rerun(
+    previous: DayResult | None,
+    result: DayResult,
+    parts: tuple[str, ...],
+    parse_cached: bool,
+) -> str:
+    "Each stage run, with how its time and answer compare to the run before"
+    before = previous.timings if previous else {}
+    answers_before = previous.answers if previous else {}
+    lines = [f"day{result.day:02}: ran {', '.join(parts) or 'parse'}"]
+    lines.append(f"  {'Stage':<8}{'Time':>10}{'Before':>10}{'Change':>10}  Answer")
+    if parse_cached:
+        lines.append(f"  {'parse':<8}{'(cached)':>10}")
+
+    for stage, ns in result.timings.items():
+        answer = result.answers.get(stage, "")
+        if stage in answers_before and answers_before[stage] != answer:
+            answer = f"{answer} (was {answers_before[stage]})"
+        was = format_ns(before[stage]) if stage in before else "-"
+        lines.append(
+            f"  {stage:<8}{format_ns(ns):>10}{was:>10}"
+            f"{_change(ns, before.get(stage)):>10}  {answer}".rstrip()
+        )
+    return "\n".join(lines)
+
+
+def main(
+    days: list[int], interval: float = 0.5, cache: ParseCache | None = None
+) -> int:
+    days = sorted(set(days)) or discover_days()
+    watcher = Watcher(days, cache)
+    print(f"Watching {len(days)} days. Ctrl-C to stop")
+    try:
+        while True:
+            for report in watcher.poll():
+                print(report, end="\n\n", flush=True)
+            time.sleep(interval)
+    except KeyboardInterrupt:
+        return 0
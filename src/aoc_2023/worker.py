@@ -0,0 +1,53 @@
+"""
+Solves one day, writing a JSON line to stdout as each stage starts and finishes, so
+that whoever started it knows how far it got, even if it has to be killed. Anything
+the day itself prints goes to stderr instead, so it can't get mixed up with them.
+
+    python -m aoc_2023.worker DAY [INPUT_PATH]
+"""
+
+import json
+import sys
+from contextlib import contextmanager, redirect_stdout
+from pathlib import Path
+
+from aoc_2023.registry import input_path, load
+from aoc_2023.runner import DayResult, run_stages
+
+# Where the events go, whatever `sys.stdout` is pointed at meanwhile
+_events = sys.stdout
+
+
+def emit(**event) -> None:
+    _events.write(json.dumps(event) + "\n")
+    _events.flush()
+
+
+@contextmanager
+def announce(stage: str):
+    emit(event="start", stage=stage)
+    yield
+
+
+def finished(stage: str, result: DayResult) -> None:
+    emit(
+        event="done",
+        stage=stage,
+        ns=result.timings[stage],
+        answer=result.answers.get(stage),
+    )
+
+
+def main(argv: list[str]) -> int:
+    day = int(argv[0])
+    path = Path(argv[1]) if len(argv) > 1 else input_path(day)
+    with redirect_stdout(sys.stderr):
+        module = load(day)
+        raw_input = path.read_text()
+        result = run_stages(day, module, raw_input, around=announce, on_stage=finished)
+    emit(event="spans", spans=result.spans)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))